@@ -0,0 +1,163 @@
+"""Run the benchmark scenarios headlessly and compare them against a saved baseline
+
+Run from src/:
+    python -m bench.runner --out bench.json
+    python -m bench.runner --out bench.json --baseline baseline.json --threshold 0.15
+    python -m bench.runner --only frame_ --only weather_
+
+The exit status is 1 when any scenario's --metric is slower than the baseline by more
+than --threshold, so the suite can gate a CI job.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+import numpy
+
+# No window or audio device unless the caller asked for one
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from bench.scenarios import get_scenarios
+
+BENCH_WARMUP = 2  # Untimed calls before measuring, so caches fill the way they would in play
+BENCH_ALLOCATION_CALLS = 5  # Calls traced for allocations, kept apart from the timed calls
+
+def measure(setup, iterations, seed):
+    """Time one scenario and count its allocations, returning its result record
+
+    Times are per call in milliseconds. Allocations are traced on separate calls after
+    timing, since tracing slows everything it watches, and averaged per call:
+    allocations is the net count of new memory blocks (tracemalloc snapshot diff),
+    alloc_kb the peak memory a call holds on top of what was live when it started,
+    and retained_kb what it leaves allocated.
+    """
+    random.seed(seed)
+    numpy.random.seed(seed)
+    run = setup()
+    for _ in range(min(BENCH_WARMUP, iterations)):
+        run()
+
+    gc.collect()
+    if hasattr(run, "reset_stats"):
+        run.reset_stats()  # Start the scenario's own figures with the timed calls
+    times = numpy.zeros(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        run()
+        times[i] = time.perf_counter() - start
+    times *= 1000
+    extra = run.get_stats() if hasattr(run, "get_stats") else {}
+
+    allocations, peak_kb, retained_kb = trace_allocations(run, min(BENCH_ALLOCATION_CALLS, iterations))
+    return {
+        "iterations": iterations,
+        "mean_ms": float(times.mean()),
+        "p50_ms": float(numpy.percentile(times, 50)),
+        "p95_ms": float(numpy.percentile(times, 95)),
+        "p99_ms": float(numpy.percentile(times, 99)),
+        "max_ms": float(times.max()),
+        "allocations": allocations,
+        "alloc_kb": peak_kb,
+        "retained_kb": retained_kb,
+        **extra
+    }
+
+def trace_allocations(run, calls):
+    """Trace calls to run, returning per-call (new blocks, peak KB, retained KB)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    peaks = []
+    for _ in range(calls):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # The snapshots' own bookkeeping isn't part of the scenario
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'filename')
+    blocks = sum(stat.count_diff for stat in diff)
+    retained = sum(stat.size_diff for stat in diff)
+    return blocks / calls, sum(peaks) / calls / 1024, retained / calls / 1024
+
+def get_environment():
+    """Describe the machine and libraries, so results from different setups aren't mixed up"""
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+def compare(results, baseline, metric, threshold):
+    """Print each scenario against the baseline and get the names that regressed"""
+    regressions = []
+    print(f"\n{'scenario':28} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in results["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:28} {'-':>10} {result[metric]:10.3f}      new")
+            continue
+        change = result[metric] / before[metric] - 1 if before[metric] else 0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:28} {before[metric]:10.3f} {result[metric]:10.3f} {change:+8.1%}{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the seeded benchmark scenarios")
+    parser.add_argument("--out", default="bench.json", help="where to write the results")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%")
+    parser.add_argument("--metric", default="p50_ms", choices=("mean_ms", "p50_ms", "p95_ms", "p99_ms"))
+    parser.add_argument("--only", action="append", help="run scenarios whose names start with this")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every scenario's iterations")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # Some setup code converts surfaces, which needs a display
+
+    results = {"environment": get_environment(), "seed": args.seed, "scenarios": {}}
+    for name, (setup, iterations) in get_scenarios().items():
+        if args.only and not any(name.startswith(prefix) for prefix in args.only):
+            continue
+        result = measure(setup, max(1, int(iterations * args.scale)), args.seed)
+        results["scenarios"][name] = result
+        print(f"{name:28} mean {result['mean_ms']:8.3f}  p50 {result['p50_ms']:8.3f}  "
+              f"p95 {result['p95_ms']:8.3f}  p99 {result['p99_ms']:8.3f} ms  "
+              f"allocations {result['allocations']:9.1f}  peak {result['alloc_kb']:9.1f} KB  "
+              f"retained {result['retained_kb']:8.1f} KB", flush=True)
+        if "jitter_ms" in result:
+            print(f"{'':28} jitter {result['jitter_ms']:.3f} ms at {result['fps']:.1f} fps")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Saved results to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.metric, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} scenario(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,165 @@
+"""Benchmark scenarios: each setup function builds its world untimed and returns the operation to time
+
+The runner seeds random and numpy before every setup, so each scenario sees the same
+world on every run. An operation may carry a get_stats function whose extra figures are
+added to its results, and a reset_stats function called just before timing starts.
+"""
+import time
+import functools
+import pygame
+from game.settings import *
+from game.game_state import GameState
+from game.scheduler import TickScheduler
+from game.frame_pacer import FramePacer
+from game.settings_manager import SettingsManager
+from game.sound_manager import SoundManager
+from graphics.terrain_generator import TerrainGenerator
+from graphics.particles import BonfireParticleSystem
+from ui.main_menu import MainMenu
+
+BENCH_TERRAIN_SIZES = ((10, 6), (20, 12), (40, 22))  # Chunk sizes in tiles; 40x22 fills the screen
+BENCH_ENEMY_COUNTS = (15, 100, 1000)
+BENCH_BONFIRES = 4  # Particle systems running at once
+BENCH_PARTICLE_WARMUP = 300  # Ticks for spawning and dying particles to level off
+BENCH_PACER_RATES = (60, 144)  # Frame caps the pacer is held to
+BENCH_HEALTH = 10 ** 9  # Health that outlasts any run, so the entity count holds steady
+
+def _screen():
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def _frame_world(enemy_count):
+    """Build a game with enemy_count enemies that neither side can kill and no round end"""
+    game_state = GameState()
+    game_state.round_timer.cancel()  # Stay in the round however long the benchmark runs
+    game_state.terrain_gen.current_weather = 'clear'  # Weather has its own scenarios
+    game_state.terrain_gen._init_weather_effects()
+    game_state.player.max_health = game_state.player.health = BENCH_HEALTH
+
+    manager = game_state.enemy_manager
+    while manager.count < min(enemy_count, MAX_ENEMIES):
+        game_state.spawn_enemy()
+    while manager.count < enemy_count:  # Past MAX_ENEMIES, repeat the spawned types without the cap
+        enemy = manager.acquire()
+        enemy.set_monster_type(manager.enemies[manager.count % MAX_ENEMIES].monster_type)
+        manager.add(enemy)
+    for enemy in manager.enemies[:manager.count]:
+        enemy.health = enemy.max_health = BENCH_HEALTH
+    return game_state
+
+def frame(enemy_count):
+    game_state = _frame_world(enemy_count)
+    screen = _screen()
+
+    def run():
+        game_state.update()
+        game_state.draw(screen)
+    return run
+
+def terrain(width, height):
+    def run():
+        TerrainGenerator(tile_size=32).generate_chunk(width=width, height=height, seed=1)
+    return run
+
+def weather(weather_type):
+    terrain_gen = TerrainGenerator(tile_size=32)
+    terrain_gen.set_clock(TickScheduler())
+    terrain_gen.weather_timer.cancel()  # Hold this weather for the whole run
+    terrain_gen.current_weather = weather_type
+    terrain_gen._init_weather_effects()
+    screen = _screen()
+
+    def run():
+        terrain_gen.update_weather()
+        terrain_gen.draw_weather(screen)
+    return run
+
+def bonfire_particles():
+    systems = [BonfireParticleSystem(200 + i * 250, 360) for i in range(BENCH_BONFIRES)]
+    for _ in range(BENCH_PARTICLE_WARMUP):
+        for system in systems:
+            system.update()
+    screen = _screen()
+
+    def run():
+        for system in systems:
+            system.update()
+            system.draw(screen)
+    return run
+
+def shop():
+    game_state = GameState()
+    game_state.enter_shop_phase()  # The clock isn't advanced, so the shop stays open
+    screen = _screen()
+
+    def run():
+        game_state.shop.update()
+        game_state.draw(screen)
+    return run
+
+def menu():
+    settings_manager = SettingsManager()
+    main_menu = MainMenu(settings_manager, SoundManager(settings_manager))
+    screen = _screen()
+
+    def run():
+        main_menu.update()
+        main_menu.draw(screen)
+    return run
+
+def new_game():
+    def run():
+        GameState()
+    return run
+
+def restart():
+    game_state = GameState()
+
+    def run():
+        game_state.new_game()
+    return run
+
+def sound_synthesis():
+    def run():
+        SoundManager.synthesize_samples()
+    return run
+
+def frame_pacer(target_fps):
+    """Hold an idle loop to target_fps; the call times are the frame times the pacer produced"""
+    pacer = FramePacer(target_fps)
+
+    def run():
+        pacer.wait()
+
+    def get_stats():
+        # Recorded by the pacer itself, over its last FRAME_PACER_HISTORY frames
+        stats = pacer.get_stats()
+        return {"jitter_ms": stats["jitter_ms"], "fps": stats["fps"]}
+    def reset_stats():
+        # Drop warmup frames and restart the schedule, so the gap before timing isn't a frame
+        pacer.frame_times.clear()
+        pacer.next_frame = pacer.last_frame = time.perf_counter()
+    run.get_stats = get_stats
+    run.reset_stats = reset_stats
+    return run
+
+def _weather_types():
+    return list(TerrainGenerator(tile_size=32).weather_types)
+
+def get_scenarios():
+    """Get every scenario as {name: (setup, iterations)}, in run order"""
+    scenarios = {}
+    for width, height in BENCH_TERRAIN_SIZES:
+        scenarios[f"terrain_{width}x{height}"] = (functools.partial(terrain, width, height), 3 if width >= 40 else 10)
+    for count in BENCH_ENEMY_COUNTS:
+        scenarios[f"frame_{count}_enemies"] = (functools.partial(frame, count), 300 if count < 1000 else 100)
+    for weather_type in _weather_types():
+        scenarios[f"weather_{weather_type}"] = (functools.partial(weather, weather_type), 300)
+    scenarios["bonfire_particles"] = (bonfire_particles, 200)
+    scenarios["shop_draw"] = (shop, 300)
+    scenarios["menu_draw"] = (menu, 300)
+    scenarios["new_game"] = (new_game, 3)
+    scenarios["restart"] = (restart, 20)
+    scenarios["sound_synthesis"] = (sound_synthesis, 10)
+    for rate in BENCH_PACER_RATES:
+        scenarios[f"frame_pacer_{rate}fps"] = (functools.partial(frame_pacer, rate), rate * 2)
+    return scenarios
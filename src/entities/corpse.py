@@ -0,0 +1,174 @@
+import pygame
+import random
+import math
+from game.settings import *
+from game.monster_config import get_death_config, DifficultyTier
+
+class Corpse:
+    """Death animation, particles and fading body left behind by a killed enemy
+
+    Holds only what the death timeline needs, so the enemy itself can go straight back
+    to the pool and be respawned while its corpse is still fading.
+    """
+    __slots__ = ('rect', 'sprite', 'death_frames', 'tier', 'death_tick', 'timer', 'particles')
+
+    def __init__(self, enemy, tick):
+        self.rect = enemy.rect.copy()
+        self.sprite = enemy.sprite.copy() if enemy.sprite else None  # Own copy, so fading doesn't touch the shared sprite
+        self.death_frames = enemy.death_frames
+        self.tier = enemy.tier
+        self.death_tick = tick
+        self.timer = 0  # Ticks since death
+        self.particles = self._create_particles(enemy.monster_type)
+
+    def _create_particles(self, monster_type):
+        """Create death effect particles based on monster type"""
+        particles = []
+        if not monster_type:
+            return particles
+
+        particle_config = get_death_config(monster_type)["particle_config"]
+
+        for _ in range(particle_config["count"]):
+            angle = random.uniform(0, 360)
+            speed = random.uniform(*particle_config["speed"])
+            size = random.uniform(*particle_config["size"])
+            lifetime = random.randint(*particle_config["lifetime"])
+
+            particle = {
+                'x': self.rect.centerx,
+                'y': self.rect.centery,
+                'dx': math.cos(math.radians(angle)) * speed,
+                'dy': math.sin(math.radians(angle)) * speed,
+                'size': size,
+                'alpha': 255,
+                'lifetime': lifetime
+            }
+
+            # Add type-specific particle properties
+            if particle_config["type"] == "bone":
+                particle.update({
+                    'rotation': random.uniform(0, 360),
+                    'rot_speed': random.uniform(-10, 10)
+                })
+                particle['dy'] -= 2  # Initial upward velocity
+            elif particle_config["type"] == "web":
+                particle['web'] = True
+            elif particle_config["type"] == "fire":
+                particle['color'] = random.choice(particle_config["colors"])
+            elif particle_config["type"] == "ethereal":
+                particle['pulse'] = random.uniform(0, math.pi)
+                particle['alpha'] = 200
+
+            particles.append(particle)
+        return particles
+
+    def update(self, tick):
+        """Advance the death timeline to the given clock tick"""
+        self.timer = tick - self.death_tick
+        if not self.particles:
+            return
+
+        # Particle rates are per BASE_TICK_RATE tick
+        for particle in self.particles:
+            particle['x'] += particle['dx'] * TICK_SCALE
+            particle['y'] += particle['dy'] * TICK_SCALE
+            particle['lifetime'] -= TICK_SCALE
+
+            if 'rot_speed' in particle:  # For skeleton bones
+                particle['rotation'] += particle['rot_speed'] * TICK_SCALE
+                particle['dy'] += 0.2 * TICK_SCALE  # Gravity
+
+            if 'web' in particle:  # For spider webs
+                particle['alpha'] = max(0, particle['alpha'] - 3 * TICK_SCALE)
+
+            if 'pulse' in particle:  # For ghost particles
+                particle['alpha'] = 150 + int(50 * math.sin(particle['pulse']))
+                particle['pulse'] += 0.1 * TICK_SCALE
+        self.particles = [particle for particle in self.particles if particle['lifetime'] > 0]
+
+    def is_finished(self):
+        return self.timer >= CORPSE_FADE_START + CORPSE_FADE_TICKS
+
+    def get_alpha(self):
+        """Get the body's opacity, fading out once the fade starts"""
+        if self.timer <= CORPSE_FADE_START:
+            return 255
+        return max(0, int(255 * (1 - (self.timer - CORPSE_FADE_START) / CORPSE_FADE_TICKS)))
+
+    def draw(self, screen):
+        alpha = self.get_alpha()
+
+        # Draw death animation frame until the animation has played through
+        frame_index = self.timer // CORPSE_FRAME_TICKS
+        if self.death_frames and frame_index < len(self.death_frames):
+            current_frame = self.death_frames[frame_index]
+            if current_frame:  # Make sure we have a valid frame
+                if alpha < 255:
+                    current_frame = current_frame.copy()  # Death frames are shared, so fade a copy
+                    current_frame.set_alpha(alpha)
+                screen.blit(current_frame, self.rect)
+
+        # Draw death particles
+        for particle in self.particles:
+            if 'web' in particle:  # Spider web particles
+                points = []
+                for i in range(3):
+                    angle = math.radians(i * 120 + particle['lifetime'] * 2)
+                    px = particle['x'] + math.cos(angle) * particle['size']
+                    py = particle['y'] + math.sin(angle) * particle['size']
+                    points.append((px, py))
+                pygame.draw.lines(screen, (200, 200, 200, int(particle['alpha'])), True, points, 1)
+
+            elif 'rotation' in particle:  # Skeleton bone particles
+                bone_surf = pygame.Surface((particle['size'] * 2, particle['size']), pygame.SRCALPHA)
+                pygame.draw.ellipse(bone_surf, (200, 190, 180, particle['alpha']),
+                                 bone_surf.get_rect())
+                rotated = pygame.transform.rotate(bone_surf, particle['rotation'])
+                screen.blit(rotated, (particle['x'] - rotated.get_width()//2,
+                                    particle['y'] - rotated.get_height()//2))
+
+            elif 'color' in particle:  # Demon fire particles
+                particle_surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2),
+                                            pygame.SRCALPHA)
+                color_with_alpha = (*particle['color'], particle['alpha'])
+                pygame.draw.circle(particle_surf, color_with_alpha,
+                                (particle['size'], particle['size']), particle['size'])
+                screen.blit(particle_surf, (particle['x'] - particle['size'],
+                                         particle['y'] - particle['size']))
+
+            else:  # Default circular particles for slime and ghost
+                particle_surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2),
+                                            pygame.SRCALPHA)
+                if 'pulse' in particle:  # Ghost particles
+                    color = (200, 200, 255, particle['alpha'])
+                else:  # Slime particles
+                    color = (100, 200, 100, particle['alpha'])
+                pygame.draw.circle(particle_surf, color,
+                                (particle['size'], particle['size']), particle['size'])
+                screen.blit(particle_surf, (particle['x'] - particle['size'],
+                                         particle['y'] - particle['size']))
+
+        # Draw fading corpse
+        if self.sprite and alpha > 0:
+            self.sprite.set_alpha(alpha)
+            if self.tier == DifficultyTier.BASIC:  # Slime flattens
+                scale_y = max(0.2, 1 - (self.timer / (FPS / 3)))
+                scaled = pygame.transform.scale(self.sprite,
+                                             (self.sprite.get_width(),
+                                              int(self.sprite.get_height() * scale_y)))
+                screen.blit(scaled, (self.rect.x,
+                                   self.rect.y + self.rect.height * (1 - scale_y)))
+            elif self.tier == DifficultyTier.BOSS:  # Ghost dissipates
+                wave = math.sin(self.timer * 6 / FPS) * 5
+                screen.blit(self.sprite, (self.rect.x + wave, self.rect.y))
+            else:  # Other enemies
+                screen.blit(self.sprite, self.rect)
+
+    def get_dirty_rect(self):
+        """Get the screen region touched by the body and its particles"""
+        bounds = self.rect.inflate(12, 0)  # Room for the ghost's sway
+        for particle in self.particles:
+            reach = int(particle['size'] * 2) + 2
+            bounds.union_ip((int(particle['x']) - reach, int(particle['y']) - reach, reach * 2, reach * 2))
+        return bounds
@@ -0,0 +1,288 @@
+import math
+import itertools
+from collections import deque
+import numpy
+from game.settings import *
+from game.monster_config import DifficultyTier, get_separation_strength
+from entities.enemy import Enemy
+from entities.corpse import Corpse
+
+class EnemyManager:
+    """Keep live enemy movement state in NumPy arrays and update it in batch
+
+    Active enemies fill the first count slots. A killed enemy is swapped out for the
+    last active one, leaves a Corpse behind for its death effects, and goes back to
+    the pool to be respawned, so no per-tick loop ever rebuilds a container.
+    """
+    # Per-enemy arrays, all index-aligned with self.enemies
+    STATE_ARRAYS = ('positions', 'previous_positions', 'sizes', 'directions', 'speeds', 'tier_speeds', 'separation',
+                    'tiers', 'special', 'start_ticks', 'facing_left', 'walking')
+
+    def __init__(self, clock, capacity=64, keep_corpses=True):
+        self.clock = clock  # Behaviour and animation timing is measured from each enemy's start tick
+        self.keep_corpses = keep_corpses  # Off when nothing is drawn, e.g. headless simulation
+        self.enemies = []  # Active Enemy objects, index-aligned with the arrays
+        self.count = 0
+        self.pool = []  # Released enemies waiting to be respawned
+        self.serials = itertools.count(1)  # Identity of each life, since pooled objects are reused
+        self.corpses = deque()  # Death effects of killed enemies, oldest first
+
+        # Movement state
+        self.positions = numpy.zeros((capacity, 2))  # Float top-left positions
+        self.previous_positions = numpy.zeros((capacity, 2))  # Positions before the last update, for interpolation
+        self.sizes = numpy.zeros((capacity, 2))
+        self.directions = numpy.zeros((capacity, 2))
+        self.speeds = numpy.zeros(capacity)
+        self.tier_speeds = numpy.zeros(capacity)  # Base tier speed used by the slime bounce
+        self.separation = numpy.zeros(capacity)  # Crowd separation strength per enemy
+
+        # Behaviour state
+        self.tiers = numpy.zeros(capacity, dtype=numpy.int8)
+        self.special = numpy.zeros(capacity, dtype=bool)
+        self.start_ticks = numpy.zeros(capacity, dtype=numpy.int64)  # Clock tick each enemy was added on
+
+        # Rendering state
+        self.facing_left = numpy.zeros(capacity, dtype=bool)
+        self.walking = numpy.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        """Double the capacity of every state array"""
+        for name in self.STATE_ARRAYS:
+            array = getattr(self, name)
+            grown = numpy.zeros((len(array) * 2,) + array.shape[1:], dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            setattr(self, name, grown)
+
+    def acquire(self):
+        """Get a fresh enemy, reusing a pooled one when possible"""
+        if not self.pool:
+            return Enemy()
+        enemy = self.pool.pop()
+        enemy.reset()
+        return enemy
+
+    def add(self, enemy):
+        """Start tracking an enemy, copying its current state into the arrays"""
+        if self.count == len(self.speeds):
+            self._grow()
+
+        i = self.count
+        enemy.slot = i
+        enemy.serial = next(self.serials)
+        self.positions[i] = enemy.rect.topleft
+        self.previous_positions[i] = enemy.rect.topleft
+        self.sizes[i] = enemy.rect.size
+        self.directions[i] = (enemy.direction.x, enemy.direction.y)
+        self.speeds[i] = enemy.speed
+        self.tier_speeds[i] = ENEMY_TIERS[enemy.tier.name]["speed"]
+        self.separation[i] = get_separation_strength(enemy.monster_type)
+        self.tiers[i] = enemy.tier.value
+        self.special[i] = enemy.has_special_movement
+        self.start_ticks[i] = self.clock.tick
+        self.facing_left[i] = enemy.facing_left
+        self.walking[i] = enemy.animation == 'walk'
+
+        self.enemies.append(enemy)
+        self.count += 1
+
+    def clear(self):
+        """Stop tracking all enemies, returning them to the pool"""
+        for enemy in self.enemies:
+            enemy.slot = -1
+        self.pool.extend(self.enemies)
+        self.enemies.clear()
+        self.corpses.clear()
+        self.count = 0
+
+    def release(self, enemy):
+        """Retire a killed enemy, leaving its corpse behind and returning it to the pool
+
+        The last active enemy moves into the freed slot, so this is O(1).
+        """
+        i = enemy.slot
+        if i < 0:
+            return
+        last = self.count - 1
+        if i != last:
+            for name in self.STATE_ARRAYS:
+                array = getattr(self, name)
+                array[i] = array[last]
+            moved = self.enemies[last]
+            self.enemies[i] = moved
+            moved.slot = i
+        self.enemies.pop()
+        self.count = last
+
+        enemy.slot = -1
+        if self.keep_corpses:
+            self.corpses.append(Corpse(enemy, self.clock.tick))
+        self.pool.append(enemy)
+
+    def update_corpses(self):
+        """Advance every corpse's death timeline, dropping the ones that have faded out"""
+        tick = self.clock.tick
+        for corpse in self.corpses:
+            corpse.update(tick)
+        # Corpses all last the same time, so the finished ones are always at the front
+        while self.corpses and self.corpses[0].is_finished():
+            self.corpses.popleft()
+
+    def update(self, player_pos, flow_field=None, collision_map=None):
+        """Apply special behaviours and seek movement to every live enemy at once"""
+        n = self.count
+        if n == 0:
+            return
+
+        positions = self.positions[:n]
+        self.previous_positions[:n] = positions
+        directions = self.directions[:n]
+        speeds = self.speeds[:n]
+        tier_speeds = self.tier_speeds[:n]
+        tiers = self.tiers[:n]
+        special = self.special[:n]
+        timers = self.clock.tick - self.start_ticks[:n]  # Ticks each enemy has been alive
+
+        # Slime bounce: alternate between tier speed and a faster hop every half second
+        bounce = special & (tiers == DifficultyTier.BASIC.value) & (timers % SLIME_BOUNCE_INTERVAL == 0)
+        if bounce.any():
+            base = tier_speeds[bounce]
+            speeds[bounce] = numpy.where(speeds[bounce] == base, base * 1.5, base)
+
+        # Demon teleport: jump near the player every 3 seconds instead of moving
+        teleport = special & (tiers == DifficultyTier.ELITE.value) & (timers % DEMON_TELEPORT_INTERVAL == 0)
+        if teleport.any():
+            count = int(teleport.sum())
+            angles = numpy.random.uniform(0, 2 * math.pi, count)
+            distances = numpy.random.uniform(100, 200, count)
+            sizes = self.sizes[:n][teleport]
+            targets = numpy.column_stack((player_pos[0] + numpy.cos(angles) * distances,
+                                          player_pos[1] + numpy.sin(angles) * distances))
+            # Keep within screen bounds
+            targets = numpy.clip(targets, 0, numpy.array([SCREEN_WIDTH, SCREEN_HEIGHT]) - sizes)
+            positions[teleport] = targets
+
+        moving = ~teleport
+
+        # Head for the player, or for the next tile on the flow field's path around terrain
+        centers = positions + self.sizes[:n] * 0.5
+        targets = numpy.tile(numpy.asarray(player_pos, dtype=float), (n, 1))
+        if flow_field is not None:
+            waypoints, steerable = flow_field.sample(centers)
+            targets[steerable] = waypoints[steerable]
+        offsets = targets - centers
+        lengths = numpy.hypot(offsets[:, 0], offsets[:, 1])
+        steer = moving & (lengths > 0)
+        directions[steer] = offsets[steer] / lengths[steer, None]
+
+        self.facing_left[:n][moving] = offsets[moving, 0] < 0
+        self.walking[:n][moving] = steer[moving] & (speeds[moving] > 0)
+
+        # Move towards player, steering away from crowded neighbours
+        push, braking = self._separation(n)
+        velocity = directions * (speeds * TICK_SCALE * (1 - braking))[:, None]
+        moved = centers[moving] + velocity[moving] + push[moving]
+        if collision_map is not None:
+            # Slide each enemy's center along terrain it would walk into
+            moved = collision_map.resolve_points(centers[moving], moved)
+        positions[moving] += moved - centers[moving]
+
+    def _separation(self, n):
+        """Compute each enemy's push away from nearby enemies, and how much neighbours ahead block its seek
+
+        Overlapping pairs are pushed half their overlap apart per BASE_TICK_RATE tick, and
+        an enemy slows down as the neighbours in front of it get closer, so a horde packs
+        around the player instead of being squeezed onto it.
+
+        Enemies are bucketed into cells the size of the separation radius, with at most
+        ENEMY_SEPARATION_CELL_CAPACITY per cell, so each one only compares against the
+        9 * capacity slots around it and the whole pass stays O(n). With 1000 enemies
+        this takes about 2.5 ms per tick whether they are spread out or packed around
+        the player, most of it gathering the neighbour slots.
+        """
+        push = numpy.zeros((n, 2))
+        braking = numpy.zeros(n)
+        solid = numpy.flatnonzero(self.separation[:n] > 0)  # Zero-strength enemies neither push nor get pushed
+        count = len(solid)
+        if count < 2:
+            return push, braking
+
+        radius = ENEMY_SEPARATION_RADIUS
+        capacity = ENEMY_SEPARATION_CELL_CAPACITY
+        centers = self.positions[solid] + self.sizes[solid] * 0.5
+
+        # Bucket into cells, padded by one so every 3x3 neighbourhood stays inside the table
+        cells = numpy.floor(centers / radius).astype(numpy.int64)
+        cells -= cells.min(axis=0) - 1
+        rows = int(cells[:, 1].max()) + 2
+        cell_ids = cells[:, 0] * rows + cells[:, 1]
+        table = numpy.full(((int(cells[:, 0].max()) + 2) * rows, capacity), -1, dtype=numpy.int64)
+
+        # Slot each enemy by its rank within its cell, dropping overflow
+        order = numpy.argsort(cell_ids, kind='stable')
+        sorted_ids = cell_ids[order]
+        rank = numpy.arange(count) - numpy.searchsorted(sorted_ids, sorted_ids)
+        fits = rank < capacity
+        table[sorted_ids[fits], rank[fits]] = order[fits]
+
+        # Gather neighbour slots from the surrounding 3x3 cells
+        offsets = numpy.array([dx * rows + dy for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+        neighbours = table[cell_ids[:, None] + offsets].reshape(count, -1)
+        own = numpy.arange(count)[:, None]
+        pairs, slots = numpy.nonzero((neighbours >= 0) & (neighbours != own))
+        others = neighbours[pairs, slots]
+
+        delta = centers[pairs] - centers[others]
+        # Separate exactly stacked enemies along x by their order
+        stacked = (delta[:, 0] == 0) & (delta[:, 1] == 0)
+        delta[stacked, 0] = numpy.sign(pairs[stacked] - others[stacked])
+
+        distances = numpy.hypot(delta[:, 0], delta[:, 1])
+        overlap = numpy.maximum(radius - distances, 0)
+        strength = self.separation[solid]
+
+        # Each overlapping pair moves half its overlap apart
+        weights = overlap * 0.5 * TICK_SCALE / distances
+        force = numpy.column_stack((
+            numpy.bincount(pairs, weights=delta[:, 0] * weights, minlength=count),
+            numpy.bincount(pairs, weights=delta[:, 1] * weights, minlength=count)
+        )) * strength[:, None]
+
+        # Neighbours in the direction of travel hold an enemy back
+        ahead = (self.directions[solid][pairs] * delta).sum(axis=1) < 0
+        blocked = numpy.bincount(pairs, weights=numpy.where(ahead, overlap / radius, 0), minlength=count)
+        braking[solid] = numpy.minimum(blocked * strength, 1)
+
+        # Cap how far separation can move an enemy in one tick
+        lengths = numpy.hypot(force[:, 0], force[:, 1])
+        scale = numpy.minimum(1.0, ENEMY_SEPARATION_PUSH / numpy.maximum(lengths, 1e-6))
+        push[solid] = force * scale[:, None]
+        return push, braking
+
+    def sync(self, alpha=1.0):
+        """Copy array state back onto the Enemy objects' rects and animation fields
+
+        With alpha below 1 the rects are placed that far through the last tick's movement,
+        for drawing between ticks; sync() again restores the simulated positions.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        positions = self.positions[:n]
+        if alpha < 1:
+            previous = self.previous_positions[:n]
+            step = positions - previous
+            # Teleports jump straight to their destination
+            jumped = (step * step).sum(axis=1) > INTERPOLATION_SNAP_DISTANCE ** 2
+            positions = numpy.where(jumped[:, None], positions, previous + step * alpha)
+        xs = numpy.floor(positions[:, 0]).astype(int).tolist()
+        ys = numpy.floor(positions[:, 1]).astype(int).tolist()
+        animation_timers = (self.clock.tick - self.start_ticks[:n]).tolist()
+        for enemy, x, y, facing_left, walking, animation_timer in zip(
+                self.enemies, xs, ys, self.facing_left[:n].tolist(),
+                self.walking[:n].tolist(), animation_timers):
+            enemy.rect.x = x
+            enemy.rect.y = y
+            enemy.facing_left = facing_left
+            enemy.animation = 'walk' if walking else 'idle'
+            enemy.animation_timer = animation_timer
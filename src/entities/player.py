@@ -5,12 +5,14 @@ from game.settings import *
 from items.inventory import Inventory
 from graphics.animation_handler import AnimationHandler
 from graphics.bullet_particles import BulletParticleSystem
+from entities.projectile_system import ProjectileSystem
+from entities.stat_sheet import StatSheet
 from graphics.gun_animation_handler import GunAnimationHandler
 from graphics.equipment_sprites import EquipmentSprites
 from items.item_base import ItemType
 
 class Player:
-    def __init__(self, character_sprite=None):
+    def __init__(self, character_sprite=None, animation_frames=None):
         self.rect = pygame.Rect(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 
                               PLAYER_SIZE, PLAYER_SIZE)
         self.sprite = character_sprite
@@ -32,14 +34,15 @@ class Player:
         self.weapons = []  # List of equipped weapons (max 4)
         self.weapon_sprites = []  # List of weapon sprites
         self.weapon_animations = []  # List of weapon animations
-        self.weapon_cooldowns = []  # Cooldown for each weapon
+        self.weapon_ready_ticks = []  # Clock tick each weapon is off cooldown
         self.weapon_particles = []  # Particle effects for each weapon
         self.current_weapon_index = 0
-        self.armor_overlays = []  # List of armor visual effects
+        self.armor_overlays = []  # Names of equipped items with armor visuals
+        self.sprite_cache = {}  # Baked character frames keyed by (state, frame, facing, equipment)
         
         # Animation system
         if self.sprite:
-            self.animator = AnimationHandler(self.sprite)
+            self.animator = AnimationHandler(self.sprite, animation_frames)
         else:
             self.animator = None
             
@@ -48,10 +51,11 @@ class Player:
         self.weapon_offset_y = 0
         self.weapon_angle = 0
         self.is_attacking = False
-        self.weapon_cooldowns = []  # Cooldown for each weapon
+        self.basic_attack_ready_tick = 0
         
         # Bullet system
         self.bullet_system = BulletParticleSystem()
+        self.projectiles = ProjectileSystem()  # Live projectiles fired by weapons
         
         # New attributes for items and stats
         self.inventory = Inventory()
@@ -60,18 +64,21 @@ class Player:
         self.health = PLAYER_START_HEALTH
         self.max_health = PLAYER_START_HEALTH
         
-        # Base stats (can be modified by items)
-        self.stats = PLAYER_BASE_STATS.copy()
-        
-        # Stat multipliers from items (now they stack)
-        self.stat_multipliers = {stat: [] for stat in self.stats.keys()}
+        # Base stats, stacked item multipliers and timed buffs
+        self.stats = StatSheet(PLAYER_BASE_STATS)
         
         # Combat state
         self.is_attacking = False
         self.attack_animation_timer = 0
         self.attack_animation_duration = 5
-        self.current_enemies = []  # List of current enemies in range
+        self.combat_queries = None  # Area and targeting queries over current enemies
+        self.damage_events = None  # Buffer attacks queue their damage into
+        self.collision_map = None  # Terrain the player can't walk through
+        self.clock = None  # Game clock for cooldowns
+        self.policy = None  # Scripted controller used instead of the keyboard
         self.score = 0  # Track player's score
+        self.previous_position = self.rect.topleft  # Position at the start of the last tick
+        self.tick_position = self.rect.topleft  # Position at the end of the last tick
 
     def equip_item(self, item):
         """Handle equipping an item and updating visuals"""
@@ -81,8 +88,10 @@ class Player:
                 self.weapon_sprites.append(self.equipment_sprites.generate_weapon_sprite(item.name))
                 # Get animation for this weapon
                 animation = self.equipment_sprites.get_animation(item.name)
+                if animation:
+                    animation.set_clock(self.clock)
                 self.weapon_animations.append(animation)
-                self.weapon_cooldowns.append(0)
+                self.weapon_ready_ticks.append(0)
                 # Create particle system for this weapon
                 self.weapon_particles.append(BulletParticleSystem())
                 # Apply weapon stats
@@ -91,10 +100,10 @@ class Player:
                 print("Cannot equip more than 4 weapons!")
                 return False
         elif item.item_type == ItemType.PASSIVE:
-            # Generate armor overlay if the item has a visual effect
-            overlay = self.equipment_sprites.generate_armor_overlay(item.name)
-            if overlay:
-                self.armor_overlays.append(overlay)
+            # Register armor overlay if the item has a visual effect
+            if self.equipment_sprites.get_armor_overlay(item.name):
+                self.armor_overlays.append(item.name)
+                self.sprite_cache.clear()
             # Apply passive item stats (they now stack)
             item.apply_effect(self)
         return True
@@ -107,20 +116,43 @@ class Player:
                 self.weapons.pop(index)
                 self.weapon_sprites.pop(index)
                 self.weapon_animations.pop(index)
-                self.weapon_cooldowns.pop(index)
+                self.weapon_ready_ticks.pop(index)
                 self.weapon_particles.pop(index)
         elif item.item_type == ItemType.PASSIVE:
             # Remove armor overlay if it exists
-            self.armor_overlays = [overlay for overlay in self.armor_overlays 
-                                 if overlay != self.equipment_sprites.generate_armor_overlay(item.name)]
+            if item.name in self.armor_overlays:
+                self.armor_overlays.remove(item.name)
+                self.sprite_cache.clear()
         
         # Remove item stats
         item.remove_effect(self)
 
     def input(self):
+        if self.policy is not None:
+            # Scripted movement, e.g. for headless simulation
+            self.direction.update(self.policy.get_movement(self))
+            if self.direction.x:
+                self.facing_left = self.direction.x < 0
+        else:
+            self._read_movement_keys()
+            
+        # Normalize diagonal movement
+        if self.direction.magnitude() > 0:
+            self.direction = self.direction.normalize()
+            
+        # Update animation state based on movement
+        if self.animator:
+            if self.is_attacking:
+                self.animator.set_animation('attack')
+            elif self.direction.magnitude() > 0:
+                self.animator.set_animation('walk')
+            else:
+                self.animator.set_animation('idle')
+
+    def _read_movement_keys(self):
+        """Set the movement direction from the keyboard"""
         keys = pygame.key.get_pressed()
         
-        # Movement input
         self.direction.x = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.direction.x = -1
@@ -134,39 +166,31 @@ class Player:
             self.direction.y = -1
         if keys[pygame.K_DOWN] or keys[pygame.K_s]:
             self.direction.y = 1
-            
-        # Normalize diagonal movement
-        if self.direction.magnitude() > 0:
-            self.direction = self.direction.normalize()
-            
-        # Update animation state based on movement
-        if self.animator:
-            if self.is_attacking:
-                self.animator.set_animation('attack')
-            elif self.direction.magnitude() > 0:
-                self.animator.set_animation('walk')
-            else:
-                self.animator.set_animation('idle')
 
     def move(self):
         # Update position using modified speed
-        actual_speed = self.get_stat("move_speed")
-        self.rect.x += self.direction.x * actual_speed
-        self.rect.y += self.direction.y * actual_speed
+        actual_speed = self.get_stat("move_speed") * TICK_SCALE
+        if self.collision_map is not None:
+            self.collision_map.move_rect(self.rect, self.direction.x * actual_speed,
+                                         self.direction.y * actual_speed)
+        else:
+            self.rect.x += self.direction.x * actual_speed
+            self.rect.y += self.direction.y * actual_speed
         
         # Keep player on screen
         self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def update(self):
+        self.stats.update(self.clock.tick)  # Expire finished buffs
+        self.previous_position = self.rect.topleft
         self.input()
         self.move()
+        self.tick_position = self.rect.topleft
         
-        # Update weapon cooldowns and animations
-        for i in range(len(self.weapon_cooldowns)):
-            if self.weapon_cooldowns[i] > 0:
-                self.weapon_cooldowns[i] -= 1
-            if i < len(self.weapon_animations) and self.weapon_animations[i]:
-                self.weapon_animations[i].update()
+        # Update weapon animations
+        for animation in self.weapon_animations:
+            if animation:
+                animation.update()
         
         # Update animations
         if self.animator:
@@ -183,25 +207,14 @@ class Player:
         if self.direction.magnitude() > 0:
             self.weapon_angle = math.degrees(math.atan2(self.direction.y, self.direction.x))
         
-        # Update bullet system
+        # Update bullet system (auto-attacks run from GameState.handle_combat once enemies have moved)
         self.bullet_system.update()
-        
-        # Auto-attack with all weapons that are off cooldown
-        self.attack()
 
     def draw(self, screen):
         # Draw character sprite with animations or fallback to rectangle
         if self.animator:
-            current_frame = self.animator.get_current_frame()
-            sprite = pygame.transform.flip(current_frame, self.facing_left, False)
-            
-            # Draw base character
-            screen.blit(sprite, self.rect)
-            
-            # Draw armor overlays
-            for overlay in self.armor_overlays:
-                overlay_flipped = pygame.transform.flip(overlay, self.facing_left, False)
-                screen.blit(overlay_flipped, self.rect)
+            # Draw base character with armor overlays baked in
+            screen.blit(self.get_character_sprite(), self.rect)
             
             # Draw all equipped weapons with animations in their fixed positions
             for i, weapon_sprite in enumerate(self.weapon_sprites):
@@ -229,7 +242,7 @@ class Player:
                         screen.blit(rotated_weapon, weapon_rect)
                     
                     # Draw attack effects if attacking and cooldown is active
-                    if self.is_attacking and self.weapon_cooldowns[i] > 0:
+                    if self.is_attacking and not self.clock.is_ready(self.weapon_ready_ticks[i]):
                         self._draw_attack_effects(screen, weapon_x, weapon_y, self.weapons[i])
                         
                         # Add weapon-specific particles
@@ -241,9 +254,57 @@ class Player:
         
         # Draw bullets and effects
         self.bullet_system.draw(screen)
+        self.projectiles.draw(screen)
         
         self.draw_health_bar(screen)
 
+    def interpolate(self, alpha):
+        """Place the player alpha of the way through the last tick's movement for drawing
+
+        Called with 1.0 after drawing to put the rect back where the simulation left it.
+        """
+        (x0, y0), (x1, y1) = self.previous_position, self.tick_position
+        if alpha >= 1 or (x1 - x0) ** 2 + (y1 - y0) ** 2 > INTERPOLATION_SNAP_DISTANCE ** 2:
+            self.rect.topleft = self.tick_position
+        else:
+            self.rect.topleft = (round(x0 + (x1 - x0) * alpha), round(y0 + (y1 - y0) * alpha))
+        self.projectiles.interpolation = alpha
+
+    def get_character_sprite(self):
+        """Get the current animation frame composited with armor overlays and facing"""
+        frame_key = self.animator.get_frame_key()
+        if frame_key is None:
+            # Blended transition frames are one-offs, so compose them without caching
+            return self._compose_character_sprite(self.animator.get_current_frame())
+        return self._get_cached_sprite(frame_key)
+
+    def get_hit_sprite(self):
+        """Get the sprite used for pixel-accurate hits, or None when drawn as a plain rect
+
+        Uses the cached frame of the state being played, even mid-blend, so hit checks
+        leave the animation untouched and reuse one mask per frame.
+        """
+        if not self.animator:
+            return None
+        return self._get_cached_sprite(self.animator.get_target_frame_key())
+
+    def _get_cached_sprite(self, frame_key):
+        """Get the baked sprite for a (state, frame) key, composing it on first use"""
+        key = (*frame_key, self.facing_left, tuple(self.armor_overlays))
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            state = self.animator.animation_states[frame_key[0]]
+            sprite = self._compose_character_sprite(state.frames[frame_key[1]])
+            self.sprite_cache[key] = sprite
+        return sprite
+
+    def _compose_character_sprite(self, frame):
+        """Bake armor overlays onto a character frame and flip it to the facing direction"""
+        composite = frame.copy()
+        for item_name in dict.fromkeys(self.armor_overlays):
+            composite.blit(self.equipment_sprites.get_armor_overlay(item_name), (0, 0))
+        return pygame.transform.flip(composite, self.facing_left, False)
+
     def _draw_attack_effects(self, screen, weapon_x, weapon_y, weapon):
         """Draw weapon-specific attack effects"""
         if weapon is None:  # Basic attack effect
@@ -519,6 +580,15 @@ class Player:
                                       math.radians(arc_angle + random.uniform(30, 90)), 2)
                         screen.blit(arc_surf, (mid_x - arc_size, mid_y - arc_size))
 
+    def get_dirty_rects(self):
+        """Get the screen regions touched by the player, its weapons and bullet effects"""
+        rects = [self.rect.inflate(PLAYER_EFFECT_MARGIN * 2, PLAYER_EFFECT_MARGIN * 2)]
+        for particle in self.bullet_system.particles:
+            rects.append(pygame.Rect(particle.x - particle.size, particle.y - particle.size,
+                                     particle.size * 2 + 1, particle.size * 2 + 1))
+        rects.extend(self.projectiles.get_dirty_rects())
+        return rects
+
     def draw_health_bar(self, screen):
         bar_width = 50
         bar_height = 5
@@ -531,27 +601,17 @@ class Player:
         pygame.draw.rect(screen, GREEN, (*bar_pos, health_width, bar_height))
         
     def get_stat(self, stat_name):
-        """Get a stat's current value including stacked multipliers"""
-        base_value = self.stats.get(stat_name, 0)
-        
-        # Apply all multipliers
-        total_multiplier = 1.0
-        if stat_name in self.stat_multipliers:
-            for mult in self.stat_multipliers[stat_name]:
-                total_multiplier *= mult
-                
-        return base_value * total_multiplier
+        """Get a stat's current value including stacked multipliers and buffs"""
+        return self.stats.get(stat_name)
         
     def modify_stat(self, stat_name, multiplier):
         """Modify a stat's multiplier (used by items) - now they stack"""
-        if stat_name in self.stat_multipliers:
-            self.stat_multipliers[stat_name].append(multiplier)
+        if stat_name in self.stats:
+            self.stats.add_multiplier(stat_name, multiplier)
             
     def remove_stat_multiplier(self, stat_name, multiplier):
         """Remove a specific stat multiplier"""
-        if stat_name in self.stat_multipliers:
-            if multiplier in self.stat_multipliers[stat_name]:
-                self.stat_multipliers[stat_name].remove(multiplier)
+        self.stats.remove_multiplier(stat_name, multiplier)
                 
     def take_damage(self, amount):
         """Take damage with defense calculation"""
@@ -575,56 +635,115 @@ class Player:
         self.money += amount
         
     def attack(self):
-        """Attack with all weapons and basic attack if no weapons equipped"""
-        damage_dealt = 0
+        """Attack with all weapons and basic attack if no weapons equipped
+
+        Damage is only queued here; GameState.resolve_damage applies it and counts what was dealt.
+        """
+        attack_range = self.get_stat("attack_range")
         
         # Basic attack if no weapons equipped
         if not self.weapons:
-            if not hasattr(self, 'basic_attack_cooldown'):
-                self.basic_attack_cooldown = 0
-                
-            if self.basic_attack_cooldown <= 0:
-                self.basic_attack_cooldown = 0.5 * FPS  # Basic attack every 0.5 seconds
+            if self.clock.is_ready(self.basic_attack_ready_tick):
+                self.basic_attack_ready_tick = self.clock.deadline(0.5 * FPS)  # Basic attack every 0.5 seconds
                 self.is_attacking = True
                 # Calculate basic attack damage
-                damage = self.calculate_damage() * 1.0  # Base damage multiplier
-                damage_dealt += self._attack_nearest_enemy(damage, None)
-            else:
-                self.basic_attack_cooldown -= 1
+                damage, crit = self.calculate_damage()  # Base damage multiplier of 1.0
+                self._attack_with(damage, None, attack_range, crit)
         
         # Weapon attacks
         for i, weapon in enumerate(self.weapons):
-            if self.weapon_cooldowns[i] <= 0:
-                self.weapon_cooldowns[i] = weapon.weapon_stats.get("cooldown", 1.0) * FPS
+            if self.clock.is_ready(self.weapon_ready_ticks[i]):
+                self.weapon_ready_ticks[i] = self.clock.deadline(weapon.weapon_stats.get("cooldown", 1.0) * FPS)
                 self.is_attacking = True
                 # Start weapon animation
                 if self.weapon_animations[i]:
                     self.weapon_animations[i].play()
                 # Calculate damage
-                damage = self.calculate_damage() * weapon.stats.get("damage", 1.0)
-                # Find closest enemy and apply damage
-                damage_dealt += self._attack_nearest_enemy(damage, weapon)
-            else:
-                self.weapon_cooldowns[i] -= 1
-                
-        return damage_dealt
+                damage, crit = self.calculate_damage()
+                damage *= weapon.stats.get("damage", 1.0)
+                if "projectile_speed" in weapon.weapon_stats:
+                    # Projectiles deal their damage when they land
+                    self._fire_projectiles(damage, weapon, attack_range, crit)
+                else:
+                    # Hit every enemy the weapon's area reaches
+                    self._attack_with(damage, weapon, attack_range, crit)
 
-    def _attack_nearest_enemy(self, damage, weapon):
-        """Find and attack the nearest enemy with the given weapon"""
-        closest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in self.current_enemies:
-            if self.can_attack_enemy(enemy):
-                dx = enemy.rect.centerx - self.rect.centerx
-                dy = enemy.rect.centery - self.rect.centery
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_enemy = enemy
+    def _find_targets(self, weapon, attack_range):
+        """Get the indices of the enemies a weapon hits, based on its area stats"""
+        queries = self.combat_queries
+        center = self.rect.center
+        stats = weapon.weapon_stats if weapon else {}
+        
+        # Weapons swung the way the player is facing
+        if "arc_degrees" in stats:
+            return queries.cone(center, self.weapon_angle, stats["arc_degrees"], stats.get("range", attack_range))
+        
+        # Everything else starts from the nearest enemy
+        nearest = queries.k_nearest(center, 1, attack_range)
+        if not len(nearest):
+            return nearest
+        target = nearest[0]
+        
+        if "explosion_radius" in stats:
+            return queries.circle(queries.centers[target], stats["explosion_radius"])
+        if "arrow_count" in stats:
+            # Fan the arrows across the spread, centered on the target; each stops at the first enemy
+            dx, dy = queries.centers[target] - center
+            aim = math.degrees(math.atan2(dy, dx))
+            count = stats["arrow_count"]
+            step = stats.get("spread_angle", 0) / (count - 1) if count > 1 else 0
+            hits = []
+            for i in range(count):
+                struck = queries.line(center, aim + (i - (count - 1) / 2) * step, attack_range, PROJECTILE_HIT_WIDTH)
+                if len(struck):
+                    hits.append(struck[0])
+            return hits
+        if "chain_count" in stats:
+            return queries.chain(target, stats["chain_count"], stats.get("chain_range", attack_range))
+        return nearest
+        
+    def _fire_projectiles(self, damage, weapon, attack_range, crit=False):
+        """Launch a weapon's projectile if an enemy is in range"""
+        if self.combat_queries is None:
+            return
+        nearest = self.combat_queries.k_nearest(self.rect.center, 1, attack_range)
+        if not len(nearest):
+            return
+        
+        stats = weapon.weapon_stats
+        if "bounce_count" in stats:
+            # Bouncing shots home in on the nearest enemy
+            dx, dy = self.combat_queries.centers[nearest[0]] - self.rect.center
+            angle = math.degrees(math.atan2(dy, dx))
+        else:
+            # Thrown weapons fly the way the player is facing
+            angle = self.weapon_angle
         
-        if closest_enemy:
+        # Bracer-style items stack multipliers on these base-1.0 stats
+        speed = stats["projectile_speed"] * self.get_stat("projectile_speed") * TICK_SCALE
+        radius = PROJECTILE_RADIUS * self.get_stat("projectile_size")
+        self.projectiles.spawn(self.rect.center, angle, speed, radius, damage,
+                               stats.get("penetration", 0), stats.get("bounce_count", 0), weapon.name, crit)
+        
+    def update_projectiles(self):
+        """Move projectiles and queue the damage they land this tick"""
+        if self.combat_queries is None or self.damage_events is None:
+            return
+        indices, owners, amounts, crits = self.projectiles.update(self.combat_queries)
+        
+        for index, owner, amount, crit in zip(indices.tolist(), owners.tolist(), amounts.tolist(), crits.tolist()):
+            self.damage_events.add(self.combat_queries.enemies[index], amount, crit,
+                                   self.projectiles.owner_names[owner])
+        
+    def _attack_with(self, damage, weapon, attack_range, crit=False):
+        """Queue damage against the enemies the given weapon reaches"""
+        if self.combat_queries is None or self.damage_events is None:
+            return
+        targets = self._find_targets(weapon, attack_range)
+        
+        for index in targets:
+            enemy = self.combat_queries.enemies[index]
+            
             # Create hit particles at enemy position
             if weapon is None:  # Basic attack
                 # Create slash particles
@@ -634,58 +753,51 @@ class Player:
                     dx = math.cos(math.radians(angle)) * speed
                     dy = math.sin(math.radians(angle)) * speed
                     self.bullet_system.add_particle(
-                        closest_enemy.rect.centerx, 
-                        closest_enemy.rect.centery,
+                        enemy.rect.centerx, 
+                        enemy.rect.centery,
                         dx, dy,
                         WHITE,
                         random.randint(5, 10),  # Lifetime
                         random.uniform(2, 4)     # Size
                     )
             
-            if closest_enemy.take_damage(damage):
-                self.score += 1
-                self.add_money(ENEMY_KILL_REWARD)
-            return damage
-        return 0
-
-    def can_attack_enemy(self, enemy):
-        """Check if an enemy is within attack range"""
-        if enemy.is_dead:
-            return False
-        dx = enemy.rect.centerx - self.rect.centerx
-        dy = enemy.rect.centery - self.rect.centery
-        distance = math.sqrt(dx * dx + dy * dy)
-        return distance <= self.get_stat("attack_range") 
+            self.damage_events.add(enemy, damage, crit, weapon.name if weapon else None)
 
     def add_temporary_buff(self, stat_name, multiplier, duration):
         """Add a temporary buff to a stat"""
-        if stat_name not in self.temporary_buffs:
-            self.temporary_buffs[stat_name] = []
-        self.temporary_buffs[stat_name].append([multiplier, duration * FPS])  # Convert duration to frames
-        
-    def _update_temporary_buffs(self):
-        """Update all temporary buffs"""
-        for stat_name in list(self.temporary_buffs.keys()):
-            # Update each buff for this stat
-            self.temporary_buffs[stat_name] = [
-                [mult, time - 1] for mult, time in self.temporary_buffs[stat_name]
-                if time > 0
-            ]
-            
-            # Remove the stat entry if no buffs remain
-            if not self.temporary_buffs[stat_name]:
-                del self.temporary_buffs[stat_name]
-                
+        self.stats.add_buff(stat_name, multiplier, int(duration * FPS))  # Convert duration to frames
+        
     def calculate_damage(self):
-        """Calculate damage with critical hits"""
+        """Calculate damage with critical hits, returning (damage, whether it crit)"""
         base_damage = self.get_stat("damage")
         
         # Check for critical hit
         if random.random() < self.get_stat("crit_chance"):
-            return base_damage * self.get_stat("crit_damage")
-        return base_damage
+            return base_damage * self.get_stat("crit_damage"), True
+        return base_damage, False
+
+    def set_clock(self, clock):
+        """Set the game clock cooldowns and animations are timed against"""
+        self.clock = clock
+        if self.animator:
+            self.animator.set_clock(clock)
+        for animation in self.weapon_animations:
+            if animation:
+                animation.set_clock(clock)
+
+    def set_policy(self, policy):
+        """Let a policy object drive movement instead of the keyboard, or None to restore it"""
+        self.policy = policy
+
+    def set_combat_queries(self, combat_queries):
+        """Set the query engine used to find the enemies attacks hit"""
+        self.combat_queries = combat_queries
+
+    def set_damage_events(self, damage_events):
+        """Set the buffer attacks queue their damage into"""
+        self.damage_events = damage_events
 
-    def set_current_enemies(self, enemies):
-        """Update the list of current enemies"""
-        self.current_enemies = enemies
+    def set_collision_map(self, collision_map):
+        """Set the terrain collision map movement is resolved against"""
+        self.collision_map = collision_map
  
\ No newline at end of file
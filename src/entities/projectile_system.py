@@ -0,0 +1,205 @@
+import math
+import numpy
+import pygame
+from game.settings import *
+
+class ProjectileSystem:
+    """Fixed-capacity pool of live projectiles stored in NumPy arrays and updated in batch"""
+    # Per-projectile arrays, all index-aligned
+    STATE_ARRAYS = ('positions', 'previous_positions', 'velocities', 'radii', 'damage', 'pierce', 'penetration',
+                    'bounces', 'lifetimes', 'owners', 'crits', 'last_hit')
+
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+
+        self.positions = numpy.zeros((capacity, 2))
+        self.previous_positions = numpy.zeros((capacity, 2))  # Positions before the last update, for interpolation
+        self.velocities = numpy.zeros((capacity, 2))
+        self.radii = numpy.zeros(capacity)
+        self.damage = numpy.zeros(capacity)
+        self.pierce = numpy.zeros(capacity, dtype=numpy.int32)  # Enemies it can still pass through
+        self.penetration = numpy.zeros(capacity, dtype=numpy.int32)  # Pierce restored after a bounce
+        self.bounces = numpy.zeros(capacity, dtype=numpy.int32)
+        self.lifetimes = numpy.zeros(capacity, dtype=numpy.int32)
+        self.owners = numpy.zeros(capacity, dtype=numpy.int16)  # Index into self.owner_names
+        self.crits = numpy.zeros(capacity, dtype=bool)  # Fired by a critical hit
+        self.last_hit = numpy.zeros(capacity, dtype=numpy.int64)  # Enemy serial, so it isn't hit again next tick
+
+        self.owner_names = []  # Names of the weapons that fired projectiles
+        self.sprite_cache = {}  # Projectile sprites keyed by (owner, radius)
+        self.interpolation = 1.0  # Fraction of the last tick's movement shown when drawing
+
+    def spawn(self, position, angles, speed, radius, damage, penetration=0, bounces=0, owner=None, crit=False):
+        """Launch one projectile per angle (degrees), dropping any that don't fit in the pool"""
+        angles = numpy.radians(numpy.atleast_1d(numpy.asarray(angles, dtype=float)))
+        count = min(len(angles), self.capacity - self.count)
+        if count <= 0:
+            return 0
+
+        if owner not in self.owner_names:
+            self.owner_names.append(owner)
+
+        new = slice(self.count, self.count + count)
+        angles = angles[:count]
+        self.positions[new] = position
+        self.previous_positions[new] = position
+        self.velocities[new] = numpy.column_stack((numpy.cos(angles), numpy.sin(angles))) * speed
+        self.radii[new] = radius
+        self.damage[new] = damage
+        self.pierce[new] = penetration
+        self.penetration[new] = penetration
+        self.bounces[new] = bounces
+        self.lifetimes[new] = PROJECTILE_LIFETIME
+        self.owners[new] = self.owner_names.index(owner)
+        self.crits[new] = crit
+        self.last_hit[new] = 0
+        self.count += count
+        return count
+
+    def clear(self):
+        """Remove every live projectile"""
+        self.count = 0
+
+    def update(self, combat_queries):
+        """Move every projectile, resolving hits along the path it swept this tick
+
+        Returns (enemy indices, owner indices, damage, crit flags) with the total damage
+        each struck enemy took from each weapon's projectiles this tick.
+        """
+        n = self.count
+        no_hits = (numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64),
+                   numpy.zeros(0), numpy.zeros(0, dtype=bool))
+        if n == 0:
+            return no_hits
+
+        starts = self.positions[:n].copy()
+        self.previous_positions[:n] = starts
+        ends = starts + self.velocities[:n]
+        pierce = self.pierce[:n]
+        projectiles, enemies, along = combat_queries.segment_hits(starts, ends, self.radii[:n])
+
+        # Don't hit the enemy a projectile is still passing through from last tick
+        fresh = self.last_hit[:n][projectiles] != combat_queries.ids[enemies]
+        projectiles, enemies, along = projectiles[fresh], enemies[fresh], along[fresh]
+
+        struck = no_hits
+        if len(projectiles):
+            # Take hits in order along each path, up to what the projectile can pierce
+            order = numpy.lexsort((along, projectiles))
+            projectiles, enemies, along = projectiles[order], enemies[order], along[order]
+            rank = numpy.arange(len(projectiles)) - numpy.searchsorted(projectiles, projectiles)
+            kept = rank <= pierce[projectiles]
+            projectiles, enemies, along = projectiles[kept], enemies[kept], along[kept]
+
+            # Total the damage per (enemy, owner) pair
+            owner_count = len(self.owner_names)
+            keys = enemies * owner_count + self.owners[:n][projectiles]
+            totals = numpy.bincount(keys, weights=self.damage[:n][projectiles])
+            crits = numpy.bincount(keys, weights=self.crits[:n][projectiles]) > 0
+            hit = numpy.flatnonzero(totals)
+            struck = (hit // owner_count, hit % owner_count, totals[hit], crits[hit])
+
+            pierce -= numpy.bincount(projectiles, minlength=n).astype(pierce.dtype)
+
+            # Remember the last enemy each projectile hit; spent ones stop on it
+            last = numpy.append(projectiles[1:] != projectiles[:-1], True)
+            hit_projectiles, last_enemies = projectiles[last], enemies[last]
+            self.last_hit[:n][hit_projectiles] = combat_queries.ids[last_enemies]
+            spent = pierce[hit_projectiles] < 0
+            ends[hit_projectiles[spent]] = combat_queries.centers[last_enemies[spent]]
+
+        self.positions[:n] = ends
+        bouncing = numpy.flatnonzero((pierce < 0) & (self.bounces[:n] > 0))
+        if len(bouncing):
+            self._bounce(bouncing, combat_queries)
+
+        self.lifetimes[:n] -= 1
+        positions = self.positions[:n]
+        on_screen = ((positions[:, 0] > -PROJECTILE_SCREEN_MARGIN) &
+                     (positions[:, 0] < SCREEN_WIDTH + PROJECTILE_SCREEN_MARGIN) &
+                     (positions[:, 1] > -PROJECTILE_SCREEN_MARGIN) &
+                     (positions[:, 1] < SCREEN_HEIGHT + PROJECTILE_SCREEN_MARGIN))
+        self._compact((pierce >= 0) & (self.lifetimes[:n] > 0) & on_screen)
+        return struck
+
+    def _bounce(self, indices, combat_queries):
+        """Redirect spent projectiles from the enemy each hit toward the next closest one"""
+        # Most targets are close by, so look one grid cell out before the full range
+        for reach in (combat_queries.cell_size, PROJECTILE_BOUNCE_RANGE):
+            indices = self._retarget(indices, combat_queries, min(reach, PROJECTILE_BOUNCE_RANGE))
+            if not len(indices):
+                return
+
+    def _retarget(self, indices, combat_queries, reach):
+        """Point projectiles at the closest enemy within reach other than the one they hit
+
+        Returns the projectiles that found no target.
+        """
+        origins = self.positions[indices]
+        bouncers, enemies, _ = combat_queries.segment_hits(origins, origins, numpy.full(len(indices), float(reach)))
+
+        # Any enemy but the one just hit
+        other = combat_queries.ids[enemies] != self.last_hit[indices[bouncers]]
+        bouncers, enemies = bouncers[other], enemies[other]
+
+        offsets = combat_queries.centers[enemies] - origins[bouncers]
+        distances = numpy.hypot(offsets[:, 0], offsets[:, 1])
+        order = numpy.lexsort((distances, bouncers))
+        closest = order[numpy.append(True, bouncers[order][1:] != bouncers[order][:-1])] if len(order) else order
+        closest = closest[distances[closest] > 0]
+
+        # Keep each projectile's speed, pointed at its new target
+        redirected = indices[bouncers[closest]]
+        speeds = numpy.hypot(self.velocities[redirected, 0], self.velocities[redirected, 1])
+        self.velocities[redirected] = offsets[closest] * (speeds / distances[closest])[:, None]
+        self.pierce[redirected] = self.penetration[redirected]
+        self.bounces[redirected] -= 1
+        return numpy.setdiff1d(indices, redirected, assume_unique=True)
+
+    def _compact(self, alive):
+        """Drop expired projectiles, keeping the live ones packed at the front of the pool"""
+        if alive.all():
+            return
+        kept = int(alive.sum())
+        for name in self.STATE_ARRAYS:
+            array = getattr(self, name)
+            array[:kept] = array[:self.count][alive]
+        self.count = kept
+
+    def _drawn_positions(self):
+        """Get where projectiles are drawn, part way along the last tick's movement"""
+        n = self.count
+        if self.interpolation >= 1:
+            return self.positions[:n]
+        previous = self.previous_positions[:n]
+        return previous + (self.positions[:n] - previous) * self.interpolation
+
+    def _get_sprite(self, owner, radius):
+        key = (owner, radius)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            color = PROJECTILE_COLORS.get(self.owner_names[owner], WHITE)
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, 90), (radius, radius), radius)
+            pygame.draw.circle(sprite, color, (radius, radius), max(1, radius // 2))
+            self.sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        """Draw all projectiles in one batched blit"""
+        n = self.count
+        if n == 0:
+            return
+        radii = numpy.maximum(numpy.rint(self.radii[:n]).astype(int), 1)
+        corners = (self._drawn_positions() - radii[:, None]).astype(int).tolist()
+        screen.blits([(self._get_sprite(owner, radius), corner) for owner, radius, corner in
+                      zip(self.owners[:n].tolist(), radii.tolist(), corners)], doreturn=False)
+
+    def get_dirty_rects(self):
+        """Get the screen regions covered by projectiles"""
+        n = self.count
+        radii = numpy.ceil(self.radii[:n]).astype(int) + 1
+        corners = (self._drawn_positions() - radii[:, None]).astype(int)
+        return [pygame.Rect(x, y, size * 2, size * 2)
+                for (x, y), size in zip(corners.tolist(), radii.tolist())]
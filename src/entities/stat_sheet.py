@@ -0,0 +1,75 @@
+import heapq
+import itertools
+
+class StatSheet:
+    """Player stats built from base values, stacked item multipliers and timed buffs
+
+    Effective values are cached and only recomputed after something changes, so
+    reading a stat is a dict lookup however many modifiers are stacked on it.
+    """
+    def __init__(self, base_stats):
+        self.base = dict(base_stats)  # Base values; items add to and remove from these
+        self.multipliers = {}  # Stacked item multipliers per stat
+        self.buffs = []  # Min-heap of (expiry tick, order, stat, multiplier)
+        self.buff_order = itertools.count()  # Breaks ties between buffs expiring on the same tick
+        self.tick = 0
+        self.values = {}
+        self.dirty = True
+
+    def get(self, stat_name, default=0):
+        """Get a stat's effective value"""
+        if self.dirty:
+            self._recompute()
+        return self.values.get(stat_name, default)
+
+    def __contains__(self, stat_name):
+        return stat_name in self.base
+
+    def add(self, stat_name, amount):
+        """Add to a stat's base value, creating it if needed"""
+        self.base[stat_name] = self.base.get(stat_name, 0) + amount
+        self.dirty = True
+
+    def set(self, stat_name, value):
+        self.base[stat_name] = value
+        self.dirty = True
+
+    def remove(self, stat_name):
+        """Drop a stat's base value entirely"""
+        if self.base.pop(stat_name, None) is not None:
+            self.dirty = True
+
+    def add_multiplier(self, stat_name, multiplier):
+        self.multipliers.setdefault(stat_name, []).append(multiplier)
+        self.dirty = True
+
+    def remove_multiplier(self, stat_name, multiplier):
+        """Remove one stacked multiplier, if present"""
+        stack = self.multipliers.get(stat_name)
+        if stack and multiplier in stack:
+            stack.remove(multiplier)
+            self.dirty = True
+
+    def add_buff(self, stat_name, multiplier, duration):
+        """Multiply a stat for a number of ticks"""
+        heapq.heappush(self.buffs, (self.tick + duration, next(self.buff_order), stat_name, multiplier))
+        self.dirty = True
+
+    def update(self, tick):
+        """Move to the given clock tick, expiring buffs whose time is up"""
+        self.tick = tick
+        while self.buffs and self.buffs[0][0] <= self.tick:
+            heapq.heappop(self.buffs)
+            self.dirty = True
+
+    def _recompute(self):
+        values = dict(self.base)
+        for stat_name, stack in self.multipliers.items():
+            if stat_name in values:
+                for multiplier in stack:
+                    values[stat_name] *= multiplier
+        for _, _, stat_name, multiplier in self.buffs:
+            if stat_name in values:
+                values[stat_name] *= multiplier
+        self.values = values
+        self.dirty = False
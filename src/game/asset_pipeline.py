@@ -0,0 +1,248 @@
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import numpy
+import pygame
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from game import settings, monster_config
+from game.settings import *
+from game.monster_config import MonsterType
+from game.sound_manager import SoundManager
+from graphics.monster_generator import MonsterGenerator
+from graphics.character_generator import CharacterGenerator
+from graphics.animation_handler import AnimationHandler
+from graphics.equipment_sprites import EquipmentSprites
+from graphics.terrain_generator import TerrainGenerator
+
+TERRAIN_TILE_TYPES = ['grass', 'stone', 'path']
+
+def _seed_job(*key):
+    """Give each job its own random stream, whichever worker ends up running it"""
+    seed = int(hashlib.md5(repr(key).encode()).hexdigest()[:8], 16)
+    random.seed(seed)
+    numpy.random.seed(seed)
+
+def _pack_surface(surface):
+    """Copy a surface's pixels into a plain RGBA buffer that can cross process boundaries"""
+    return {
+        "size": surface.get_size(),
+        "alpha": surface.get_alpha(),
+        "pixels": numpy.frombuffer(bytearray(pygame.image.tostring(surface, "RGBA")), dtype=numpy.uint8)
+    }
+
+def _unpack_surface(packed):
+    """Wrap a packed RGBA buffer in a surface without copying the pixels"""
+    surface = pygame.image.frombuffer(packed["pixels"], tuple(packed["size"]), "RGBA")
+    if packed["alpha"] is not None and packed["alpha"] < 255:
+        surface.set_alpha(packed["alpha"])
+    return surface
+
+# Generation jobs (module level so worker processes can run them)
+
+def _generate_monsters(size, type_index, variants):
+    _seed_job("monster", size, type_index)
+    generator = MonsterGenerator(size)
+    records = []
+    for _ in range(variants):
+        sprite, death_frames = generator.generate_monster(type_index)
+        records.append({
+            "size": size,
+            "type_index": type_index,
+            "sprite": _pack_surface(sprite),
+            "death_frames": [_pack_surface(frame) for frame in death_frames]
+        })
+    return "monsters", records
+
+def _generate_character(size, variant):
+    _seed_job("character", size, variant)
+    sprite = CharacterGenerator(size).generate_character()
+    states = AnimationHandler(sprite).animation_states
+    return "characters", [{
+        "sprite": _pack_surface(sprite),
+        "frames": {name: [_pack_surface(frame) for frame in state.frames]
+                   for name, state in states.items()}
+    }]
+
+def _generate_weapon(size, weapon_name):
+    _seed_job("weapon", size, weapon_name)
+    pose_frames = EquipmentSprites(size).rasterize_weapon(weapon_name)
+    return "weapons", [{
+        "name": weapon_name,
+        "poses": [[pose, [[_pack_surface(image) if image else None, offset] for image, offset in rotations]]
+                  for pose, rotations in pose_frames.items()]
+    }]
+
+def _generate_tiles(tile_size, tile_type, variants):
+    _seed_job("tile", tile_size, tile_type)
+    generator = TerrainGenerator(tile_size)
+    return "tiles", [{
+        "tile_size": tile_size,
+        "type": tile_type,
+        "tile": _pack_surface(generator.generate_tile(tile_type))
+    } for _ in range(variants)]
+
+def _generate_sounds():
+    _seed_job("sounds")
+    return "sounds", [{"name": name, "samples": samples}
+                      for name, samples in SoundManager.synthesize_samples().items()]
+
+class AssetPipeline:
+    """Pre-generate procedural assets on a worker pool and cache them on disk"""
+    def __init__(self, cache_root=ASSET_CACHE_DIR, workers=ASSET_WORKERS):
+        self.workers = workers or None
+        self.cache_dir = os.path.join(cache_root, f"v{ASSET_CACHE_VERSION}-{self.source_hash()}")
+        self.load_time = 0
+        self.warm_start = False
+
+    @staticmethod
+    def source_hash():
+        """Hash the source of every generator so edits invalidate the cache"""
+        modules = [sys.modules[__name__], settings, monster_config]
+        modules += [sys.modules[cls.__module__] for cls in
+                    (MonsterGenerator, CharacterGenerator, AnimationHandler,
+                     EquipmentSprites, TerrainGenerator, SoundManager)]
+        digest = hashlib.sha1()
+        for module in modules:
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:12]
+
+    def load(self):
+        """Install all pre-generated assets, generating and caching them on a cold start"""
+        start = time.perf_counter()
+        assets = self._read_cache()
+        self.warm_start = assets is not None
+        if assets is None:
+            assets = self._generate()
+            self._write_cache(assets)
+        self._install(assets)
+
+        self.load_time = time.perf_counter() - start
+        print(f"Assets ready in {self.load_time:.2f}s "
+              f"({'warm start from cache' if self.warm_start else 'cold start, cache written'})")
+
+    def _build_jobs(self):
+        jobs = [(_generate_sounds, ())]
+        for type_index in range(len(MonsterType)):
+            jobs.append((_generate_monsters, (32, type_index, MONSTER_SPRITE_VARIANTS)))
+        for variant in range(CHARACTER_VARIANTS):
+            jobs.append((_generate_character, (32, variant)))
+        for weapon_name in EquipmentSprites(PLAYER_SIZE).animation_specs:
+            jobs.append((_generate_weapon, (PLAYER_SIZE, weapon_name)))
+        for tile_type in TERRAIN_TILE_TYPES:
+            jobs.append((_generate_tiles, (32, tile_type, TERRAIN_TILE_VARIANTS)))
+        return jobs
+
+    def _generate(self):
+        """Run every generation job, on worker processes when available"""
+        jobs = self._build_jobs()
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(job, *args) for job, args in jobs]
+                results = [future.result() for future in futures]
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"Asset workers unavailable, generating in-process: {e}")
+            results = [job(*args) for job, args in jobs]
+            # Jobs seed the global random streams, so reseed them for gameplay
+            random.seed()
+            numpy.random.seed()
+
+        assets = {"monsters": [], "characters": [], "weapons": [], "tiles": [], "sounds": []}
+        for category, records in results:
+            assets[category].extend(records)
+        return assets
+
+    def _install(self, assets):
+        """Hand restored surfaces and samples to the generators that use them"""
+        MonsterGenerator.monster_cache.clear()
+        MonsterGenerator.palette_cache.clear()
+        for record in assets["monsters"]:
+            key = (record["size"], record["type_index"])
+            variant = (_unpack_surface(record["sprite"]),
+                       [_unpack_surface(frame) for frame in record["death_frames"]])
+            MonsterGenerator.monster_cache.setdefault(key, []).append(variant)
+
+        CharacterGenerator.character_cache[:] = [
+            (_unpack_surface(record["sprite"]),
+             {state: [_unpack_surface(frame) for frame in frames]
+              for state, frames in record["frames"].items()})
+            for record in assets["characters"]
+        ]
+
+        for record in assets["weapons"]:
+            EquipmentSprites.weapon_frame_cache[record["name"]] = {
+                pose: [(_unpack_surface(image) if image else None, tuple(offset))
+                       for image, offset in rotations]
+                for pose, rotations in record["poses"]
+            }
+
+        TerrainGenerator.tile_cache.clear()
+        for record in assets["tiles"]:
+            key = (record["tile_size"], record["type"])
+            TerrainGenerator.tile_cache.setdefault(key, []).append(_unpack_surface(record["tile"]))
+
+        SoundManager.sample_cache.clear()
+        for record in assets["sounds"]:
+            SoundManager.sample_cache[record["name"]] = record["samples"]
+
+    def _write_cache(self, assets):
+        """Store all buffers in one blob, with a JSON manifest describing where each one lives"""
+        chunks = []
+        offset = 0
+
+        def flatten(value):
+            nonlocal offset
+            if isinstance(value, numpy.ndarray):
+                data = numpy.ascontiguousarray(value).view(numpy.uint8).reshape(-1)
+                ref = {"buffer": offset, "dtype": value.dtype.str, "shape": value.shape}
+                padding = -data.size % 8  # Keep every buffer 8-byte aligned
+                chunks.append(data)
+                chunks.append(numpy.zeros(padding, dtype=numpy.uint8))
+                offset += data.size + padding
+                return ref
+            if isinstance(value, dict):
+                return {key: flatten(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [flatten(item) for item in value]
+            return value
+
+        try:
+            manifest = flatten(assets)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            numpy.save(os.path.join(self.cache_dir, "buffers.npy"), numpy.concatenate(chunks))
+            # The manifest is written last so a partial cache is never mistaken for a complete one
+            with open(os.path.join(self.cache_dir, "manifest.json"), "w") as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            print(f"Error writing asset cache: {e}")
+
+    def _read_cache(self):
+        manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+
+        try:
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+            blob = numpy.load(os.path.join(self.cache_dir, "buffers.npy"))
+        except (OSError, ValueError) as e:
+            print(f"Error reading asset cache: {e}")
+            return None
+
+        def restore(value):
+            if isinstance(value, dict):
+                if "buffer" in value:
+                    dtype = numpy.dtype(value["dtype"])
+                    count = int(numpy.prod(value["shape"])) * dtype.itemsize
+                    start = value["buffer"]
+                    return blob[start:start + count].view(dtype).reshape(value["shape"])
+                return {key: restore(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [restore(item) for item in value]
+            return value
+
+        return restore(manifest)
@@ -0,0 +1,93 @@
+import numpy
+import pygame
+from game.settings import *
+
+class CollisionMap:
+    """Blocked-cell bitmap over the play area for terrain collision"""
+    def __init__(self, width, height, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.columns = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        self.blocked = numpy.zeros((self.rows, self.columns), dtype=bool)  # Indexed [row, column]
+
+    def block_rect(self, rect):
+        """Mark every cell a pixel rect touches as blocked"""
+        rect = pygame.Rect(rect)
+        size = self.cell_size
+        left = max(rect.left // size, 0)
+        top = max(rect.top // size, 0)
+        right = min((rect.right - 1) // size + 1, self.columns)
+        bottom = min((rect.bottom - 1) // size + 1, self.rows)
+        if left < right and top < bottom:
+            self.blocked[top:bottom, left:right] = True
+
+    def is_rect_blocked(self, rect):
+        """Check whether a pixel rect overlaps any blocked cell"""
+        size = self.cell_size
+        left = max(rect.left // size, 0)
+        top = max(rect.top // size, 0)
+        right = min((rect.right - 1) // size + 1, self.columns)
+        bottom = min((rect.bottom - 1) // size + 1, self.rows)
+        if left >= right or top >= bottom:
+            return False
+        return bool(self.blocked[top:bottom, left:right].any())
+
+    def move_rect(self, rect, dx, dy):
+        """Move a rect one axis at a time, stopping against blocked cells so it slides along them
+
+        A rect that already overlaps a blocked cell (e.g. spawned on one) moves freely
+        until it is clear.
+        """
+        size = self.cell_size
+        stuck = self.is_rect_blocked(rect)
+
+        if dx:
+            x = rect.x
+            rect.x += dx
+            if not stuck and self.is_rect_blocked(rect):
+                # Stop flush against the edge of the cell being entered
+                rect.x = x
+                if dx > 0:
+                    rect.right = max(rect.right, ((rect.right - 1) // size + 1) * size)
+                else:
+                    rect.left = min(rect.left, (rect.left // size) * size)
+
+        if dy:
+            y = rect.y
+            rect.y += dy
+            if not stuck and self.is_rect_blocked(rect):
+                rect.y = y
+                if dy > 0:
+                    rect.bottom = max(rect.bottom, ((rect.bottom - 1) // size + 1) * size)
+                else:
+                    rect.top = min(rect.top, (rect.top // size) * size)
+
+    def resolve_points(self, old_points, new_points):
+        """Slide a batch of points moving from old to new positions along blocked cells
+
+        Each axis of the move is kept only if the cell it lands in is free, so a point
+        heading diagonally into a wall keeps moving along it. Returns the resolved points.
+        """
+        size = self.cell_size
+        resolved = new_points.copy()
+        old_columns = numpy.floor(old_points[:, 0] / size).astype(int)
+        old_rows = numpy.floor(old_points[:, 1] / size).astype(int)
+        new_columns = numpy.floor(new_points[:, 0] / size).astype(int)
+        new_rows = numpy.floor(new_points[:, 1] / size).astype(int)
+
+        # Horizontal move first, checked on the old row
+        blocked_x = self._lookup(new_columns, old_rows) & (new_columns != old_columns)
+        resolved[blocked_x, 0] = old_points[blocked_x, 0]
+        columns = numpy.where(blocked_x, old_columns, new_columns)
+
+        # Then vertical, from wherever the horizontal move ended up
+        blocked_y = self._lookup(columns, new_rows) & (new_rows != old_rows)
+        resolved[blocked_y, 1] = old_points[blocked_y, 1]
+        return resolved
+
+    def _lookup(self, columns, rows):
+        """Vectorized blocked test for cell coordinates, treating off-map cells as free"""
+        inside = (columns >= 0) & (columns < self.columns) & (rows >= 0) & (rows < self.rows)
+        result = numpy.zeros(len(columns), dtype=bool)
+        result[inside] = self.blocked[rows[inside], columns[inside]]
+        return result
@@ -0,0 +1,166 @@
+import math
+import numpy
+from game.settings import *
+
+# Cell coordinates are shifted by this much so packed cell keys stay non-negative
+CELL_KEY_OFFSET = 1 << 15
+CELL_KEY_STRIDE = 1 << 16
+
+class CombatQueries:
+    """Area and targeting queries over the batched enemy arrays, answered with enemy indices
+
+    Indices refer to self.enemies, a snapshot taken at the last rebuild, so they stay
+    valid even after the enemy manager compacts its arrays.
+    """
+    def __init__(self, cell_size=SPATIAL_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.enemies = []
+        self.centers = numpy.zeros((0, 2))
+        self.radii = numpy.zeros(0)  # Half the larger side of each enemy, so edges count as hits
+        self.alive = numpy.zeros(0, dtype=bool)
+        self.ids = numpy.zeros(0, dtype=numpy.int64)  # Serial of each enemy, stable across rebuilds and respawns
+        self.order = numpy.zeros(0, dtype=numpy.int64)  # Enemy indices sorted by cell key
+        self.sorted_keys = numpy.zeros(0, dtype=numpy.int64)
+
+    def rebuild(self, enemy_manager):
+        """Snapshot the manager's enemies and bucket them by cell"""
+        n = enemy_manager.count
+        self.enemies = enemy_manager.enemies[:n]
+        self.centers = enemy_manager.positions[:n] + enemy_manager.sizes[:n] * 0.5
+        self.radii = enemy_manager.sizes[:n].max(axis=1) * 0.5 if n else numpy.zeros(0)
+        self.alive = numpy.ones(n, dtype=bool)  # Killed enemies leave the manager, so every slot is live
+        self.ids = numpy.fromiter((enemy.serial for enemy in self.enemies), dtype=numpy.int64, count=n)
+
+        cells = numpy.floor(self.centers / self.cell_size).astype(numpy.int64) + CELL_KEY_OFFSET
+        keys = cells[:, 0] * CELL_KEY_STRIDE + cells[:, 1]
+        self.order = numpy.argsort(keys, kind='stable')
+        self.sorted_keys = keys[self.order]
+
+    def mark_dead(self, indices):
+        """Exclude killed enemies from later queries this tick"""
+        self.alive[indices] = False
+
+    def _candidates(self, left, top, right, bottom):
+        """Get living enemy indices in the cells overlapping a pixel box"""
+        if not len(self.sorted_keys):
+            return self.order[:0]
+
+        size = self.cell_size
+        min_cx = math.floor(left / size) + CELL_KEY_OFFSET
+        max_cx = math.floor(right / size) + CELL_KEY_OFFSET
+        min_cy = math.floor(top / size) + CELL_KEY_OFFSET
+        max_cy = math.floor(bottom / size) + CELL_KEY_OFFSET
+
+        # Each column of cells is one contiguous run of sorted keys
+        columns = numpy.arange(min_cx, max_cx + 1, dtype=numpy.int64) * CELL_KEY_STRIDE
+        starts = numpy.searchsorted(self.sorted_keys, columns + min_cy)
+        ends = numpy.searchsorted(self.sorted_keys, columns + max_cy, side='right')
+        found = numpy.concatenate([self.order[start:end] for start, end in zip(starts, ends)])
+        return found[self.alive[found]]
+
+    def _reach(self, point, radius):
+        """Get living enemies whose bodies come within radius of a point, with their offsets"""
+        x, y = point
+        # Widen the box by the largest body so big enemies on the edge aren't missed
+        pad = radius + (self.radii.max() if len(self.radii) else 0)
+        found = self._candidates(x - pad, y - pad, x + pad, y + pad)
+        offsets = self.centers[found] - (x, y)
+        distances = numpy.hypot(offsets[:, 0], offsets[:, 1])
+        inside = distances <= radius + self.radii[found]
+        return found[inside], offsets[inside], distances[inside]
+
+    def circle(self, point, radius):
+        """Get every living enemy touching a circle"""
+        return self._reach(point, radius)[0]
+
+    def k_nearest(self, point, k, max_radius):
+        """Get up to k living enemies within max_radius, closest first"""
+        found, _, distances = self._reach(point, max_radius)
+        if len(found) > k:
+            nearest = numpy.argpartition(distances, k - 1)[:k]
+            found, distances = found[nearest], distances[nearest]
+        return found[numpy.argsort(distances, kind='stable')]
+
+    def cone(self, point, angle, arc_degrees, radius):
+        """Get living enemies within radius whose centers lie inside an arc facing angle (degrees)"""
+        found, offsets, _ = self._reach(point, radius)
+        facing = math.radians(angle)
+        bearings = numpy.arctan2(offsets[:, 1], offsets[:, 0])
+        # Wrap the angle between each enemy and the facing direction into [-pi, pi]
+        turn = (bearings - facing + math.pi) % (2 * math.pi) - math.pi
+        return found[numpy.abs(turn) <= math.radians(arc_degrees) / 2]
+
+    def line(self, start, angle, length, width):
+        """Get living enemies a swept segment of the given width passes through, in order along it"""
+        x, y = start
+        dx, dy = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        end_x, end_y = x + dx * length, y + dy * length
+        pad = width / 2 + (self.radii.max() if len(self.radii) else 0)
+        found = self._candidates(min(x, end_x) - pad, min(y, end_y) - pad,
+                                 max(x, end_x) + pad, max(y, end_y) + pad)
+
+        offsets = self.centers[found] - (x, y)
+        along = offsets[:, 0] * dx + offsets[:, 1] * dy
+        across = numpy.abs(offsets[:, 0] * dy - offsets[:, 1] * dx)
+        reach = self.radii[found]
+        hit = (along >= -reach) & (along <= length + reach) & (across <= width / 2 + reach)
+        found, along = found[hit], along[hit]
+        return found[numpy.argsort(along, kind='stable')]
+
+    def chain(self, start_index, hops, hop_range):
+        """Get a chain starting at one enemy that jumps to the nearest unhit enemy up to hops times"""
+        chain = [start_index]
+        for _ in range(hops):
+            found, _, distances = self._reach(self.centers[chain[-1]], hop_range)
+            fresh = ~numpy.isin(found, chain)
+            if not fresh.any():
+                break
+            chain.append(int(found[fresh][numpy.argmin(distances[fresh])]))
+        return numpy.array(chain, dtype=numpy.int64)
+
+    def segment_hits(self, starts, ends, radii):
+        """Sweep a batch of circles along segments and get every enemy each one touches
+
+        Returns (segment indices, enemy indices, fraction along the segment of the closest
+        approach). Candidate cells are expanded per segment and looked up in one pass, so
+        thousands of segments cost a handful of array operations.
+        """
+        empty = numpy.zeros(0, dtype=numpy.int64)
+        if not len(self.sorted_keys) or not len(starts):
+            return empty, empty, numpy.zeros(0)
+
+        # Cell range of each segment's bounding box, padded by the circle and the largest body
+        size = self.cell_size
+        pad = (radii + self.radii.max())[:, None]
+        low = numpy.floor((numpy.minimum(starts, ends) - pad) / size).astype(numpy.int64)
+        high = numpy.floor((numpy.maximum(starts, ends) + pad) / size).astype(numpy.int64)
+        spans = high - low + 1
+
+        # One row per (segment, cell) pair
+        cell_counts = spans[:, 0] * spans[:, 1]
+        cell_segments = numpy.repeat(numpy.arange(len(starts)), cell_counts)
+        local = numpy.arange(len(cell_segments)) - numpy.repeat(numpy.cumsum(cell_counts) - cell_counts, cell_counts)
+        rows = spans[cell_segments, 1]
+        cell_x = low[cell_segments, 0] + local // rows + CELL_KEY_OFFSET
+        cell_y = low[cell_segments, 1] + local % rows + CELL_KEY_OFFSET
+        keys = cell_x * CELL_KEY_STRIDE + cell_y
+
+        # One row per (segment, enemy in one of its cells) pair
+        first = numpy.searchsorted(self.sorted_keys, keys)
+        counts = numpy.searchsorted(self.sorted_keys, keys, side='right') - first
+        segments = numpy.repeat(cell_segments, counts)
+        slots = numpy.repeat(first, counts) + (numpy.arange(len(segments)) -
+                                               numpy.repeat(numpy.cumsum(counts) - counts, counts))
+        enemies = self.order[slots]
+        living = self.alive[enemies]
+        segments, enemies = segments[living], enemies[living]
+
+        # Closest approach of each enemy center to its segment
+        start = starts[segments]
+        path = ends[segments] - start
+        length_sq = (path * path).sum(axis=1)
+        along = ((self.centers[enemies] - start) * path).sum(axis=1) / numpy.maximum(length_sq, 1e-9)
+        along = numpy.clip(along, 0, 1)
+        gap = self.centers[enemies] - (start + path * along[:, None])
+        touching = numpy.hypot(gap[:, 0], gap[:, 1]) <= radii[segments] + self.radii[enemies]
+        return segments[touching], enemies[touching], along[touching]
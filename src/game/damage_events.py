@@ -0,0 +1,23 @@
+class DamageEvents:
+    """Per-tick buffer of damage events, each a (target, amount, crit, source) tuple
+
+    Attacks and contact hits only queue damage here. The game state resolves the whole
+    buffer once per tick, so health, deaths, rewards and score all change in one place.
+    """
+    def __init__(self):
+        self.events = []
+
+    def add(self, target, amount, crit=False, source=None):
+        """Queue damage against a player or enemy"""
+        self.events.append((target, amount, crit, source))
+
+    def drain(self):
+        """Take every queued event, leaving the buffer empty"""
+        events, self.events = self.events, []
+        return events
+
+    def clear(self):
+        self.events = []
+
+    def __len__(self):
+        return len(self.events)
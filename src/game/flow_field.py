@@ -0,0 +1,123 @@
+import heapq
+import math
+import numpy
+from game.settings import *
+
+# Neighbour steps with their length (diagonals cost more)
+NEIGHBOUR_STEPS = [(dx, dy, math.hypot(dx, dy)) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+class FlowField:
+    """Shared per-tile steering toward the player, rebuilt when the player changes tile"""
+    def __init__(self, tile_types, tile_features, tile_size):
+        self.tile_size = tile_size
+        self.rows = len(tile_types)
+        self.columns = len(tile_types[0]) if tile_types else 0
+
+        # Cost of entering each tile (inf for tiles blocked by decorations)
+        self.costs = numpy.full((self.rows, self.columns), numpy.inf)
+        for y in range(self.rows):
+            for x in range(self.columns):
+                if tile_features[y][x] not in PATH_BLOCKING_FEATURES:
+                    self.costs[y, x] = TILE_PATH_COSTS.get(tile_types[y][x], 1.0)
+
+        self.neighbours = self._build_neighbours()
+
+        self.goal = None
+        self.distances = numpy.full((self.rows, self.columns), numpy.inf)
+        # Pixel center of the tile to head for next, per tile
+        self.waypoints = numpy.zeros((self.rows, self.columns, 2))
+
+    def update(self, target_pos):
+        """Rebuild the field if the target has moved onto a different tile"""
+        goal = (min(max(int(target_pos[0] // self.tile_size), 0), self.columns - 1),
+                min(max(int(target_pos[1] // self.tile_size), 0), self.rows - 1))
+        if goal != self.goal:
+            self.goal = goal
+            self._compute_distances()
+            self._compute_waypoints()
+
+    def _build_neighbours(self):
+        """List each tile's enterable neighbours as (flat index, step cost) pairs
+
+        The costs never change, so the bounds, blocked-tile and corner checks are done once
+        here instead of on every rebuild.
+        """
+        costs = self.costs
+        neighbours = []
+        for y in range(self.rows):
+            for x in range(self.columns):
+                steps = []
+                for dx, dy, step in NEIGHBOUR_STEPS:
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < self.columns and 0 <= ny < self.rows):
+                        continue
+                    cost = costs[ny, nx]
+                    if cost == numpy.inf:
+                        continue
+                    # Don't cut corners past blocked tiles
+                    if dx and dy and (costs[y, nx] == numpy.inf or costs[ny, x] == numpy.inf):
+                        continue
+                    steps.append((ny * self.columns + nx, float(cost * step)))
+                neighbours.append(steps)
+        return neighbours
+
+    def _compute_distances(self):
+        """Dijkstra from the goal tile over the cost grid"""
+        # Plain lists index much faster than numpy arrays one element at a time
+        distances = [math.inf] * (self.rows * self.columns)
+        neighbours = self.neighbours
+        gx, gy = self.goal
+        goal = gy * self.columns + gx
+        distances[goal] = 0.0
+        queue = [(0.0, goal)]
+        pop, push = heapq.heappop, heapq.heappush
+
+        while queue:
+            distance, tile = pop(queue)
+            if distance > distances[tile]:
+                continue
+            for neighbour, step_cost in neighbours[tile]:
+                candidate = distance + step_cost
+                if candidate < distances[neighbour]:
+                    distances[neighbour] = candidate
+                    push(queue, (candidate, neighbour))
+
+        self.distances = numpy.array(distances).reshape(self.rows, self.columns)
+
+    def _compute_waypoints(self):
+        """Point every tile at the center of its lowest-distance neighbour"""
+        padded = numpy.pad(self.distances, 1, constant_values=numpy.inf)
+        blocked = numpy.pad(self.costs == numpy.inf, 1, constant_values=True)
+        best = self.distances.copy()
+        best_step = numpy.zeros((self.rows, self.columns, 2), dtype=int)
+
+        for dx, dy, _ in NEIGHBOUR_STEPS:
+            neighbour = padded[1 + dy:1 + dy + self.rows, 1 + dx:1 + dx + self.columns].copy()
+            if dx and dy:
+                # Match the corner rule used when computing distances
+                corner = (blocked[1:1 + self.rows, 1 + dx:1 + dx + self.columns] |
+                          blocked[1 + dy:1 + dy + self.rows, 1:1 + self.columns])
+                neighbour[corner] = numpy.inf
+            better = neighbour < best
+            best[better] = neighbour[better]
+            best_step[better] = (dx, dy)
+
+        ys, xs = numpy.mgrid[0:self.rows, 0:self.columns]
+        self.waypoints[..., 0] = (xs + best_step[..., 0] + 0.5) * self.tile_size
+        self.waypoints[..., 1] = (ys + best_step[..., 1] + 0.5) * self.tile_size
+
+    def sample(self, positions):
+        """Get the waypoint for each position, and a mask of positions the field can steer
+
+        Positions off the grid, on the goal tile or cut off from the goal are left for the
+        caller to steer directly.
+        """
+        columns = numpy.floor(positions[:, 0] / self.tile_size).astype(int)
+        rows = numpy.floor(positions[:, 1] / self.tile_size).astype(int)
+        inside = (columns >= 0) & (columns < self.columns) & (rows >= 0) & (rows < self.rows)
+
+        columns = numpy.where(inside, columns, 0)
+        rows = numpy.where(inside, rows, 0)
+        distances = self.distances[rows, columns]
+        steerable = inside & (distances > 0) & (distances < numpy.inf)
+        return self.waypoints[rows, columns], steerable
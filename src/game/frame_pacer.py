@@ -0,0 +1,87 @@
+import time
+from collections import deque
+import pygame
+from game.settings import *
+
+class FramePacer:
+    """Caps the frame rate by sleeping through most of each frame's spare time
+
+    OS sleeps can wake late, so the pacer sleeps until just before the deadline, less
+    however late recent sleeps have woken, and spins only for what is left. The CPU
+    stays idle while waiting but frames still land on time.
+    """
+    def __init__(self, target_fps=RENDER_FPS):
+        self.frame_seconds = 0  # 0 when uncapped
+        self.set_target(target_fps)
+        self.next_frame = time.perf_counter()
+        self.last_frame = self.next_frame
+        self.oversleep = 0.0  # Smoothed estimate of how late sleep wakes up
+        self.frame_times = deque(maxlen=FRAME_PACER_HISTORY)  # Recent frame times in seconds
+
+    def set_target(self, target_fps):
+        """Set the frame rate to hold, or 0 / None to run uncapped"""
+        self.target_fps = target_fps or 0
+        self.frame_seconds = 1.0 / self.target_fps if self.target_fps else 0
+
+    def wait(self, target_fps=None):
+        """Wait out the rest of the current frame, then start timing the next one
+
+        target_fps overrides the configured cap for this frame, e.g. to throttle menus.
+        """
+        frame_seconds = 1.0 / target_fps if target_fps else self.frame_seconds
+        if frame_seconds:
+            self.next_frame += frame_seconds
+            sleep_for = self.next_frame - time.perf_counter() - FRAME_PACER_SPIN_SECONDS - self.oversleep
+            if sleep_for > 0:
+                before = time.perf_counter()
+                time.sleep(sleep_for)
+                late = time.perf_counter() - before - sleep_for
+                self.oversleep += (max(late, 0) - self.oversleep) * 0.1
+            while time.perf_counter() < self.next_frame:
+                pass
+
+        now = time.perf_counter()
+        if now - self.next_frame > frame_seconds:
+            # A long frame (loading, a dragged window) shouldn't be followed by a burst of catch-up frames
+            self.next_frame = now
+        self._record_frame(now)
+
+    def wait_for_event(self, timeout_ms):
+        """Block until input arrives or timeout_ms passes, for screens with nothing animating
+
+        The event is put back on the queue for the main loop to handle as usual.
+        """
+        event = pygame.event.wait(timeout_ms)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+        now = time.perf_counter()
+        self.next_frame = now
+        self._record_frame(now)
+
+    def _record_frame(self, now):
+        self.frame_times.append(now - self.last_frame)
+        self.last_frame = now
+
+    def get_fps(self):
+        """Get the average frame rate over recent frames"""
+        if not self.frame_times:
+            return 0
+        return len(self.frame_times) / sum(self.frame_times)
+
+    def get_stats(self):
+        """Get frame-time statistics over recent frames, in milliseconds
+
+        Returns a dict with the mean, standard deviation (jitter), worst frame and the
+        average frame rate.
+        """
+        if not self.frame_times:
+            return {"mean_ms": 0, "jitter_ms": 0, "max_ms": 0, "fps": 0}
+        count = len(self.frame_times)
+        mean = sum(self.frame_times) / count
+        variance = sum((frame - mean) ** 2 for frame in self.frame_times) / count
+        return {
+            "mean_ms": mean * 1000,
+            "jitter_ms": variance ** 0.5 * 1000,
+            "max_ms": max(self.frame_times) * 1000,
+            "fps": 1 / mean if mean else 0
+        }
@@ -3,11 +3,19 @@ import random
 import math
 from game.settings import *
 from entities.player import Player
-from entities.enemy import Enemy
+from entities.enemy_manager import EnemyManager
 from graphics.terrain_generator import TerrainGenerator
 from graphics.character_generator import CharacterGenerator
 from ui.shop import Shop
 from ui.hud import HUD
+from ui.combat_numbers import CombatNumbers
+from game.spatial_grid import SpatialHashGrid
+from game.combat_queries import CombatQueries
+from game.scheduler import TickScheduler
+from game.damage_events import DamageEvents
+from game.hit_masks import HitMasks
+from game.round_stats import RoundStats
+from game.flow_field import FlowField
 from game.monster_config import (
     get_enemy_pool_for_round,
     get_monster_stats,
@@ -17,7 +25,10 @@ from game.monster_config import (
 )
 
 class GameState:
-    def __init__(self):
+    def __init__(self, settings_manager=None, headless=False):
+        self.settings_manager = settings_manager  # Player options such as combat numbers
+        self.headless = headless  # Skip purely visual updates when nothing will be drawn
+        
         # Initialize generators
         self.terrain_gen = TerrainGenerator(tile_size=32)
         self.char_gen = CharacterGenerator(size=32)
@@ -29,29 +40,63 @@ class GameState:
             seed=random.randint(0, 1000)
         )
         
+        # Cache grass tile positions so animated details don't sample the terrain every frame
+        self.grass_tiles = self._find_grass_tiles()
+        
+        # Shared enemy pathing around terrain features
+        self.flow_field = FlowField(self.terrain_gen.tile_types, self.terrain_gen.tile_features,
+                                    self.terrain_gen.tile_size)
+        self.collision_map = self.terrain_gen.collision_map
+        self.hit_masks = HitMasks()  # Sprite masks for contact hits that pass the grid check
+        self.hud = HUD()  # Initialize HUD
+        
+        self.new_game()
+
+    def new_game(self):
+        """Start a fresh run on the already generated map
+
+        Generating the terrain is the slow part of setting up, so restarting this way is
+        much cheaper than building a new GameState.
+        """
+        # Game clock every countdown is scheduled against
+        self.clock = TickScheduler()
+        self.terrain_gen.set_clock(self.clock)
+        
         # Create player with generated character sprite
-        self.player = Player(character_sprite=self.char_gen.generate_character())
-        self.enemies = []
+        character_sprite, animation_frames = self.char_gen.get_character()
+        self.player = Player(character_sprite=character_sprite, animation_frames=animation_frames)
+        self.player.set_collision_map(self.collision_map)
+        self.player.set_clock(self.clock)
+        self.enemy_manager = EnemyManager(self.clock, keep_corpses=not self.headless)  # Batch movement for live enemies
+        self.enemies = self.enemy_manager.enemies
+        self.enemy_grid = SpatialHashGrid()  # Rebuilt every tick for contact checks
+        self.combat_queries = CombatQueries()  # Rebuilt every tick for weapon targeting
+        self.player.set_combat_queries(self.combat_queries)
+        self.damage_events = DamageEvents()  # Damage queued during the tick, resolved in handle_combat
+        self.player.set_damage_events(self.damage_events)
         
         # Initialize UI elements
         self.shop = Shop()
         self.shop.set_player(self.player)  # Set player reference for shop
-        self.hud = HUD()  # Initialize HUD
+        self.combat_numbers = CombatNumbers(self.clock)
         
         # Game state
         self.state = GameStates.PLAYING  # Start directly in playing state
         self.score = 0
         self.current_round = STARTING_ROUND
-        self.round_timer = ROUND_DURATION
+        self.round_timer = None  # Scheduled end of the current round
+        self.round_stats = RoundStats(self.current_round, 0)  # Kills, damage and gold this round
         self.transition_timer = 0
-        self.shop_timer = 0
+        self.effect_time = 0.0  # BASE_TICK_RATE steps owed to the scenery effects
+        self.shop_end = 0  # Tick the shopping phase times out
+        self.backdrop = None  # World frozen behind the shop, drawn once per shopping phase
         self.items_bought_this_round = 0
         
         # Bonfire system
-        self.bonfire_cooldowns = {pos: 0 for pos in self.terrain_gen.bonfire_positions}
+        self.bonfire_ready_ticks = {pos: 0 for pos in self.terrain_gen.bonfire_positions}
         
         # Difficulty tracking
-        self.spawn_timer = 0
+        self.next_spawn = 0
         self.current_spawn_delay = ENEMY_SPAWN_DELAY
         
         # Start the first round immediately
@@ -59,29 +104,44 @@ class GameState:
 
     def start_new_round(self):
         """Initialize a new round with progressive difficulty"""
-        self.round_timer = ROUND_DURATION
-        self.enemies.clear()
+        if self.round_timer:
+            self.round_timer.cancel()
+        self.round_timer = self.clock.schedule(ROUND_DURATION, self.end_round)
+        self.enemy_manager.clear()
+        self.backdrop = None
+        self.player.projectiles.clear()
+        self.damage_events.clear()
+        self.combat_numbers.clear()
         self.items_bought_this_round = 0
+        self.round_stats = RoundStats(self.current_round, self.clock.tick)
         
         # Calculate round completion reward
         round_reward = int(BASE_ROUND_REWARD * (1 + REWARD_SCALING * (self.current_round - 1)))
         self.player.add_money(round_reward)
+        self.round_stats.gold_earned += round_reward
         
         # Update spawn mechanics for new round
         self.current_spawn_delay = max(FPS, ENEMY_SPAWN_DELAY * (SPAWN_RATE_DECREASE ** (self.current_round - 1)))
-        self.spawn_timer = 0
+        self.next_spawn = self.clock.deadline(self.current_spawn_delay)
         
         # Spawn initial enemies
         num_enemies = min(MAX_ENEMIES, STARTING_ENEMIES + (self.current_round - 1) * ENEMY_COUNT_INCREASE)
         for _ in range(num_enemies):
             self.spawn_enemy()
+        self.enemy_grid.rebuild(self.enemies)
+        self.combat_queries.rebuild(self.enemy_manager)
             
         self.state = GameStates.PLAYING
 
+    def end_round(self):
+        """Advance to the next round once the round timer runs out"""
+        self.current_round += 1
+        self.enter_shop_phase()
+        
     def enter_shop_phase(self):
         """Enter shopping phase between rounds"""
         self.state = GameStates.SHOPPING
-        self.shop_timer = SHOP_TIME_LIMIT
+        self.shop_end = self.clock.deadline(SHOP_TIME_LIMIT)
         self.shop.refresh_items()  # Refresh shop items for new round
         
         # Heal player partially between rounds
@@ -89,62 +149,55 @@ class GameState:
                                self.player.health + self.player.max_health * 0.3)
 
     def update(self):
+        if self.state in (GameStates.PLAYING, GameStates.SHOPPING):
+            self.clock.advance()  # Runs due timers, which may end the round
+        
         if self.state == GameStates.PLAYING:
             # Update game entities
-            self.player.set_current_enemies(self.enemies)  # Set current enemies for player
             self.player.update()
             self.update_enemies()
+            self.enemy_manager.update_corpses()
+            self.enemy_manager.sync()  # Copy batched positions onto enemy rects
+            self.enemy_grid.rebuild(self.enemies)  # Index enemies at their new positions
+            self.combat_queries.rebuild(self.enemy_manager)
             self.handle_combat()
             
-            # Update round timer
-            self.round_timer -= 1
-            if self.round_timer <= 0:
-                self.current_round += 1
-                self.state = GameStates.SHOPPING
-                self.shop.refresh_items()  # Refresh shop items for new round
-                self.shop_timer = SHOP_TIME_LIMIT
-                # Heal player partially between rounds
-                self.player.health = min(self.player.max_health, 
-                                       self.player.health + self.player.max_health * 0.3)
-            
-            # Update bonfire cooldowns and particles
-            for pos in self.bonfire_cooldowns:
-                if self.bonfire_cooldowns[pos] > 0:
-                    self.bonfire_cooldowns[pos] -= 1
-            
-            # Update particle effects
-            self.terrain_gen.update_particles()
-            
-            # Update grass animations
-            self.terrain_gen.update_animations()
-            
-            # Update weather effects
-            self.terrain_gen.update_weather()
+            if not self.headless:
+                self.combat_numbers.update()
+                
+                # Scenery effects are tuned per BASE_TICK_RATE tick, so step them at that rate
+                self.effect_time += TICK_SCALE
+                while self.effect_time >= 1:
+                    self.effect_time -= 1
+                    
+                    # Update particle effects
+                    self.terrain_gen.update_particles()
+                    
+                    # Update grass animations
+                    self.terrain_gen.update_animations()
+                    
+                    # Update weather effects
+                    self.terrain_gen.update_weather()
             
             # Check for bonfire healing
             self.check_bonfire_healing()
             
-            # Remove dead enemies and spawn new ones
-            self.enemies = [e for e in self.enemies if not e.is_dead]
+            # Replace killed enemies
             if len(self.enemies) < STARTING_ENEMIES + self.current_round - 1:
                 self.spawn_enemy()
                 
             # Progressive enemy spawning
-            self.spawn_timer += 1
-            if self.spawn_timer >= self.current_spawn_delay:
-                self.spawn_timer = 0
+            if self.clock.is_ready(self.next_spawn):
+                self.next_spawn = self.clock.deadline(self.current_spawn_delay)
                 if len(self.enemies) < min(MAX_ENEMIES, STARTING_ENEMIES + (self.current_round - 1) * ENEMY_COUNT_INCREASE):
                     self.spawn_enemy()
                     
         elif self.state == GameStates.SHOPPING:
-            # Update shop timer
-            self.shop_timer -= 1
-            
             # Handle shop interactions
             self.shop.update()
             
             # Check if shopping phase should end
-            if self.shop_timer <= 0 or self.items_bought_this_round >= ITEMS_PER_ROUND:
+            if self.clock.is_ready(self.shop_end) or self.items_bought_this_round >= ITEMS_PER_ROUND:
                 self.state = GameStates.PLAYING
                 self.start_new_round()
                 
@@ -152,39 +205,16 @@ class GameState:
             # Handle game over state
             pass
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        """Draw the current state, with entities alpha of the way through the last tick"""
         if self.state == GameStates.PLAYING:
-            # Draw base terrain
-            screen.blit(self.terrain, (0, 0))
-            
-            # Draw animated grass details
-            for y in range(SCREEN_HEIGHT // self.terrain_gen.tile_size):
-                for x in range(SCREEN_WIDTH // self.terrain_gen.tile_size):
-                    pos = (x * self.terrain_gen.tile_size, y * self.terrain_gen.tile_size)
-                    # Only animate grass tiles
-                    if self.terrain.get_at((pos[0], pos[1]))[:3] in self.terrain_gen.colors['grass']:
-                        self.terrain_gen.draw_animated_details(screen, pos, 'grass')
-            
-            # Draw bonfire effects
-            for pos in self.bonfire_cooldowns:
-                if self.bonfire_cooldowns[pos] > 0:
-                    progress = self.bonfire_cooldowns[pos] / BONFIRE_COOLDOWN
-                    radius = BONFIRE_HEAL_RADIUS * (1 - progress)
-                    pygame.draw.circle(screen, (*ORANGE, 30), pos, int(radius), 1)
-            
-            # Draw entities
-            self.player.draw(screen)
-            for enemy in self.enemies:
-                enemy.draw(screen)
-                
-            # Draw particle effects
-            self.terrain_gen.draw_particles(screen)
-            
-            # Draw weather effects
-            self.terrain_gen.draw_weather(screen)
-            
-            # Draw HUD
-            self.hud.draw(screen, self.player, self.score, self.current_round, self.round_timer)
+            # Draw world and HUD
+            self.interpolate(alpha)
+            self.draw_world(screen)
+            self.interpolate(1.0)
+            if self.show_combat_numbers():
+                self.combat_numbers.draw(screen)
+            self.hud.draw(screen, self.player, self.score, self.current_round, self.round_time_left())
             
         elif self.state == GameStates.SHOPPING:
             # Draw shop interface
@@ -193,13 +223,48 @@ class GameState:
         elif self.state == GameStates.GAME_OVER:
             self.draw_game_over(screen)
 
+    def draw_dirty(self, screen, renderer, alpha=1.0):
+        """Draw gameplay onto a persistent surface, restoring and marking only changed regions"""
+        # Erase last frame's entities from the cached static terrain
+        renderer.restore(screen, self.terrain)
+        
+        self._draw_bonfire_effects(screen)
+        for pos, ready_tick in self.bonfire_ready_ticks.items():
+            if not self.clock.is_ready(ready_tick):
+                renderer.mark((pos[0] - BONFIRE_HEAL_RADIUS, pos[1] - BONFIRE_HEAL_RADIUS,
+                               BONFIRE_HEAL_RADIUS * 2, BONFIRE_HEAL_RADIUS * 2))
+        
+        self.interpolate(alpha)
+        self._draw_entities(screen)
+        renderer.mark_all(self.player.get_dirty_rects())
+        for enemy in self.enemies:
+            renderer.mark(enemy.get_dirty_rect())
+        self.interpolate(1.0)
+        for corpse in self.enemy_manager.corpses:
+            renderer.mark(corpse.get_dirty_rect())
+        
+        self.terrain_gen.draw_particles(screen)
+        renderer.mark_all(self.terrain_gen.get_particle_bounds())
+        
+        # Weather covers the whole screen, which pushes the frame into a full flip
+        if self.terrain_gen.has_visible_weather():
+            self.terrain_gen.draw_weather(screen)
+            renderer.mark(screen.get_rect())
+        
+        if self.show_combat_numbers():
+            self.combat_numbers.draw(screen)
+            renderer.mark_all(self.combat_numbers.get_dirty_rects())
+        
+        self.hud.draw(screen, self.player, self.score, self.current_round, self.round_time_left())
+        renderer.mark_all(self.hud.dirty_rects)
+
     def draw_hud(self, screen):
         font = pygame.font.Font(None, 36)
         
         # Draw score and round info
         score_text = font.render(f'Score: {self.score}', True, WHITE)
         round_text = font.render(f'Round: {self.current_round}', True, WHITE)
-        timer_text = font.render(f'Time: {self.round_timer // FPS}s', True, WHITE)
+        timer_text = font.render(f'Time: {self.round_time_left() // FPS}s', True, WHITE)
         
         screen.blit(score_text, (10, 10))
         screen.blit(round_text, (10, 50))
@@ -248,9 +313,10 @@ class GameState:
         if selected_type is None:
             return
             
-        # Create enemy with scaled stats
-        enemy = Enemy()
+        # Take a pooled enemy and give it scaled stats
+        enemy = self.enemy_manager.acquire()
         enemy.set_monster_type(selected_type)
+        enemy.spawn_tick = self.clock.tick
         
         # Scale stats based on round number
         try:
@@ -265,26 +331,79 @@ class GameState:
             print(f"Selected type: {selected_type}, Round: {self.current_round}")
             return
         
-        # Add enemy to list
-        self.enemies.append(enemy)
+        # Add enemy to the batch update
+        self.enemy_manager.add(enemy)
 
     def update_enemies(self):
         """Update all enemies"""
-        for enemy in self.enemies:
-            enemy.update(self.player.rect.center)
+        self.flow_field.update(self.player.rect.center)  # Only rebuilt when the player changes tile
+        self.enemy_manager.update(self.player.rect.center, self.flow_field, self.collision_map)
 
     def handle_combat(self):
         """Handle combat between player and enemies"""
-        # Check for enemy attacks
-        for enemy in self.enemies:
-            if self.player.rect.colliderect(enemy.rect):
-                if self.player.take_damage(enemy.damage):
-                    # Player died
+        # Check for enemy attacks: the grid finds overlapping rects, masks confirm the sprites touch
+        touching = self.enemy_grid.query_rect(self.player.rect)
+        if touching:
+            player_sprite = self.player.get_hit_sprite()
+            for enemy in touching:
+                if self.hit_masks.overlap(player_sprite, self.player.rect, enemy.get_current_frame(), enemy.rect):
+                    self.damage_events.add(self.player, enemy.damage, source=enemy)
+
+        # Land projectiles, then player auto-attacks; both only queue their damage
+        self.player.update_projectiles()
+        self.player.attack()
+        self.resolve_damage()
+
+    def resolve_damage(self):
+        """Apply this tick's damage events in one pass: health, deaths, rewards and score"""
+        show_numbers = self.show_combat_numbers()
+        stats = self.round_stats
+        for target, amount, crit, source in self.damage_events.drain():
+            if target is self.player:
+                health = self.player.health
+                died = self.player.take_damage(amount)
+                stats.damage_taken += health - self.player.health
+                if show_numbers:
+                    self.combat_numbers.add(self.player.rect.midtop, health - self.player.health, "hurt")
+                if died:
                     self.state = GameStates.GAME_OVER
+                    self.damage_events.clear()
                     return
+                continue
+            
+            if target.is_dead:  # Killed by an earlier event this tick
+                continue
+            dealt = min(amount, target.health)  # Overkill isn't dealt
+            if show_numbers:
+                self.combat_numbers.add(target.rect.midtop, dealt, "crit" if crit else "hit")
+            stats.damage_dealt += dealt
+            if target.take_damage(amount):
+                self.score += 1
+                self.player.score += 1
+                self.player.add_money(ENEMY_KILL_REWARD)
+                stats.record_kill(self.clock.tick - target.spawn_tick, ENEMY_KILL_REWARD)
+                self.enemy_manager.release(target)  # Frees its slot; the corpse plays the death effects
 
-        # Player auto-attacks (damage is handled inside player class now)
-        self.player.attack()
+    def show_combat_numbers(self):
+        """Check the gameplay setting for floating damage numbers"""
+        if self.headless:
+            return False
+        if self.settings_manager is None:
+            return True
+        return self.settings_manager.get_setting("gameplay", "combat_numbers")
+
+    def interpolate(self, alpha):
+        """Move entity rects alpha of the way from their previous tick's positions for drawing
+
+        Rendering runs between simulation ticks, so blending the last two states keeps motion
+        smooth at any frame rate. Call with 1.0 afterwards to restore the simulated positions.
+        """
+        self.player.interpolate(alpha)
+        self.enemy_manager.sync(alpha)
+
+    def round_time_left(self):
+        """Get the ticks left in the current round"""
+        return self.clock.remaining(self.round_timer.deadline)
 
     def check_bonfire_healing(self):
         """Check if player is near a bonfire and apply healing"""
@@ -292,7 +411,7 @@ class GameState:
         
         for bonfire_pos in self.terrain_gen.bonfire_positions:
             # Skip if bonfire is on cooldown
-            if self.bonfire_cooldowns[bonfire_pos] > 0:
+            if not self.clock.is_ready(self.bonfire_ready_ticks[bonfire_pos]):
                 continue
                 
             # Check if player is in range
@@ -303,7 +422,7 @@ class GameState:
             if distance <= BONFIRE_HEAL_RADIUS:
                 # Heal player and start cooldown
                 self.player.heal(BONFIRE_HEAL_AMOUNT)
-                self.bonfire_cooldowns[bonfire_pos] = BONFIRE_COOLDOWN
+                self.bonfire_ready_ticks[bonfire_pos] = self.clock.deadline(BONFIRE_COOLDOWN)
                 # Create healing effect
                 self.create_heal_effect(player_center)
 
@@ -390,16 +509,26 @@ class GameState:
         elif self.state == GameStates.SHOPPING:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    self.state = GameStates.PLAYING
-                    self.start_new_round()  # Start next round when leaving shop
+                    self.leave_shop()  # Start next round when leaving shop
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     if self.shop.selected_item is not None:
-                        if self.shop.purchase_selected_item(self.player):
-                            self.items_bought_this_round += 1
-                            if self.items_bought_this_round >= ITEMS_PER_ROUND:
-                                self.state = GameStates.PLAYING
-                                self.start_new_round()  # Start next round after max purchases 
+                        self.purchase_selected_item()
+
+    def purchase_selected_item(self):
+        """Buy the shop's selected item, starting the next round once the purchase limit is hit"""
+        if self.shop.purchase_selected_item(self.player):
+            self.items_bought_this_round += 1
+            if self.items_bought_this_round >= ITEMS_PER_ROUND:
+                self.state = GameStates.PLAYING
+                self.start_new_round()  # Start next round after max purchases
+            return True
+        return False
+
+    def leave_shop(self):
+        """End the shopping phase early and start the next round"""
+        self.state = GameStates.PLAYING
+        self.start_new_round()
 
     def draw_world(self, screen):
         """Draw only the game world without UI elements"""
@@ -407,27 +536,49 @@ class GameState:
         screen.blit(self.terrain, (0, 0))
         
         # Draw animated grass details
-        for y in range(SCREEN_HEIGHT // self.terrain_gen.tile_size):
-            for x in range(SCREEN_WIDTH // self.terrain_gen.tile_size):
-                pos = (x * self.terrain_gen.tile_size, y * self.terrain_gen.tile_size)
-                # Only animate grass tiles
-                if self.terrain.get_at((pos[0], pos[1]))[:3] in self.terrain_gen.colors['grass']:
-                    self.terrain_gen.draw_animated_details(screen, pos, 'grass')
+        for pos in self.grass_tiles:
+            self.terrain_gen.draw_animated_details(screen, pos, 'grass')
         
-        # Draw bonfire effects
-        for pos in self.bonfire_cooldowns:
-            if self.bonfire_cooldowns[pos] > 0:
-                progress = self.bonfire_cooldowns[pos] / BONFIRE_COOLDOWN
-                radius = BONFIRE_HEAL_RADIUS * (1 - progress)
-                pygame.draw.circle(screen, (*ORANGE, 30), pos, int(radius), 1)
-        
-        # Draw entities
-        self.player.draw(screen)
-        for enemy in self.enemies:
-            enemy.draw(screen)
+        self._draw_bonfire_effects(screen)
+        self._draw_entities(screen)
             
         # Draw particle effects
         self.terrain_gen.draw_particles(screen)
         
         # Draw weather effects
-        self.terrain_gen.draw_weather(screen) 
\ No newline at end of file
+        self.terrain_gen.draw_weather(screen)
+
+    def draw_backdrop(self, screen):
+        """Draw the world as it was when shopping began, rendering it only the first time"""
+        if self.backdrop is None:
+            self.backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.draw_world(self.backdrop)
+        screen.blit(self.backdrop, (0, 0))
+
+    def _find_grass_tiles(self):
+        """Find the positions of grass tiles in the generated terrain"""
+        grass_tiles = []
+        tile_size = self.terrain_gen.tile_size
+        for y in range(SCREEN_HEIGHT // tile_size):
+            for x in range(SCREEN_WIDTH // tile_size):
+                pos = (x * tile_size, y * tile_size)
+                # Only animate grass tiles
+                if self.terrain.get_at(pos)[:3] in self.terrain_gen.colors['grass']:
+                    grass_tiles.append(pos)
+        return grass_tiles
+
+    def _draw_bonfire_effects(self, screen):
+        """Draw the cooldown rings of recently used bonfires"""
+        for pos, ready_tick in self.bonfire_ready_ticks.items():
+            if not self.clock.is_ready(ready_tick):
+                progress = self.clock.remaining(ready_tick) / BONFIRE_COOLDOWN
+                radius = BONFIRE_HEAL_RADIUS * (1 - progress)
+                pygame.draw.circle(screen, (*ORANGE, 30), pos, int(radius), 1)
+
+    def _draw_entities(self, screen):
+        """Draw corpses underneath the player and all enemies"""
+        for corpse in self.enemy_manager.corpses:
+            corpse.draw(screen)
+        self.player.draw(screen)
+        for enemy in self.enemies:
+            enemy.draw(screen)
@@ -0,0 +1,29 @@
+import weakref
+import pygame
+
+class HitMasks:
+    """Pixel masks for sprite surfaces, built on first use and kept while the surface lives
+
+    Sprites are already cached per animation frame, so each frame's mask is built once and
+    shared by every entity showing it. One-off surfaces drop their mask when they are freed.
+    """
+    def __init__(self):
+        self.masks = weakref.WeakKeyDictionary()
+
+    def get(self, surface):
+        """Get the mask of a surface's opaque pixels"""
+        mask = self.masks.get(surface)
+        if mask is None:
+            mask = self.masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def overlap(self, surface, rect, other_surface, other_rect):
+        """Check whether two sprites drawn at their rects' top-left corners share an opaque pixel
+
+        Meant for pairs whose rects already overlap; an entity without a sprite counts as
+        solid, so the pair is treated as touching.
+        """
+        if surface is None or other_surface is None:
+            return True
+        offset = (other_rect.x - rect.x, other_rect.y - rect.y)
+        return self.get(surface).overlap(self.get(other_surface), offset) is not None
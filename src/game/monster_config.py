@@ -1,6 +1,10 @@
 from enum import Enum
+import colorsys
 import pygame
 
+# Number of colour variants per monster type (variant 0 keeps the configured colours)
+PALETTE_VARIANT_COUNT = 6
+
 class MonsterType(Enum):
     # Basic Enemies (Tier 1)
     SLIME = "slime"
@@ -62,13 +66,17 @@ def get_monster_stats(monster_type: MonsterType, round_number: int = 1):
     # Scale stats based on round number (10% increase per round after base round)
     base_round = MONSTER_TIERS[monster_type].value * 2  # Higher tier enemies scale from later rounds
     if round_number > base_round:
-        scaling = 1 + (round_number - base_round) * 0.1
+        scaling = 1 + (round_number - base_round) * ROUND_STAT_SCALING
         base_stats["health"] = int(base_stats["health"] * scaling)
         base_stats["damage"] = int(base_stats["damage"] * scaling)
-        base_stats["exp_reward"] = int(base_stats["exp_reward"] * (1 + (round_number - base_round) * 0.05))
+        base_stats["exp_reward"] = int(base_stats["exp_reward"] * (1 + (round_number - base_round) * ROUND_REWARD_SCALING))
     
     return base_stats
 
+# Per-round growth past a tier's base round
+ROUND_STAT_SCALING = 0.1  # Health and damage
+ROUND_REWARD_SCALING = 0.05  # Kill reward
+
 # Mapping of rounds to difficulty weights
 ROUND_DIFFICULTY = {
     # Round: {Tier: Spawn Weight}
@@ -639,6 +647,16 @@ MONSTER_CONFIG = {
     }
 }
 
+# How strongly each monster type steers away from its neighbours (1.0 when not listed)
+SEPARATION_STRENGTH = {
+    MonsterType.SLIME: 0.8,     # Squishy, bunches up a little
+    MonsterType.BAT: 0.5,       # Flies over the crowd
+    MonsterType.GHOST: 0.0,     # Drifts through everything
+    MonsterType.GOLEM: 1.5,     # Heavy, holds its space
+    MonsterType.DRAGON: 1.3,
+    MonsterType.DEMON_LORD: 1.5
+}
+
 # Helper functions for accessing monster configuration
 def get_monster_config(monster_type: MonsterType):
     """Get the configuration for a specific monster type"""
@@ -652,6 +670,25 @@ def get_monster_colors(monster_type: MonsterType):
     """Get the color palette for a specific monster type"""
     return MONSTER_CONFIG[monster_type]["colors"]
 
+def get_monster_palette(monster_type: MonsterType, palette_index: int):
+    """Get the colour remapping for a palette variant by rotating the hue of the type's colours"""
+    if palette_index % PALETTE_VARIANT_COUNT == 0:
+        return {}
+    
+    hue_shift = palette_index / PALETTE_VARIANT_COUNT
+    palette = {}
+    for colors in MONSTER_CONFIG[monster_type]["colors"].values():
+        for color in colors:
+            rgb = tuple(color[:3])
+            h, s, v = colorsys.rgb_to_hsv(*(c / 255 for c in rgb))
+            shifted = colorsys.hsv_to_rgb((h + hue_shift) % 1.0, s, v)
+            palette[rgb] = tuple(int(round(c * 255)) for c in shifted)
+    return palette
+
+def get_separation_strength(monster_type: MonsterType):
+    """Get how strongly a monster type is pushed apart from nearby monsters"""
+    return SEPARATION_STRENGTH.get(monster_type, 1.0)
+
 def get_death_config(monster_type: MonsterType):
     """Get the death animation configuration for a specific monster type"""
     return MONSTER_CONFIG[monster_type]["death_animation"] 
\ No newline at end of file
@@ -0,0 +1,38 @@
+class RoundStats:
+    """Running totals for the current round, read by the simulation tools for balance work
+
+    Counters only change where damage is resolved, so keeping them costs a few additions
+    per hit whether or not anything reads them.
+    """
+    __slots__ = ('round', 'start_tick', 'kills', 'kill_ticks', 'damage_taken', 'damage_dealt', 'gold_earned')
+
+    def __init__(self, round_number, start_tick):
+        self.round = round_number
+        self.start_tick = start_tick
+        self.kills = 0
+        self.kill_ticks = 0  # Ticks from spawn to death, summed over killed enemies
+        self.damage_taken = 0
+        self.damage_dealt = 0
+        self.gold_earned = 0
+
+    def record_kill(self, ticks_alive, reward):
+        self.kills += 1
+        self.kill_ticks += ticks_alive
+        self.gold_earned += reward
+
+    def get_time_to_kill(self):
+        """Get the mean ticks an enemy lived before being killed, or 0 with no kills"""
+        return self.kill_ticks / self.kills if self.kills else 0
+
+    def as_dict(self, end_tick, survived):
+        """Get the round's totals as a flat record"""
+        return {
+            "round": self.round,
+            "survived": survived,
+            "ticks": end_tick - self.start_tick,
+            "kills": self.kills,
+            "time_to_kill": self.get_time_to_kill(),
+            "damage_taken": self.damage_taken,
+            "damage_dealt": self.damage_dealt,
+            "gold_earned": self.gold_earned
+        }
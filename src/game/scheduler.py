@@ -0,0 +1,49 @@
+import heapq
+import itertools
+
+class Timer:
+    """Handle for a scheduled callback"""
+    def __init__(self, deadline, callback):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class TickScheduler:
+    """Absolute tick clock with a min-heap of pending callbacks
+
+    Systems either schedule a callback, or keep a deadline tick and check it with
+    is_ready, so nothing counts down per frame and a timer fires the same way however
+    often its owner is called within a tick.
+    """
+    def __init__(self):
+        self.tick = 0
+        self.timers = []  # Min-heap of (deadline, order, timer)
+        self.order = itertools.count()  # Fires timers sharing a deadline in the order they were scheduled
+
+    def advance(self):
+        """Move to the next tick and run every callback that has come due"""
+        self.tick += 1
+        while self.timers and self.timers[0][0] <= self.tick:
+            _, _, timer = heapq.heappop(self.timers)
+            if not timer.cancelled:
+                timer.callback()
+
+    def schedule(self, delay, callback):
+        """Run a callback delay ticks from now"""
+        timer = Timer(self.tick + max(1, int(delay)), callback)
+        heapq.heappush(self.timers, (timer.deadline, next(self.order), timer))
+        return timer
+
+    def deadline(self, delay):
+        """Get the tick delay ticks from now"""
+        return self.tick + int(delay)
+
+    def is_ready(self, deadline):
+        return self.tick >= deadline
+
+    def remaining(self, deadline):
+        """Get the ticks left until a deadline"""
+        return max(0, deadline - self.tick)
@@ -1,7 +1,18 @@
 # Screen settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
-FPS = 60
+TICK_RATE = 60  # Simulation ticks per second, independent of the render rate
+FPS = TICK_RATE  # Durations written as seconds * FPS are counted in simulation ticks
+BASE_TICK_RATE = 60  # Tick rate per-tick speeds (stats, monster configs, particles) are tuned at
+TICK_SCALE = BASE_TICK_RATE / TICK_RATE  # Per-tick movement is multiplied by this so it holds per second
+RENDER_FPS = 144  # Default cap on rendered frames per second
+FPS_LIMIT_OPTIONS = [60, 120, 144, 240, 0]  # Frame caps offered in the graphics menu; 0 is uncapped
+FRAME_PACER_SPIN_SECONDS = 0.0005  # Spare frame time spent spinning instead of sleeping, for precision
+FRAME_PACER_HISTORY = 120  # Frames kept for frame-time statistics
+MENU_FPS = 30  # Frame cap for the animated menus
+IDLE_WAKE_MS = 250  # How often static screens wake without input, so timers like the shop limit still run
+MAX_CATCH_UP_TICKS = 5  # Most ticks simulated per rendered frame; time beyond that is dropped
+INTERPOLATION_SNAP_DISTANCE = 64  # Entities that moved further in one tick (teleports) aren't interpolated
 
 # Colors
 BLACK = (0, 0, 0)
@@ -29,6 +40,8 @@ PLAYER_BASE_STATS = {
     "move_speed": 6,
     "defense": 10,
     "attack_range": 150,
+    "projectile_speed": 1.0,  # Multiplier on weapon projectile speed
+    "projectile_size": 1.0,  # Multiplier on projectile hit radius
 }
 
 # Enemy settings
@@ -44,7 +57,7 @@ ENEMY_BASE_STATS = {
 # Bonfire settings
 BONFIRE_HEAL_AMOUNT = 75       # Increased healing amount
 BONFIRE_HEAL_RADIUS = 48       # Increased activation radius
-BONFIRE_COOLDOWN = 180         # Reduced cooldown to 3 seconds
+BONFIRE_COOLDOWN = 3 * FPS     # Reduced cooldown to 3 seconds
 BONFIRE_MIN_DISTANCE = 150     # Minimum distance between bonfires
 BONFIRE_COUNT = 5              # Number of bonfires to spawn
 
@@ -65,6 +78,91 @@ ITEM_RARITY = {
 SHADER_ENABLED = True
 POST_PROCESSING = True 
 
+# Dirty-rect rendering
+DIRTY_RECT_FULL_FLIP_THRESHOLD = 0.4  # Fall back to a full flip above this fraction of the screen
+PLAYER_EFFECT_MARGIN = 110  # Reach of weapons and attack effects around the player
+
+# Weapon sprite cache
+WEAPON_ANGLE_STEPS = 64  # Pre-rendered rotations per weapon pose
+WEAPON_FRAME_RADIUS = 80  # Half-size of the canvas weapon poses are rendered on
+
+# Spatial index
+SPATIAL_GRID_CELL_SIZE = 64  # Cell size of the enemy grid, about two enemy widths
+
+# Combat queries
+PROJECTILE_HIT_WIDTH = 8  # Width of the path arrows sweep
+
+# Projectiles
+PROJECTILE_CAPACITY = 4096  # Most live projectiles; extra shots are dropped
+PROJECTILE_RADIUS = 4  # Hit radius before projectile_size bonuses
+PROJECTILE_LIFETIME = FPS * 2  # Ticks before a projectile fizzles out
+PROJECTILE_BOUNCE_RANGE = 150  # How far a bouncing projectile looks for its next target
+PROJECTILE_SCREEN_MARGIN = 50  # Projectiles this far off screen are dropped
+PROJECTILE_COLORS = {
+    "Magic Wand": (170, 120, 255),
+    "Knife": (210, 210, 220)
+}
+
+# Combat numbers
+COMBAT_NUMBER_STYLES = {  # Color and font size of each kind of number
+    "hit": (WHITE, 22),
+    "crit": (YELLOW, 30),
+    "hurt": (RED, 24)
+}
+COMBAT_NUMBER_LIFETIME = FPS  # Ticks a number stays on screen
+COMBAT_NUMBER_RISE = TICK_SCALE  # Pixels per tick numbers float upward, 60 a second
+COMBAT_NUMBER_FADE_STEPS = 4  # Pre-rendered transparency levels per glyph
+COMBAT_NUMBER_LIMIT = 400  # Oldest numbers are dropped past this
+COMBAT_NUMBER_SPREAD = 8  # Random horizontal offset so stacked hits stay readable
+
+# Headless simulation
+SIM_FLEE_RADIUS = 250  # Enemies closer than this push the kiting policy away
+SIM_CENTER_PULL = 0.004  # How strongly the kiting policy drifts back toward the middle of the screen
+SIM_WANDER_TICKS = FPS  # Ticks the random-walk policy keeps one heading
+SIM_OBSERVED_ENEMIES = 8  # Nearest enemies included in vector environment observations
+SIM_GRID_SIZE = (32, 18)  # Columns and rows of the downsampled grid observation
+SIM_KILL_REWARD = 1.0  # Reward per enemy killed
+SIM_HURT_PENALTY = 0.02  # Penalty per point of damage taken
+SIM_DEATH_PENALTY = 10.0  # Penalty for dying
+
+# Crowd separation
+ENEMY_SEPARATION_RADIUS = 28  # Enemies closer than this push each other apart
+ENEMY_SEPARATION_PUSH = 8 * TICK_SCALE  # Most pixels per tick separation can move an enemy, 480 a second
+ENEMY_SEPARATION_CELL_CAPACITY = 8  # Neighbours considered per grid cell
+
+# Special movement
+SLIME_BOUNCE_INTERVAL = FPS // 2  # Ticks between slime hops
+DEMON_TELEPORT_INTERVAL = 3 * FPS  # Ticks between demon teleports
+
+# Flow-field pathing
+TILE_PATH_COSTS = {'grass': 1.0, 'path': 0.8, 'stone': 1.4}  # Movement cost per terrain type
+PATH_BLOCKING_FEATURES = ('tree', 'crystal', 'ruins')  # Decorations enemies path around
+
+# Terrain collision
+COLLISION_CELL_SIZE = 8  # Pixel size of a collision map cell
+COLLISION_FOOTPRINTS = {  # Solid part of each decoration as (x, y, width, height) within its tile
+    'tree': (10, 12, 12, 16),
+    'crystal': (8, 8, 16, 16),
+    'ruins': (4, 4, 24, 24)
+}
+BONFIRE_COLLISION_SIZE = 16  # Solid stone ring around each bonfire's center
+
+# Monster animation
+MONSTER_IDLE_FRAMES = 8  # Frames in each monster's idle cycle
+MONSTER_WALK_FRAMES = 8  # Frames in each monster's walk cycle
+MONSTER_ANIMATION_TICKS = max(1, FPS // 12)  # Game ticks each monster animation frame is shown
+CORPSE_FRAME_TICKS = max(1, FPS // 4)  # Game ticks each death animation frame is shown
+CORPSE_FADE_START = 3 * FPS  # Ticks after death before the body starts fading
+CORPSE_FADE_TICKS = FPS  # Ticks the body takes to fade out
+
+# Asset pipeline
+ASSET_CACHE_DIR = "asset_cache"  # Pre-generated asset buffers, relative to the working directory
+ASSET_CACHE_VERSION = 1  # Bump when the cache layout changes
+ASSET_WORKERS = 0  # Worker processes used to generate assets (0 = one per CPU)
+MONSTER_SPRITE_VARIANTS = 4  # Pre-generated sprites per monster type
+CHARACTER_VARIANTS = 6  # Pre-generated player characters
+TERRAIN_TILE_VARIANTS = 16  # Pre-generated stamps per terrain tile type
+
 # Round settings
 ROUND_DURATION = 60 * FPS  # 1 minute per round (reduced from 3 minutes)
 ROUND_BREAK_DURATION = 10 * FPS  # 10 seconds between rounds (reduced from 20)
@@ -249,6 +347,8 @@ MENU_OPTIONS = {
         "Resolution",
         "Fullscreen",
         "VSync",
+        "FPS Limit",
+        "Dirty Rects",
         "Effects Quality",
         "Back"
     ],
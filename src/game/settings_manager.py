@@ -10,6 +10,8 @@ class SettingsManager:
                 "resolution": (1280, 720),
                 "fullscreen": False,
                 "vsync": True,
+                "fps_limit": RENDER_FPS,
+                "dirty_rects": False,
                 "effects_quality": "High"
             },
             "sound": {
@@ -129,6 +131,8 @@ class SettingsManager:
                 "resolution": (1280, 720),
                 "fullscreen": False,
                 "vsync": True,
+                "fps_limit": RENDER_FPS,
+                "dirty_rects": False,
                 "effects_quality": "High"
             },
             "sound": {
@@ -9,26 +9,38 @@ class SoundManager:
         self.sounds = {}
         self.create_sounds()
         
-    def create_sounds(self):
-        """Create all game sounds programmatically"""
-        # Menu sounds
-        self.sounds["menu_select"] = self.create_menu_select_sound()
-        self.sounds["menu_back"] = self.create_menu_back_sound()
-        self.sounds["menu_confirm"] = self.create_menu_confirm_sound()
-        
-        # Combat sounds
-        self.sounds["player_hit"] = self.create_hit_sound()
-        self.sounds["enemy_hit"] = self.create_enemy_hit_sound()
-        self.sounds["player_death"] = self.create_death_sound()
-        self.sounds["enemy_death"] = self.create_enemy_death_sound()
+    # Sample buffers restored by the asset pipeline, keyed by sound name
+    sample_cache = {}
         
-        # Item sounds
-        self.sounds["pickup_gold"] = self.create_pickup_sound()
-        self.sounds["buy_item"] = self.create_buy_sound()
-        
-        # Ambient sounds
-        self.sounds["level_up"] = self.create_level_up_sound()
-        self.sounds["game_over"] = self.create_game_over_sound()
+    def create_sounds(self):
+        """Create all game sounds, using pre-generated samples when available"""
+        samples = SoundManager.sample_cache or self.synthesize_samples()
+        for name, stereo in samples.items():
+            self.sounds[name] = pygame.sndarray.make_sound(stereo)
+            
+    @classmethod
+    def synthesize_samples(cls):
+        """Synthesize the stereo sample buffers for all game sounds"""
+        return {
+            # Menu sounds
+            "menu_select": cls.create_menu_select_sound(),
+            "menu_back": cls.create_menu_back_sound(),
+            "menu_confirm": cls.create_menu_confirm_sound(),
+            
+            # Combat sounds
+            "player_hit": cls.create_hit_sound(),
+            "enemy_hit": cls.create_enemy_hit_sound(),
+            "player_death": cls.create_death_sound(),
+            "enemy_death": cls.create_enemy_death_sound(),
+            
+            # Item sounds
+            "pickup_gold": cls.create_pickup_sound(),
+            "buy_item": cls.create_buy_sound(),
+            
+            # Ambient sounds
+            "level_up": cls.create_level_up_sound(),
+            "game_over": cls.create_game_over_sound()
+        }
         
     def create_sine_wave(self, frequency, duration, volume=0.5):
         """Create a sine wave sound"""
@@ -40,7 +52,8 @@ class SoundManager:
         stereo = np.array([wave, wave]).T.copy()
         return pygame.sndarray.make_sound(stereo)
         
-    def create_menu_select_sound(self):
+    @staticmethod
+    def create_menu_select_sound():
         """Create a dark, ethereal menu selection sound"""
         duration = 0.15
         sample_rate = 44100
@@ -50,9 +63,10 @@ class SoundManager:
         wave = wave * np.exp(-4 * t)
         wave = (wave * 24000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_menu_back_sound(self):
+    @staticmethod
+    def create_menu_back_sound():
         """Create an eerie menu back sound"""
         duration = 0.2
         sample_rate = 44100
@@ -61,9 +75,10 @@ class SoundManager:
         wave = np.sin(2 * np.pi * freq * t) * np.exp(-3 * t)
         wave = (wave * 24000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_menu_confirm_sound(self):
+    @staticmethod
+    def create_menu_confirm_sound():
         """Create a dark, resonant confirmation sound"""
         duration = 0.3
         sample_rate = 44100
@@ -74,9 +89,10 @@ class SoundManager:
         wave = wave * (1 - np.exp(-5 * t))
         wave = (wave * 20000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_hit_sound(self):
+    @staticmethod
+    def create_hit_sound():
         """Create a meaty, impactful hit sound"""
         duration = 0.15
         sample_rate = 44100
@@ -87,9 +103,10 @@ class SoundManager:
         wave = (noise + base) * np.exp(-15 * t)
         wave = (wave * 28000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_enemy_hit_sound(self):
+    @staticmethod
+    def create_enemy_hit_sound():
         """Create a grotesque enemy hit sound"""
         duration = 0.2
         sample_rate = 44100
@@ -99,9 +116,10 @@ class SoundManager:
         wave *= np.exp(-10 * t)
         wave = (wave * 28000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_death_sound(self):
+    @staticmethod
+    def create_death_sound():
         """Create an echoing death sound"""
         duration = 0.8
         sample_rate = 44100
@@ -114,9 +132,10 @@ class SoundManager:
         wave = (wave + echo) * np.exp(-2 * t)
         wave = (wave * 28000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_enemy_death_sound(self):
+    @staticmethod
+    def create_enemy_death_sound():
         """Create a demonic enemy death sound"""
         duration = 0.4
         sample_rate = 44100
@@ -128,9 +147,10 @@ class SoundManager:
         wave = np.clip(wave * 1.5, -1, 1) * np.exp(-4 * t)
         wave = (wave * 28000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_pickup_sound(self):
+    @staticmethod
+    def create_pickup_sound():
         """Create a mystical pickup sound"""
         duration = 0.2
         sample_rate = 44100
@@ -141,9 +161,10 @@ class SoundManager:
         wave = wave * (1 - np.exp(-10 * t))
         wave = (wave * 20000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_buy_sound(self):
+    @staticmethod
+    def create_buy_sound():
         """Create a mystical item purchase sound"""
         duration = 0.3
         sample_rate = 44100
@@ -154,9 +175,10 @@ class SoundManager:
         wave = wave * (1 - np.exp(-8 * t))
         wave = (wave * 20000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_level_up_sound(self):
+    @staticmethod
+    def create_level_up_sound():
         """Create an ominous level up sound"""
         duration = 0.6
         sample_rate = 44100
@@ -168,9 +190,10 @@ class SoundManager:
         wave = wave * (1 - np.exp(-5 * t))
         wave = (wave * 24000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
-    def create_game_over_sound(self):
+    @staticmethod
+    def create_game_over_sound():
         """Create a haunting game over sound"""
         duration = 1.5
         sample_rate = 44100
@@ -184,7 +207,7 @@ class SoundManager:
         wave = (wave + echo) * np.exp(-1 * t)
         wave = (wave * 28000).astype(np.int16)
         stereo = np.array([wave, wave]).T.copy()
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
         
     def play_sound(self, sound_name):
         """Play a sound with the current volume settings"""
@@ -0,0 +1,106 @@
+import math
+import pygame
+from game.settings import *
+
+class SpatialHashGrid:
+    """Uniform grid that buckets entities by the cells their rects overlap"""
+    def __init__(self, cell_size=SPATIAL_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entities = []
+
+    def rebuild(self, entities):
+        """Re-bucket all living entities from their current rects"""
+        self.cells.clear()
+        self.entities = entities
+        for entity in entities:
+            if not entity.is_dead:
+                self.insert(entity)
+
+    def insert(self, entity):
+        """Add an entity to every cell its rect overlaps"""
+        for key in self._cells_in_rect(entity.rect):
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [entity]
+            else:
+                bucket.append(entity)
+
+    def _cells_in_rect(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cx, cy
+
+    def query_rect(self, rect):
+        """Get living entities whose rects overlap the given rect"""
+        rect = pygame.Rect(rect)
+        found = []
+        seen = set()
+        for key in self._cells_in_rect(rect):
+            for entity in self.cells.get(key, ()):
+                if entity in seen:
+                    continue
+                seen.add(entity)
+                if not entity.is_dead and entity.rect.colliderect(rect):
+                    found.append(entity)
+        return found
+
+    def query_radius(self, center, radius):
+        """Get living entities whose centers lie within radius of a point"""
+        x, y = center
+        bounds_size = int(radius * 2) + 1
+        candidates = self.query_rect((int(x - radius), int(y - radius), bounds_size, bounds_size))
+
+        radius_sq = radius * radius
+        found = []
+        for entity in candidates:
+            dx = entity.rect.centerx - x
+            dy = entity.rect.centery - y
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(entity)
+        return found
+
+    def nearest(self, center, max_radius):
+        """Get the living entity whose center is closest to a point, searching ring by ring"""
+        if not self.cells:
+            return None
+
+        x, y = center
+        size = self.cell_size
+        cx, cy = int(x // size), int(y // size)
+        max_radius_sq = max_radius * max_radius
+        max_ring = int(math.ceil(max_radius / size)) + 1
+
+        closest = None
+        closest_sq = float('inf')
+        seen = set()
+        for ring in range(max_ring + 1):
+            for key in self._ring_cells(cx, cy, ring):
+                for entity in self.cells.get(key, ()):
+                    if entity in seen or entity.is_dead:
+                        continue
+                    seen.add(entity)
+                    dx = entity.rect.centerx - x
+                    dy = entity.rect.centery - y
+                    distance_sq = dx * dx + dy * dy
+                    if distance_sq <= max_radius_sq and distance_sq < closest_sq:
+                        closest_sq = distance_sq
+                        closest = entity
+
+            # Anything in a further ring is at least this far away
+            reach = ring * size
+            if closest is not None and closest_sq <= reach * reach:
+                break
+        return closest
+
+    def _ring_cells(self, cx, cy, ring):
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
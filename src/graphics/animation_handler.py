@@ -2,6 +2,7 @@ import pygame
 import math
 import random
 from enum import Enum
+from game.settings import FPS
 
 class EaseType(Enum):
     LINEAR = 0
@@ -57,24 +58,38 @@ class AnimationState:
             return 0.5 * math.pow(2, -10 * (progress - 1)) * math.sin((progress - 1.1) * 5 * math.pi) + 1
 
 class AnimationHandler:
-    def __init__(self, base_sprite):
+    def __init__(self, base_sprite, frames=None):
         self.base_sprite = base_sprite
         self.sprite_size = base_sprite.get_width()
-        self.current_time = 0
-        self.animation_states = self._create_animation_states()
+        self.clock = None  # Game clock the animation is timed against
+        self.state_start = 0  # Tick the current state started on
+        self.animation_states = self._create_animation_states(frames)
         self.current_state = self.animation_states['idle']
-        self.transition_time = 0
-        self.transition_duration = 5
+        self.transition_start = None  # Tick the blend into the current state started on
+        self.transition_duration = max(1, FPS // 12)
         self.prev_frame = self.current_state.frames[0].copy()
         self.next_frame = None
         
-    def _create_animation_states(self):
+    def _create_animation_states(self, frames=None):
+        # Use pre-generated frames when provided, otherwise build them from the base sprite
+        if frames is None:
+            frames = self.generate_frames()
         return {
-            'idle': AnimationState('idle', self._generate_idle_frames(), 60, True, None, EaseType.EASE_IN_OUT),
-            'walk': AnimationState('walk', self._generate_walk_frames(), 48, True, None, EaseType.EASE_IN_OUT),
-            'attack': AnimationState('attack', self._generate_attack_frames(), 30, False, 'idle', EaseType.EASE_OUT),
-            'dash': AnimationState('dash', self._generate_dash_frames(), 20, False, 'idle', EaseType.EASE_OUT),
-            'hurt': AnimationState('hurt', self._generate_hurt_frames(), 20, False, 'idle', EaseType.BOUNCE)
+            'idle': AnimationState('idle', frames['idle'], FPS, True, None, EaseType.EASE_IN_OUT),
+            'walk': AnimationState('walk', frames['walk'], FPS * 4 // 5, True, None, EaseType.EASE_IN_OUT),
+            'attack': AnimationState('attack', frames['attack'], FPS // 2, False, 'idle', EaseType.EASE_OUT),
+            'dash': AnimationState('dash', frames['dash'], FPS // 3, False, 'idle', EaseType.EASE_OUT),
+            'hurt': AnimationState('hurt', frames['hurt'], FPS // 3, False, 'idle', EaseType.BOUNCE)
+        }
+
+    def generate_frames(self):
+        """Generate the frames of every animation state from the base sprite"""
+        return {
+            'idle': self._generate_idle_frames(),
+            'walk': self._generate_walk_frames(),
+            'attack': self._generate_attack_frames(),
+            'dash': self._generate_dash_frames(),
+            'hurt': self._generate_hurt_frames()
         }
 
     def _interpolate_frames(self, frame1, frame2, progress):
@@ -272,13 +287,26 @@ class AnimationHandler:
             
         return frames
 
+    def set_clock(self, clock):
+        """Time states and transitions against the game clock"""
+        self.clock = clock
+        self.state_start = clock.tick
+        self.transition_start = None
+
+    def get_state_time(self):
+        """Get the ticks the current state has been playing"""
+        return self.clock.tick - self.state_start
+
+    def in_transition(self):
+        """Check whether the previous state's frame is still blending into the current one"""
+        return (self.transition_start is not None and self.prev_frame is not None and
+                self.clock.tick - self.transition_start < self.transition_duration)
+
     def update(self):
         """Update animation state"""
-        self.current_time += 1
-        
         # Check for state transition
         if not self.current_state.loop:
-            progress = self.current_time / self.current_state.duration
+            progress = self.get_state_time() / self.current_state.duration
             if progress >= 1 and self.current_state.next_state:
                 self.set_animation(self.current_state.next_state)
 
@@ -287,25 +315,36 @@ class AnimationHandler:
         if animation_name != self.current_state.name:
             self.prev_frame = self.get_current_frame()
             self.current_state = self.animation_states[animation_name]
-            self.current_time = 0
-            self.transition_time = self.transition_duration
+            self.state_start = self.transition_start = self.clock.tick
+
+    def get_frame_key(self):
+        """Get (state name, frame index) of the current frame, or None while blending between states"""
+        if self.in_transition():
+            return None
+        return self.get_target_frame_key()
+
+    def get_target_frame_key(self):
+        """Get (state name, frame index) of the state being played, ignoring any blend into it
+
+        Reads the state without advancing anything, so simulation code can call it freely.
+        """
+        progress = self.current_state.get_progress(self.get_state_time())
+        return self.current_state.name, int(progress * (self.current_state.frame_count - 1))
 
     def get_current_frame(self):
         """Get current animation frame with interpolation"""
         # Normal animation playback
-        progress = self.current_state.get_progress(self.current_time)
+        progress = self.current_state.get_progress(self.get_state_time())
         frame_index = int(progress * (self.current_state.frame_count - 1))
         
         # Get the current frame
         current_frame = self.current_state.frames[frame_index]
         
         # Handle transition between states
-        if self.transition_time > 0:
-            transition_progress = 1 - (self.transition_time / self.transition_duration)
-            self.transition_time -= 1
+        if self.in_transition():
+            transition_progress = (self.clock.tick - self.transition_start) / self.transition_duration
             
             # Interpolate between previous and current frame
-            if self.prev_frame is not None:
-                return self._interpolate_frames(self.prev_frame, current_frame, transition_progress)
+            return self._interpolate_frames(self.prev_frame, current_frame, transition_progress)
         
         return current_frame.copy()  # Return a copy to prevent modification of original 
\ No newline at end of file
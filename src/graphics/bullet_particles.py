@@ -1,5 +1,6 @@
 import pygame
 import math
+from game.settings import TICK_SCALE
 
 class Particle:
     def __init__(self, x, y, dx, dy, color, lifetime, size):
@@ -24,9 +25,9 @@ class BulletParticleSystem:
         """Update all particles"""
         # Update particle positions and lifetimes
         for particle in self.particles[:]:  # Create a copy to safely remove while iterating
-            particle.x += particle.dx
-            particle.y += particle.dy
-            particle.lifetime -= 1
+            particle.x += particle.dx * TICK_SCALE
+            particle.y += particle.dy * TICK_SCALE
+            particle.lifetime -= TICK_SCALE
             # Fade out particle as it nears end of life
             particle.alpha = int(255 * (particle.lifetime / 10))
             
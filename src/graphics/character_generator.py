@@ -2,6 +2,9 @@ import pygame
 import random
 
 class CharacterGenerator:
+    # Pre-generated (sprite, animation frames) pairs restored by the asset pipeline
+    character_cache = []
+    
     def __init__(self, size=32):
         self.size = size
         self.colors = {
@@ -30,6 +33,12 @@ class CharacterGenerator:
             ]
         }
 
+    def get_character(self):
+        """Get a character sprite and its animation frames, preferring pre-generated variants"""
+        if CharacterGenerator.character_cache:
+            return random.choice(CharacterGenerator.character_cache)
+        return self.generate_character(), None
+
     def generate_character(self):
         """Generate a complete character sprite"""
         surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
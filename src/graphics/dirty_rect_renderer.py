@@ -0,0 +1,67 @@
+import pygame
+from game.settings import *
+
+class DirtyRectRenderer:
+    def __init__(self, size, full_flip_threshold=DIRTY_RECT_FULL_FLIP_THRESHOLD):
+        self.bounds = pygame.Rect((0, 0), size)
+        self.full_flip_threshold = full_flip_threshold
+
+        # Regions drawn last frame (erased next frame) and regions drawn this frame
+        self.previous_rects = []
+        self.current_rects = []
+        self.full_redraw = True
+
+        # Presentation statistics
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        """Force the next frame to be restored and presented in full"""
+        self.full_redraw = True
+
+    def mark(self, rect):
+        """Mark a region of the game surface as changed this frame"""
+        rect = pygame.Rect(rect).clip(self.bounds)
+        if rect.width > 0 and rect.height > 0:
+            self.current_rects.append(rect)
+
+    def mark_all(self, rects):
+        """Mark several changed regions at once"""
+        for rect in rects:
+            self.mark(rect)
+
+    def restore(self, surface, background):
+        """Erase last frame's drawing by copying those regions back from the static background"""
+        if self.full_redraw:
+            surface.blit(background, (0, 0))
+            return
+
+        for rect in self.previous_rects:
+            surface.blit(background, rect, rect)
+
+    def present(self, screen, surface, offset=(0, 0)):
+        """Copy changed regions to the screen and update only those, or flip when cheaper"""
+        dirty = self.previous_rects + self.current_rects
+
+        # Overlapping rects are counted twice, which only makes the fallback kick in earlier
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+        screen_area = self.bounds.width * self.bounds.height
+
+        if self.full_redraw or dirty_area > screen_area * self.full_flip_threshold:
+            if self.full_redraw:
+                screen.fill((0, 0, 0))  # Clear letterboxing left over from other states
+            screen.blit(surface, offset)
+            pygame.display.flip()
+            self.full_flips += 1
+        else:
+            screen_rects = []
+            for rect in dirty:
+                screen_rect = rect.move(offset)
+                screen.blit(surface, screen_rect, rect)
+                screen_rects.append(screen_rect)
+            pygame.display.update(screen_rects)
+            self.partial_updates += 1
+
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+        self.full_redraw = False
@@ -2,37 +2,47 @@ import pygame
 import random
 import math
 
+from game.settings import FPS, WEAPON_ANGLE_STEPS, WEAPON_FRAME_RADIUS
+
 class WeaponAnimation:
     def __init__(self, frames, frame_duration):
-        self.frames = frames  # List of functions that generate each frame
+        self.frames = frames  # One list of (surface, offset) rotation frames per animation frame
         self.current_frame = 0
-        self.frame_duration = frame_duration
-        self.frame_timer = 0
+        self.frame_duration = max(1, frame_duration)  # Ticks per frame
+        self.clock = None  # Game clock the animation is timed against
+        self.start_tick = 0  # Tick the animation last started playing on
         self.is_playing = False
         
+    def set_clock(self, clock):
+        self.clock = clock
+        
     def play(self):
         self.is_playing = True
         self.current_frame = 0
-        self.frame_timer = 0
+        self.start_tick = self.clock.tick
         
     def update(self):
         if not self.is_playing:
             return
             
-        self.frame_timer += 1
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0
-            self.current_frame += 1
-            if self.current_frame >= len(self.frames):
-                self.current_frame = 0
-                self.is_playing = False
+        self.current_frame = (self.clock.tick - self.start_tick) // self.frame_duration
+        if self.current_frame >= len(self.frames):
+            self.current_frame = 0
+            self.is_playing = False
                 
     def draw(self, surface, x, y, angle):
         if not self.frames:
             return
-        self.frames[self.current_frame](surface, x, y, angle)
+        # Pick the pre-rendered frame closest to the requested angle
+        step = int(round(angle * WEAPON_ANGLE_STEPS / 360)) % WEAPON_ANGLE_STEPS
+        image, offset = self.frames[self.current_frame][step]
+        if image:
+            surface.blit(image, (x + offset[0], y + offset[1]))
 
 class EquipmentSprites:
+    # Rotation frames rendered once per weapon and shared by every player and run
+    weapon_frame_cache = {}
+    
     def __init__(self, size):
         self.size = size
         # Define color palettes for different materials
@@ -45,64 +55,65 @@ class EquipmentSprites:
             'trim': [(255, 215, 0), (218, 165, 32), (184, 134, 11)]       # Gold trim
         }
         
-        # Initialize weapon animations dictionary
-        self.animations = {}
+        # Weapon animations: (frame drawing function, pose per animation frame, frame duration)
+        self.animation_specs = {}
         self._setup_animations()
         
+        # Armor overlays by item name (None for items without a visual)
+        self.overlay_registry = {}
+        self.overlay_painters = {
+            "Wings": self._draw_wings,
+            "Hollow Heart": self._draw_heart_armor,
+            "Bracer": self._draw_bracers
+        }
+        
     def _setup_animations(self):
-        # Knife animation
-        knife_frames = [
-            lambda s, x, y, a: self._draw_knife_frame(s, x, y, a, 0),  # Start position
-            lambda s, x, y, a: self._draw_knife_frame(s, x, y, a, 1),  # Mid swing
-            lambda s, x, y, a: self._draw_knife_frame(s, x, y, a, 2),  # Full extension
-            lambda s, x, y, a: self._draw_knife_frame(s, x, y, a, 1),  # Return swing
-        ]
-        self.animations["Knife"] = WeaponAnimation(knife_frames, 3)
-        
-        # Whip animation
-        whip_frames = [
-            lambda s, x, y, a: self._draw_whip_frame(s, x, y, a, 0),  # Coiled
-            lambda s, x, y, a: self._draw_whip_frame(s, x, y, a, 1),  # Extending
-            lambda s, x, y, a: self._draw_whip_frame(s, x, y, a, 2),  # Full extension
-            lambda s, x, y, a: self._draw_whip_frame(s, x, y, a, 1),  # Retracting
-        ]
-        self.animations["Whip"] = WeaponAnimation(whip_frames, 3)
-        
-        # Magic Wand animation
-        wand_frames = [
-            lambda s, x, y, a: self._draw_magic_wand_frame(s, x, y, a, 0),  # Normal
-            lambda s, x, y, a: self._draw_magic_wand_frame(s, x, y, a, 1),  # Glowing
-            lambda s, x, y, a: self._draw_magic_wand_frame(s, x, y, a, 2),  # Bright
-            lambda s, x, y, a: self._draw_magic_wand_frame(s, x, y, a, 1),  # Fading
-        ]
-        self.animations["Magic Wand"] = WeaponAnimation(wand_frames, 4)
-        
-        # Fire Wand animation
-        fire_frames = [
-            lambda s, x, y, a: self._draw_fire_wand_frame(s, x, y, a, 0),  # Normal
-            lambda s, x, y, a: self._draw_fire_wand_frame(s, x, y, a, 1),  # Heating
-            lambda s, x, y, a: self._draw_fire_wand_frame(s, x, y, a, 2),  # Burning
-            lambda s, x, y, a: self._draw_fire_wand_frame(s, x, y, a, 1),  # Cooling
-        ]
-        self.animations["Fire Wand"] = WeaponAnimation(fire_frames, 4)
+        # Knife animation: start position, mid swing, full extension, return swing
+        self.animation_specs["Knife"] = (self._draw_knife_frame, [0, 1, 2, 1], FPS // 20)
+        
+        # Whip animation: coiled, extending, full extension, retracting
+        self.animation_specs["Whip"] = (self._draw_whip_frame, [0, 1, 2, 1], FPS // 20)
+        
+        # Magic Wand animation: normal, glowing, bright, fading
+        self.animation_specs["Magic Wand"] = (self._draw_magic_wand_frame, [0, 1, 2, 1], FPS // 15)
+        
+        # Fire Wand animation: normal, heating, burning, cooling
+        self.animation_specs["Fire Wand"] = (self._draw_fire_wand_frame, [0, 1, 2, 1], FPS // 15)
 
-        # CrossBow animation
-        crossbow_frames = [
-            lambda s, x, y, a: self._draw_crossbow_frame(s, x, y, a, 0),  # Ready
-            lambda s, x, y, a: self._draw_crossbow_frame(s, x, y, a, 1),  # Firing
-            lambda s, x, y, a: self._draw_crossbow_frame(s, x, y, a, 2),  # Recoil
-            lambda s, x, y, a: self._draw_crossbow_frame(s, x, y, a, 1),  # Reloading
-        ]
-        self.animations["Cross Bow"] = WeaponAnimation(crossbow_frames, 3)
+        # CrossBow animation: ready, firing, recoil, reloading
+        self.animation_specs["Cross Bow"] = (self._draw_crossbow_frame, [0, 1, 2, 1], FPS // 20)
 
-        # Lightning Ring animation
-        lightning_frames = [
-            lambda s, x, y, a: self._draw_lightning_ring_frame(s, x, y, a, 0),  # Charging
-            lambda s, x, y, a: self._draw_lightning_ring_frame(s, x, y, a, 1),  # Sparking
-            lambda s, x, y, a: self._draw_lightning_ring_frame(s, x, y, a, 2),  # Full discharge
-            lambda s, x, y, a: self._draw_lightning_ring_frame(s, x, y, a, 1),  # Fading
-        ]
-        self.animations["Lightning Ring"] = WeaponAnimation(lightning_frames, 3)
+        # Lightning Ring animation: charging, sparking, full discharge, fading
+        self.animation_specs["Lightning Ring"] = (self._draw_lightning_ring_frame, [0, 1, 2, 1], FPS // 20)
+
+    def get_weapon_frames(self, weapon_name):
+        """Get the rotation frames for every pose of a weapon, rendering them on first use"""
+        if weapon_name not in EquipmentSprites.weapon_frame_cache:
+            EquipmentSprites.weapon_frame_cache[weapon_name] = self.rasterize_weapon(weapon_name)
+        return EquipmentSprites.weapon_frame_cache[weapon_name]
+
+    def rasterize_weapon(self, weapon_name):
+        """Render each weapon pose at a fixed set of angles, cropped to its visible pixels"""
+        draw_frame, poses, _ = self.animation_specs[weapon_name]
+        radius = WEAPON_FRAME_RADIUS
+        canvas = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        
+        pose_frames = {}
+        for pose in sorted(set(poses)):
+            rotations = []
+            for step in range(WEAPON_ANGLE_STEPS):
+                canvas.fill((0, 0, 0, 0))
+                draw_frame(canvas, radius, radius, step * 360 / WEAPON_ANGLE_STEPS, pose)
+                
+                # Crop to the drawn area and remember where it sits relative to the pivot
+                bounds = canvas.get_bounding_rect()
+                if bounds.width == 0 or bounds.height == 0:
+                    rotations.append((None, (0, 0)))
+                    continue
+                image = canvas.subsurface(bounds).copy()
+                rotations.append((image, (bounds.x - radius, bounds.y - radius)))
+            pose_frames[pose] = rotations
+        return pose_frames
 
     def _draw_knife_frame(self, surface, x, y, angle, frame):
         # Base knife shape
@@ -306,8 +317,21 @@ class EquipmentSprites:
         return surface  # Now just return empty surface as actual drawing happens in animation
 
     def get_animation(self, weapon_name):
-        """Get the animation for a specific weapon"""
-        return self.animations.get(weapon_name)
+        """Create an animation for a specific weapon using its cached rotation frames"""
+        if weapon_name not in self.animation_specs:
+            return None
+        _, poses, frame_duration = self.animation_specs[weapon_name]
+        pose_frames = self.get_weapon_frames(weapon_name)
+        return WeaponAnimation([pose_frames[pose] for pose in poses], frame_duration)
+
+    def get_armor_overlay(self, item_name):
+        """Get the registered overlay for an item, generating it the first time"""
+        if item_name not in self.overlay_registry:
+            if item_name in self.overlay_painters:
+                self.overlay_registry[item_name] = self.generate_armor_overlay(item_name)
+            else:
+                self.overlay_registry[item_name] = None
+        return self.overlay_registry[item_name]
 
     def generate_armor_overlay(self, item_name):
         """Generate armor overlay based on the item"""
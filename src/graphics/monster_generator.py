@@ -2,9 +2,26 @@ import pygame
 import random
 import numpy
 import math
-from game.monster_config import MonsterType, get_monster_config, get_monster_colors
+from game.settings import MONSTER_IDLE_FRAMES, MONSTER_WALK_FRAMES
+from game.monster_config import (MonsterType, PALETTE_VARIANT_COUNT, get_monster_config,
+                                 get_monster_colors, get_monster_palette)
+
+# How each monster type moves in its walk cycle
+MONSTER_MOTION_STYLES = {
+    MonsterType.SLIME: 'bounce',
+    MonsterType.BAT: 'flap',
+    MonsterType.DRAGON: 'flap',
+    MonsterType.GHOST: 'phase',
+    MonsterType.WITCH: 'float',
+    MonsterType.DEMON: 'float'
+}
 
 class MonsterGenerator:
+    # Pre-generated (sprite, death frames) variants keyed by (size, monster type index)
+    monster_cache = {}
+    # Recoloured (sprite, death frames, sprite sheet) keyed by (size, type index, variant index, palette index)
+    palette_cache = {}
+    
     def __init__(self, size):
         self.size = size
         self.surface = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -24,6 +41,87 @@ class MonsterGenerator:
         
         return sprite, death_frames
         
+    def get_monster(self, monster_type_index, palette_index=None):
+        """Get a cached sprite, death frames and animation sheet for a monster type in a colour variant"""
+        key = (self.size, monster_type_index)
+        variants = MonsterGenerator.monster_cache.get(key)
+        if not variants:
+            variants = MonsterGenerator.monster_cache[key] = [self.generate_monster(monster_type_index)]
+        
+        variant_index = random.randrange(len(variants))
+        if palette_index is None:
+            palette_index = random.randrange(PALETTE_VARIANT_COUNT)
+        
+        palette_key = (self.size, monster_type_index, variant_index, palette_index)
+        if palette_key not in MonsterGenerator.palette_cache:
+            sprite, death_frames = variants[variant_index]
+            
+            # Recolour the base sprite and its death frames rather than drawing them again
+            palette = get_monster_palette(list(MonsterType)[monster_type_index], palette_index)
+            if palette:
+                sprite = self.remap_palette(sprite, palette)
+                death_frames = [self.remap_palette(frame, palette) for frame in death_frames]
+            
+            sheet = self.generate_sprite_sheet(monster_type_index, sprite)
+            MonsterGenerator.palette_cache[palette_key] = (sprite, death_frames, sheet)
+        return MonsterGenerator.palette_cache[palette_key]
+        
+    def remap_palette(self, surface, palette):
+        """Copy a surface with every palette colour swapped for its replacement, keeping alpha"""
+        result = surface.copy()
+        rgb = pygame.surfarray.pixels3d(result)
+        
+        # Pack each pixel into one integer so a colour can be matched with a single comparison
+        codes = (rgb[..., 0].astype(numpy.int32) << 16) | (rgb[..., 1].astype(numpy.int32) << 8) | rgb[..., 2]
+        for source, target in palette.items():
+            rgb[codes == ((source[0] << 16) | (source[1] << 8) | source[2])] = target
+        del rgb
+        return result
+        
+    def generate_sprite_sheet(self, monster_type_index, sprite):
+        """Generate idle and walk cycles from a sprite, each frame as a (right, left) facing pair"""
+        monster_type = list(MonsterType)[monster_type_index]
+        style = MONSTER_MOTION_STYLES.get(monster_type, 'walk')
+        
+        sheet = {'idle': [], 'walk': []}
+        for i in range(MONSTER_IDLE_FRAMES):
+            progress = i / MONSTER_IDLE_FRAMES
+            # Gentle breathing: squash down slightly and back
+            breath = (1 - math.cos(2 * math.pi * progress)) / 2
+            sheet['idle'].append(self._make_sheet_frame(sprite, 0, 0, 1 + breath * 0.04, 1 - breath * 0.06, 255))
+            
+        for i in range(MONSTER_WALK_FRAMES):
+            progress = i / MONSTER_WALK_FRAMES
+            wave = math.sin(2 * math.pi * progress)
+            if style == 'bounce':  # Hop with squash on landing and stretch in the air
+                height = abs(wave)
+                frame = self._make_sheet_frame(sprite, 0, -height * 5, 1.15 - height * 0.25, 0.85 + height * 0.25, 255)
+            elif style == 'flap':  # Bob up and down while the wings beat
+                flap = math.sin(4 * math.pi * progress)
+                frame = self._make_sheet_frame(sprite, 0, wave * 3, 1 + flap * 0.12, 1 - flap * 0.06, 255)
+            elif style == 'phase':  # Drift and fade in and out
+                frame = self._make_sheet_frame(sprite, wave * 1.5, math.cos(2 * math.pi * progress) * 2, 1, 1,
+                                               int(180 + wave * 75))
+            elif style == 'float':  # Hover slowly
+                frame = self._make_sheet_frame(sprite, 0, wave * 2, 1, 1, 255)
+            else:  # Walking bob with a step on each half of the cycle
+                step = abs(wave)
+                frame = self._make_sheet_frame(sprite, 0, -step * 2, 1 + step * 0.05, 1 - step * 0.05, 255)
+            sheet['walk'].append(frame)
+            
+        return sheet
+        
+    def _make_sheet_frame(self, sprite, dx, dy, scale_x, scale_y, alpha):
+        """Scale and offset a sprite on a same-sized canvas, anchored at its bottom centre"""
+        width, height = sprite.get_size()
+        scaled = pygame.transform.scale(sprite, (max(1, int(width * scale_x)), max(1, int(height * scale_y))))
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
+        frame.blit(scaled, ((width - scaled.get_width()) // 2 + int(dx),
+                            height - scaled.get_height() + int(dy)))
+        if alpha < 255:
+            frame.set_alpha(alpha)
+        return frame, pygame.transform.flip(frame, True, False)
+        
     def _generate_sprite(self, monster_type, sprite_config, colors):
         """Generate the main sprite based on monster type configuration"""
         self.surface.fill((0, 0, 0, 0))
@@ -125,6 +125,18 @@ class BonfireParticleSystem:
             if particle.dead:
                 self.particles.remove(particle)
 
+    def get_bounds(self):
+        """Get the screen region covered by live particles and their glow"""
+        if not self.particles:
+            return None
+        
+        bounds = pygame.Rect(self.x, self.y, 1, 1)
+        for particle in self.particles:
+            glow_size = int(particle.size * 2) + 1
+            bounds.union_ip((particle.x - glow_size, particle.y - glow_size,
+                             glow_size * 2, glow_size * 2))
+        return bounds
+
     def draw(self, surface):
         if not self.particles:
             return
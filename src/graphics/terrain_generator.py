@@ -3,9 +3,13 @@ import random
 import math
 from noise import pnoise2
 from game.settings import *
+from game.collision_map import CollisionMap
 from graphics.particles import BonfireParticleSystem
 
 class TerrainGenerator:
+    # Pre-generated tile stamps keyed by (tile size, terrain type)
+    tile_cache = {}
+    
     def __init__(self, tile_size=32):
         self.tile_size = tile_size
         self.colors = {
@@ -84,6 +88,9 @@ class TerrainGenerator:
         }
         
         self.bonfire_positions = []
+        self.tile_types = []  # Terrain type per tile of the last generated chunk, by [row][column]
+        self.tile_features = []  # Decoration per tile ('tree', 'crystal', 'ruins' or None)
+        self.collision_map = None  # Blocked cells of the last generated chunk
         self.bonfire_particles = {}
         
         # Animation settings
@@ -95,7 +102,8 @@ class TerrainGenerator:
         self.current_weather = self._get_random_weather()  # Start with random weather
         self.weather_transition = 0
         self.weather_duration = random.randint(FPS * 20, FPS * 40)
-        self.weather_timer = 0
+        self.clock = None
+        self.weather_timer = None  # Scheduled next weather change, once a clock is set
         
         # Initialize weather effects
         self.weather_effects = {
@@ -201,15 +209,20 @@ class TerrainGenerator:
         self.wind_strength = weather['wind_strength']
         self.wind_direction = random.uniform(-1, 1)
 
-    def update_weather(self):
-        """Update weather effects and handle weather transitions"""
-        # Update weather timer and check for weather change
-        self.weather_timer += 1
-        if self.weather_timer >= self.weather_duration:
-            self._change_weather()
-            self.weather_timer = 0
-            self.weather_duration = random.randint(FPS * 20, FPS * 40)
+    def set_clock(self, clock):
+        """Schedule weather changes on the game clock"""
+        if self.weather_timer:
+            self.weather_timer.cancel()
+        self.clock = clock
+        self.weather_timer = clock.schedule(self.weather_duration, self._on_weather_timer)
+        
+    def _on_weather_timer(self):
+        self._change_weather()
+        self.weather_duration = random.randint(FPS * 20, FPS * 40)
+        self.weather_timer = self.clock.schedule(self.weather_duration, self._on_weather_timer)
         
+    def update_weather(self):
+        """Update weather effects"""
         weather = self.weather_types[self.current_weather]
         
         # Update particles based on weather type
@@ -397,6 +410,12 @@ class TerrainGenerator:
             darkness.fill((0, 0, 0, max(0, min(255, base_alpha + flicker))))
             screen.blit(darkness, (0, 0))
 
+    def has_visible_weather(self):
+        """Check if the current weather draws fog, particles or darkness"""
+        weather = self.weather_types[self.current_weather]
+        return (weather['fog_density'] > 0 or weather['particle_count'] > 0
+                or weather['ambient_darkness'] > 0)
+
     def _create_ripple(self, x, y):
         """Create a ripple effect in the nearest puddle"""
         nearest_puddle = None
@@ -413,6 +432,13 @@ class TerrainGenerator:
         if nearest_puddle and min_dist < 2500:  # Only create ripple if rain hits near puddle
             nearest_puddle['ripple'] = 1
 
+    def get_tile(self, type='grass'):
+        """Get a tile stamp for a terrain type, preferring pre-generated variants"""
+        variants = TerrainGenerator.tile_cache.get((self.tile_size, type))
+        if variants:
+            return random.choice(variants)
+        return self.generate_tile(type)
+
     def generate_tile(self, type='grass'):
         """Generate a single tile with pixel-perfect details"""
         surface = pygame.Surface((self.tile_size, self.tile_size))
@@ -645,6 +671,10 @@ class TerrainGenerator:
         chunk_surface = pygame.Surface((width * self.tile_size, height * self.tile_size))
         self.bonfire_positions.clear()
         
+        # Terrain type and decoration of every tile, used for pathing and collision
+        self.tile_types = [[None] * width for _ in range(height)]
+        self.tile_features = [[None] * width for _ in range(height)]
+        
         # Generate multiple noise maps for different features
         scale = 50.0
         octaves = 6
@@ -698,7 +728,8 @@ class TerrainGenerator:
                     else:
                         tile_type = 'grass'
                     
-                tile = self.generate_tile(tile_type)
+                self.tile_types[y][x] = tile_type
+                tile = self.get_tile(tile_type)
                 chunk_surface.blit(tile, (x * self.tile_size, y * self.tile_size))
                 
                 # Add features based on combined noise values
@@ -706,17 +737,35 @@ class TerrainGenerator:
                     if tile_type == 'grass':
                         if d > 0.2:  # Use detail noise for feature distribution
                             self._add_tree(chunk_surface, x * self.tile_size, y * self.tile_size)
+                            self.tile_features[y][x] = 'tree'
                         elif d < -0.2:
                             self._add_crystal(chunk_surface, x * self.tile_size, y * self.tile_size)
+                            self.tile_features[y][x] = 'crystal'
                     elif tile_type == 'stone' and random.random() < 0.4:
                         self._add_ruins(chunk_surface, x * self.tile_size, y * self.tile_size)
+                        self.tile_features[y][x] = 'ruins'
         
         # Add bonfires at pre-calculated positions
         for pos in self.bonfire_positions:
             self._add_bonfire(chunk_surface, pos[0] - self.tile_size//2, pos[1] - self.tile_size//2)
         
+        self.collision_map = self._build_collision_map(width, height)
         return chunk_surface
         
+    def _build_collision_map(self, width, height):
+        """Mark the solid footprint of every decoration and bonfire"""
+        collision_map = CollisionMap(width * self.tile_size, height * self.tile_size)
+        for y, row in enumerate(self.tile_features):
+            for x, feature in enumerate(row):
+                if feature in COLLISION_FOOTPRINTS:
+                    fx, fy, fw, fh = COLLISION_FOOTPRINTS[feature]
+                    collision_map.block_rect((x * self.tile_size + fx, y * self.tile_size + fy, fw, fh))
+        
+        half = BONFIRE_COLLISION_SIZE // 2
+        for bx, by in self.bonfire_positions:
+            collision_map.block_rect((bx - half, by - half, BONFIRE_COLLISION_SIZE, BONFIRE_COLLISION_SIZE))
+        return collision_map
+        
     def _generate_noise_map(self, width, height, scale, octaves, persistence, lacunarity, seed=None):
         """Generate a noise map with given parameters"""
         noise_map = []
@@ -981,6 +1030,15 @@ class TerrainGenerator:
         for particle_system in self.bonfire_particles.values():
             particle_system.update()
             
+    def get_particle_bounds(self):
+        """Get the screen regions covered by bonfire particles"""
+        bounds = []
+        for particle_system in self.bonfire_particles.values():
+            rect = particle_system.get_bounds()
+            if rect:
+                bounds.append(rect)
+        return bounds
+            
     def draw_particles(self, screen):
         """Draw all particle systems"""
         for particle_system in self.bonfire_particles.values():
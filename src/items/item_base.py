@@ -25,14 +25,11 @@ class Item:
         # Apply stats
         for stat_name, value in self.stats.items():
             if isinstance(value, (int, float)):
-                if stat_name in player.stats:
-                    player.stats[stat_name] += value
-                else:
-                    player.stats[stat_name] = value
+                player.stats.add(stat_name, value)
             elif isinstance(value, dict):
                 # For more complex stats like cooldown_reduction
                 for sub_stat, sub_value in value.items():
-                    player.stats[f"{stat_name}_{sub_stat}"] = sub_value
+                    player.stats.set(f"{stat_name}_{sub_stat}", sub_value)
         
     def remove_effect(self, player):
         """Remove the item's effect from the player"""
@@ -40,10 +37,10 @@ class Item:
         for stat_name, value in self.stats.items():
             if isinstance(value, (int, float)):
                 if stat_name in player.stats:
-                    player.stats[stat_name] -= value
+                    player.stats.add(stat_name, -value)
             elif isinstance(value, dict):
                 for sub_stat in value.keys():
-                    player.stats.pop(f"{stat_name}_{sub_stat}", None)
+                    player.stats.remove(f"{stat_name}_{sub_stat}")
         
     def on_purchase(self, player):
         """Called when the item is purchased"""
@@ -69,13 +66,13 @@ class WeaponItem(Item):
         super().apply_effect(player)
         # Apply weapon-specific stats
         for stat, value in self.weapon_stats.items():
-            player.stats[f"weapon_{stat}"] = value
+            player.stats.set(f"weapon_{stat}", value)
 
     def remove_effect(self, player):
         super().remove_effect(player)
         # Remove weapon-specific stats
         for stat in self.weapon_stats.keys():
-            player.stats.pop(f"weapon_{stat}", None)
+            player.stats.remove(f"weapon_{stat}")
 
 class PassiveItem(Item):
     def __init__(self, name, description, rarity, cost, stats=None, passive_effect=None):
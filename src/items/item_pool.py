@@ -192,6 +192,15 @@ class Bracer(PassiveItem):
                 "projectile_size": 1.1
             }
         )
+        
+    def apply_effect(self, player):
+        # Stack as multipliers, so each Bracer scales the last one's result (1.2, 1.44, ...)
+        for stat_name, multiplier in self.stats.items():
+            player.modify_stat(stat_name, multiplier)
+            
+    def remove_effect(self, player):
+        for stat_name, multiplier in self.stats.items():
+            player.remove_stat_multiplier(stat_name, multiplier)
 
 class Magnet(PassiveItem):
     def __init__(self):
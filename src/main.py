@@ -1,10 +1,14 @@
 import pygame
 import sys
+import time
 from game.game_state import GameState
 from ui.main_menu import MainMenu
 from game.settings import *
 from game.settings_manager import SettingsManager
 from game.sound_manager import SoundManager
+from game.asset_pipeline import AssetPipeline
+from graphics.dirty_rect_renderer import DirtyRectRenderer
+from game.frame_pacer import FramePacer
 
 class Game:
     def __init__(self):
@@ -13,6 +17,10 @@ class Game:
         # Initialize settings first
         self.settings_manager = SettingsManager()
         
+        # Restore pre-generated sprites, tiles and sounds before anything uses them
+        self.asset_pipeline = AssetPipeline()
+        self.asset_pipeline.load()
+        
         # Initialize sound manager
         self.sound_manager = SoundManager(self.settings_manager)
         
@@ -34,9 +42,27 @@ class Game:
         self.game_state = None
         self.main_menu = MainMenu(self.settings_manager, self.sound_manager)
         self.current_state = GameStates.MENU
-        self.clock = pygame.time.Clock()
+        self.frame_pacer = FramePacer()
+        self.update_frame_pacer()
         self.paused_game_state = None  # Store game state when paused
         
+        # Optional dirty-rect presentation for gameplay
+        self.dirty_renderer = None
+        self.update_dirty_renderer()
+        
+    def update_dirty_renderer(self):
+        """Create or drop the dirty-rect renderer to match the graphics settings"""
+        if self.settings_manager.get_setting("graphics", "dirty_rects"):
+            if not self.dirty_renderer:
+                self.dirty_renderer = DirtyRectRenderer((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.dirty_renderer.invalidate()
+        else:
+            self.dirty_renderer = None
+        
+    def update_frame_pacer(self):
+        """Match the frame cap to the graphics settings"""
+        self.frame_pacer.set_target(self.settings_manager.get_setting("graphics", "fps_limit"))
+        
     def get_centered_offset(self):
         """Calculate the offset needed to center the game in fullscreen"""
         screen_width = self.screen.get_width()
@@ -65,7 +91,15 @@ class Game:
         
     def run(self):
         running = True
+        event = None
+        tick_seconds = 1.0 / TICK_RATE
+        accumulator = 0.0  # Real time not yet simulated
+        previous_time = time.perf_counter()
         while running:
+            now = time.perf_counter()
+            accumulator += now - previous_time
+            previous_time = now
+            
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -88,7 +122,7 @@ class Game:
                             self.game_state.state = GameStates.PLAYING
                         else:
                             # Create new game state
-                            self.game_state = GameState()
+                            self.game_state = GameState(self.settings_manager)
                             self.paused_game_state = None
                         self.main_menu.should_start_game = False
                     
@@ -106,8 +140,21 @@ class Game:
                         self.current_resolution = resolution
                         self.current_fullscreen = fullscreen
                     
+                    # Pick up dirty-rect toggles (the next gameplay frame starts from a full redraw)
+                    self.update_dirty_renderer()
+                    self.update_frame_pacer()
+                    
                 # Handle game input when playing
                 elif self.current_state == GameStates.PLAYING and self.game_state:
+                    # ESC on the game over screen abandons the run for the menu
+                    if self.game_state.state == GameStates.GAME_OVER:
+                        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                            self.current_state = GameStates.MENU
+                            self.game_state = None
+                            self.paused_game_state = None  # Clear paused game on game over
+                            self.main_menu.reset(has_game_to_continue=False)
+                        continue
+                    
                     self.game_state.handle_input(event)
                     # Check if game state wants to return to menu
                     if self.game_state.state == GameStates.MENU:
@@ -117,61 +164,91 @@ class Game:
                         self.game_state = None
                         self.main_menu.reset(has_game_to_continue=True)
             
-            # Update
-            if self.current_state == GameStates.MENU:
-                self.main_menu.update()
-            elif self.current_state == GameStates.PLAYING and self.game_state:
-                self.game_state.update()
-                
-                # Check for game over
-                if self.game_state.state == GameStates.GAME_OVER:
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        self.current_state = GameStates.MENU
-                        self.game_state = None
-                        self.paused_game_state = None  # Clear paused game on game over
-                        self.main_menu.reset(has_game_to_continue=False)
+            # Simulate in fixed ticks, however long the last frame took. Static screens wake
+            # rarely but their ticks are cheap, so they catch up fully to keep timers honest.
+            idle = self.is_idle()
+            max_steps = TICK_RATE if idle else MAX_CATCH_UP_TICKS
+            steps = 0
+            while accumulator >= tick_seconds and steps < max_steps:
+                self.update()
+                accumulator -= tick_seconds
+                steps += 1
+            if steps == max_steps:
+                # Too far behind to catch up: drop the backlog rather than fall further behind
+                accumulator = min(accumulator, tick_seconds)
+            alpha = accumulator / tick_seconds  # How far between the last two ticks this frame falls
             
-            # Clear screen
-            self.screen.fill((0, 0, 0))  # Fill with black for letterboxing
+            # Dirty-rect presentation only applies to active gameplay
+            use_dirty_rects = (self.dirty_renderer is not None
+                               and self.current_state == GameStates.PLAYING
+                               and self.game_state is not None
+                               and self.game_state.state == GameStates.PLAYING)
+            if self.dirty_renderer and not use_dirty_rects:
+                self.dirty_renderer.invalidate()
             
-            if self.current_state == GameStates.MENU:
-                # Menu uses full screen
-                self.main_menu.draw(self.screen)
-            elif self.current_state == GameStates.PLAYING and self.game_state:
-                # Clear game surface
-                self.game_surface.fill(UI_COLORS["BACKGROUND"])
-                
-                # Draw game to game surface
-                if self.game_state.state == GameStates.SHOPPING and self.current_fullscreen:
-                    # For shop in fullscreen, only draw background
-                    self.game_state.draw_world(self.game_surface)
-                else:
-                    # Draw everything for normal gameplay
-                    self.game_state.draw(self.game_surface)
-                
-                if self.current_fullscreen:
-                    # Center the game in fullscreen mode
-                    offset = self.get_centered_offset()
-                    self.screen.blit(self.game_surface, offset)
-                    
-                    # Draw shop UI directly to screen in fullscreen mode
-                    if self.game_state.state == GameStates.SHOPPING:
-                        self.game_state.shop.draw(self.screen)
-                else:
-                    # Direct draw in windowed mode
-                    self.screen.blit(self.game_surface, (0, 0))
-            
-            pygame.display.flip()
+            if use_dirty_rects:
+                offset = self.get_centered_offset() if self.current_fullscreen else (0, 0)
+                self.game_state.draw_dirty(self.game_surface, self.dirty_renderer, alpha)
+                self.dirty_renderer.present(self.screen, self.game_surface, offset)
+            else:
+                self.draw_full_frame(alpha)
             
-            # Apply vsync setting
-            vsync = self.settings_manager.get_setting("graphics", "vsync")
-            if vsync:
-                self.clock.tick(FPS)
+            # Sleep off the rest of the frame; screens without gameplay need far fewer frames
+            if self.is_idle():
+                self.frame_pacer.wait_for_event(IDLE_WAKE_MS)
+            elif self.current_state == GameStates.MENU:
+                self.frame_pacer.wait(MENU_FPS)
             else:
-                self.clock.tick_busy_loop(FPS)
+                self.frame_pacer.wait()
             
         pygame.quit()
         sys.exit()
+        
+    def is_idle(self):
+        """Check whether the screen is static (shop or game over), so the loop can wait for input"""
+        return (self.current_state == GameStates.PLAYING and self.game_state is not None
+                and self.game_state.state in (GameStates.SHOPPING, GameStates.GAME_OVER))
+        
+    def update(self):
+        """Advance the menu or game by one simulation tick"""
+        if self.current_state == GameStates.MENU:
+            self.main_menu.update()
+        elif self.current_state == GameStates.PLAYING and self.game_state:
+            self.game_state.update()
+        
+    def draw_full_frame(self, alpha=1.0):
+        """Redraw the whole frame and flip the display, alpha of the way through the last tick"""
+        # Clear screen
+        self.screen.fill((0, 0, 0))  # Fill with black for letterboxing
+        
+        if self.current_state == GameStates.MENU:
+            # Menu uses full screen
+            self.main_menu.draw(self.screen)
+        elif self.current_state == GameStates.PLAYING and self.game_state:
+            # Clear game surface
+            self.game_surface.fill(UI_COLORS["BACKGROUND"])
+            
+            # Draw game to game surface
+            if self.game_state.state == GameStates.SHOPPING and self.current_fullscreen:
+                # For shop in fullscreen, only draw the frozen world behind it
+                self.game_state.draw_backdrop(self.game_surface)
+            else:
+                # Draw everything for normal gameplay
+                self.game_state.draw(self.game_surface, alpha)
+            
+            if self.current_fullscreen:
+                # Center the game in fullscreen mode
+                offset = self.get_centered_offset()
+                self.screen.blit(self.game_surface, offset)
+                
+                # Draw shop UI directly to screen in fullscreen mode
+                if self.game_state.state == GameStates.SHOPPING:
+                    self.game_state.shop.draw(self.screen)
+            else:
+                # Direct draw in windowed mode
+                self.screen.blit(self.game_surface, (0, 0))
+        
+        pygame.display.flip()
 
 if __name__ == "__main__":
     game = Game()
@@ -0,0 +1,175 @@
+"""Fan headless runs out over worker processes for balance sweeps
+
+Every combination of --set values, policy and seed is one run. Each finished round
+becomes one row of the output, saved as a compressed .npz with one array per column.
+
+Run from src/:
+    python -m sim.batch --seeds 200 --policy kite --policy wander \\
+        --set "ROUND_STAT_SCALING=[0.1, 0.15]" --set "SLIME.health=[30, 40, 50]" --out sweep.npz
+
+Names are settings.py constants, monster_config.py globals, or MONSTER_TYPE.stat for a
+monster's base stats. Dict globals such as ROUND_DIFFICULTY are merged, with tiers given
+by name: --set "ROUND_DIFFICULTY={1: {'BASIC': 80, 'STANDARD': 20}}".
+"""
+import io
+import os
+import sys
+import ast
+import json
+import time
+import argparse
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy
+from sim.headless import HeadlessRunner, POLICIES, make_policy
+from game import settings, monster_config
+from game.settings import *
+from game.monster_config import MonsterType, DifficultyTier
+
+# Round record fields, in output column order (see RoundStats.as_dict)
+ROUND_COLUMNS = ("round", "survived", "ticks", "kills", "time_to_kill",
+                 "damage_taken", "damage_dealt", "gold_earned")
+
+def apply_overrides(overrides):
+    """Patch settings and monster config for one run, returning what restore_overrides needs
+
+    Settings are copied into each module by `from game.settings import *`, so every loaded
+    module holding the original value is patched. Defaults already bound into function
+    signatures keep their old value.
+    """
+    restore = []
+    for name, value in overrides.items():
+        monster_name, _, stat = name.partition(".")
+        if stat:
+            base_stats = monster_config.MONSTER_CONFIG[MonsterType[monster_name]]["base_stats"]
+            restore.append((base_stats, stat, base_stats[stat]))
+            base_stats[stat] = value
+        elif hasattr(monster_config, name):
+            old = getattr(monster_config, name)
+            if isinstance(old, dict):
+                value = {**old, **_tier_keys(value)}
+            restore.append((monster_config, name, old))
+            setattr(monster_config, name, value)
+        elif hasattr(settings, name):
+            old = getattr(settings, name)
+            for module in list(sys.modules.values()):
+                if getattr(module, name, None) is old:
+                    restore.append((module, name, old))
+                    setattr(module, name, value)
+        else:
+            raise KeyError(f"Unknown override: {name}")
+    return restore
+
+def restore_overrides(restore):
+    """Undo apply_overrides, newest patch first"""
+    for target, name, old in reversed(restore):
+        if isinstance(target, dict):
+            target[name] = old
+        else:
+            setattr(target, name, old)
+
+def _tier_keys(weights):
+    """Turn tier names into DifficultyTier keys, at any depth of a weights dict"""
+    if not isinstance(weights, dict):
+        return weights
+    return {DifficultyTier[key] if isinstance(key, str) and key in DifficultyTier.__members__ else key:
+            _tier_keys(value) for key, value in weights.items()}
+
+def run_task(task):
+    """Play one seeded run in a worker and get a row per finished round"""
+    run_id, seed, policy_name, config_id, overrides, max_rounds, max_ticks = task
+    restore = apply_overrides(overrides)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # The game's debug prints would swamp the console
+            runner = HeadlessRunner(make_policy(policy_name, seed), seed=seed)
+            while (runner.ticks < max_ticks and len(runner.rounds) < max_rounds and
+                   runner.game_state.state != GameStates.GAME_OVER):
+                runner.step()
+    finally:
+        restore_overrides(restore)
+    return [{"run": run_id, "seed": seed, "policy": policy_name, "config": config_id, **record}
+            for record in runner.rounds]
+
+class ColumnWriter:
+    """Collects round rows as columns and saves them as one compressed .npz"""
+    def __init__(self, configs):
+        self.configs = configs
+        self.columns = {name: [] for name in ("run", "seed", "policy", "config") + ROUND_COLUMNS}
+
+    def add(self, rows):
+        for row in rows:
+            for name, values in self.columns.items():
+                values.append(row[name])
+
+    def __len__(self):
+        return len(self.columns["run"])
+
+    def get_arrays(self):
+        arrays = {name: numpy.asarray(values) for name, values in self.columns.items()}
+        # Index into this to get the overrides behind each row's config column
+        arrays["config_overrides"] = numpy.asarray([json.dumps(config) for config in self.configs])
+        return arrays
+
+    def save(self, path):
+        numpy.savez_compressed(path, **self.get_arrays())
+
+def build_tasks(sweep, policies, seeds, max_rounds, max_ticks):
+    """Expand a {name: [values]} sweep into configs and one task per config, policy and seed"""
+    names = list(sweep)
+    configs = [dict(zip(names, values)) for values in itertools.product(*(sweep[name] for name in names))]
+    combos = itertools.product(enumerate(configs), policies, range(seeds))
+    tasks = [(run_id, seed, policy, config_id, config, max_rounds, max_ticks)
+             for run_id, ((config_id, config), policy, seed) in enumerate(combos)]
+    return configs, tasks
+
+def print_summary(arrays):
+    """Print rounds survived and per-round averages for each config and policy"""
+    for config_id, overrides in enumerate(arrays["config_overrides"]):
+        for policy in numpy.unique(arrays["policy"]):
+            rows = (arrays["config"] == config_id) & (arrays["policy"] == policy)
+            if not rows.any():
+                continue
+            runs = numpy.unique(arrays["run"][rows])
+            survived = numpy.array([arrays["survived"][rows & (arrays["run"] == run)].sum() for run in runs])
+            print(f"config {config_id} {overrides} {policy}: {len(runs)} runs, "
+                  f"rounds survived {survived.mean():.2f} (min {survived.min()}, max {survived.max()}), "
+                  f"time to kill {arrays['time_to_kill'][rows].mean() / TICK_RATE:.2f}s, "
+                  f"damage taken/round {arrays['damage_taken'][rows].mean():.1f}, "
+                  f"gold/round {arrays['gold_earned'][rows].mean():.1f}")
+
+def _parse_set(text):
+    name, _, value = text.partition("=")
+    value = ast.literal_eval(value)
+    return name.strip(), value if isinstance(value, list) else [value]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless games in parallel for balance sweeps")
+    parser.add_argument("--seeds", type=int, default=100, help="runs per config and policy")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES), help="repeat for several")
+    parser.add_argument("--set", action="append", type=_parse_set, default=[], metavar="NAME=VALUE",
+                        help="override to sweep; a list value sweeps each entry")
+    parser.add_argument("--rounds", type=int, default=10, help="stop a run after this many rounds")
+    parser.add_argument("--minutes", type=float, default=30, help="game time limit per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="sweep.npz")
+    args = parser.parse_args(argv)
+
+    configs, tasks = build_tasks(dict(args.set), args.policy or ["kite"], args.seeds,
+                                 args.rounds, int(args.minutes * 60 * TICK_RATE))
+    writer = ColumnWriter(configs)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(run_task, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            writer.add(future.result())
+            print(f"\r{done}/{len(tasks)} runs, {len(writer)} rounds, "
+                  f"{time.perf_counter() - start:.0f}s", end="", flush=True)
+    print()
+
+    writer.save(args.out)
+    print(f"Saved {len(writer)} rounds to {args.out}")
+    print_summary(writer.get_arrays())
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,123 @@
+"""Run the game without a window, stepping the simulation as fast as it will go
+
+Run from src/:
+    python -m sim.headless --minutes 60 --policy kite --seed 1
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import numpy
+
+# No window or audio device unless the caller asked for one
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game.settings import *
+from game.game_state import GameState
+from sim.policies import IdlePolicy, RandomWalkPolicy, KitePolicy
+
+POLICIES = {
+    "idle": IdlePolicy,
+    "wander": RandomWalkPolicy,
+    "kite": KitePolicy
+}
+
+def make_policy(name, seed=None):
+    """Create a policy by its command-line name"""
+    policy_class = POLICIES[name]
+    return policy_class(seed=seed) if policy_class is RandomWalkPolicy else policy_class()
+
+class HeadlessRunner:
+    """Steps a GameState with a policy standing in for the player
+
+    Unless render is set, drawing and the purely visual updates behind it (particles,
+    weather, corpses) are skipped. With render, every tick is drawn to an offscreen
+    surface, which is useful for profiling the renderer without a window.
+    """
+    def __init__(self, policy=None, seed=None, render=False):
+        pygame.init()
+        if seed is not None:
+            random.seed(seed)
+            numpy.random.seed(seed)
+
+        self.policy = policy or KitePolicy()
+        self.game_state = GameState(headless=not render)
+        self.game_state.player.set_policy(self.policy)
+        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)) if render else None
+        self.ticks = 0
+        self.rounds = []  # One record per finished round, see RoundStats.as_dict
+
+    def reset(self):
+        """Start a new game on the same map"""
+        self.game_state.new_game()
+        self.game_state.player.set_policy(self.policy)
+        self.ticks = 0
+        self.rounds = []
+
+    def step(self):
+        """Advance one tick, letting the policy do the shopping between rounds"""
+        was_playing = self.game_state.state == GameStates.PLAYING
+        self.game_state.update()
+        if was_playing and self.game_state.state != GameStates.PLAYING:
+            survived = self.game_state.state != GameStates.GAME_OVER
+            self.rounds.append(self.game_state.round_stats.as_dict(self.game_state.clock.tick, survived))
+        if self.game_state.state == GameStates.SHOPPING:
+            self._shop()
+        if self.surface is not None:
+            self.game_state.draw(self.surface)
+        self.ticks += 1
+
+    def _shop(self):
+        """Buy what the policy picks until it is done or the purchase limit starts the next round"""
+        game_state = self.game_state
+        while game_state.state == GameStates.SHOPPING:
+            choice = self.policy.choose_item(game_state.shop, game_state.player)
+            if choice is None:
+                game_state.leave_shop()
+                return
+            game_state.shop.selected_item = choice
+            if not game_state.purchase_selected_item():
+                game_state.leave_shop()
+
+    def run(self, ticks):
+        """Step until ticks have passed or the player dies, returning a summary of the run"""
+        start = time.perf_counter()
+        while self.ticks < ticks and self.game_state.state != GameStates.GAME_OVER:
+            self.step()
+        return self.get_summary(time.perf_counter() - start)
+
+    def get_summary(self, wall_seconds=0):
+        game_state = self.game_state
+        player = game_state.player
+        return {
+            "ticks": self.ticks,
+            "game_seconds": self.ticks / TICK_RATE,
+            "round": game_state.current_round,
+            "rounds_survived": sum(record["survived"] for record in self.rounds),
+            "score": game_state.score,
+            "money": player.money,
+            "health": player.health,
+            "weapons": len(player.weapons),
+            "game_over": game_state.state == GameStates.GAME_OVER,
+            "wall_seconds": wall_seconds,
+            "speedup": self.ticks / TICK_RATE / wall_seconds if wall_seconds else 0
+        }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate the game headlessly with a scripted player")
+    parser.add_argument("--minutes", type=float, default=60, help="game time to simulate")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="kite")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--render", action="store_true", help="draw every tick offscreen")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(make_policy(args.policy, args.seed), seed=args.seed, render=args.render)
+    summary = runner.run(int(args.minutes * 60 * TICK_RATE))
+    for key, value in summary.items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,74 @@
+import math
+import random
+import numpy
+from game.settings import *
+
+class Policy:
+    """Scripted stand-in for the keyboard and mouse
+
+    get_movement is asked for a direction every tick, and choose_item picks shop
+    purchases. Subclasses override whichever they need.
+    """
+    def get_movement(self, player):
+        """Get the (x, y) direction to move this tick; it is normalized by the player"""
+        return (0, 0)
+
+    def choose_item(self, shop, player):
+        """Get the index of the shop item to buy, or None to leave the shop
+
+        Buys the cheapest affordable item, so money turns into power the way a cautious
+        player spends it.
+        """
+        affordable = [(item.cost, i) for i, item in enumerate(shop.items) if item.cost <= player.money]
+        return min(affordable)[1] if affordable else None
+
+class ActionPolicy(Policy):
+    """Move however the caller last said, for agents that pick every tick's action"""
+    def __init__(self):
+        self.movement = (0, 0)
+
+    def get_movement(self, player):
+        return self.movement
+
+class IdlePolicy(Policy):
+    """Stand still and let the auto-attacks do the work"""
+
+class RandomWalkPolicy(Policy):
+    """Wander in a random direction, picking a new heading every so often"""
+    def __init__(self, seed=None, turn_ticks=SIM_WANDER_TICKS):
+        self.random = random.Random(seed)
+        self.turn_ticks = turn_ticks
+        self.ticks = 0
+        self.heading = (0, 0)
+
+    def get_movement(self, player):
+        if self.ticks % self.turn_ticks == 0:
+            angle = self.random.uniform(0, 2 * math.pi)
+            self.heading = (math.cos(angle), math.sin(angle))
+        self.ticks += 1
+
+        # Turn back from the screen edges instead of sliding along them
+        x, y = self.heading
+        if (player.rect.left <= 0 and x < 0) or (player.rect.right >= SCREEN_WIDTH and x > 0):
+            x = -x
+        if (player.rect.top <= 0 and y < 0) or (player.rect.bottom >= SCREEN_HEIGHT and y > 0):
+            y = -y
+        self.heading = (x, y)
+        return self.heading
+
+class KitePolicy(Policy):
+    """Back away from nearby enemies while drifting toward the middle of the screen"""
+    def get_movement(self, player):
+        queries = player.combat_queries
+        center = numpy.array(player.rect.center, dtype=float)
+
+        # Drift home so the player isn't pinned in a corner
+        move = (numpy.array((SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)) - center) * SIM_CENTER_PULL
+        if queries is not None:
+            found = queries.circle(center, SIM_FLEE_RADIUS)
+            if len(found):
+                # Closer enemies push harder
+                offsets = center - queries.centers[found]
+                distances = numpy.maximum(numpy.hypot(offsets[:, 0], offsets[:, 1]), 1)
+                move += (offsets / (distances ** 2)[:, None]).sum(axis=0) * SIM_FLEE_RADIUS
+        return tuple(move)
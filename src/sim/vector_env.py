@@ -0,0 +1,176 @@
+"""Step many headless games in lockstep behind batched NumPy actions and observations
+
+    env = VectorEnv(16, seed=1)
+    observations = env.reset()
+    observations, rewards, dones = env.step(actions)  # actions: (16, 2) movement directions
+
+Finished games restart on their own map straight away. The observation returned for a
+finished game is the first one of its next game, and the finished game's summary is
+left in env.completed for that step.
+"""
+import random
+import numpy
+from game.settings import *
+from sim.headless import HeadlessRunner
+from sim.policies import ActionPolicy
+
+# Player features at the start of every entity observation
+PLAYER_FEATURES = 5  # x, y, health, round time left, round
+ENEMY_FEATURES = 4  # dx, dy, health, present
+
+class VectorEnv:
+    """N headless games advanced together, one movement action per game per step
+
+    observation="entities" gives each game a flat float32 vector: the player's position,
+    health, round time left and round, then the nearest enemies' offsets and health.
+    observation="grid" gives a (3, rows, columns) float32 map of enemy counts, the player
+    and blocked terrain at SIM_GRID_SIZE, a tiny stand-in for the rendered screen.
+
+    ticks_per_step repeats each action for that many ticks, summing the rewards.
+    """
+    def __init__(self, num_envs, seed=None, observation="entities", ticks_per_step=1,
+                 max_episode_ticks=None, observed_enemies=SIM_OBSERVED_ENEMIES):
+        if observation not in ("entities", "grid"):
+            raise ValueError(f"Unknown observation type: {observation}")
+        if seed is not None:
+            random.seed(seed)
+            numpy.random.seed(seed)
+
+        self.num_envs = num_envs
+        self.observation = observation
+        self.ticks_per_step = ticks_per_step
+        self.max_episode_ticks = max_episode_ticks
+        self.observed_enemies = observed_enemies
+        self.runners = [HeadlessRunner(ActionPolicy()) for _ in range(num_envs)]
+        self.completed = []  # (env index, summary) for games that ended during the last step
+
+        # Damage taken so far, per game, and the round it was counted against
+        self.last_damage = numpy.zeros(num_envs)
+        self.last_stats = [None] * num_envs
+        self.last_score = numpy.zeros(num_envs)
+
+        # Blocked tiles never change, so each game's terrain channel is built once
+        self.blocked = [self._downsample_blocked(runner.game_state.flow_field) for runner in self.runners]
+
+    @property
+    def observation_shape(self):
+        if self.observation == "grid":
+            return (3, SIM_GRID_SIZE[1], SIM_GRID_SIZE[0])
+        return (PLAYER_FEATURES + ENEMY_FEATURES * self.observed_enemies,)
+
+    def reset(self):
+        """Restart every game and get the first observations"""
+        for i, runner in enumerate(self.runners):
+            runner.reset()
+            self._reset_tracking(i)
+        return self.get_observations()
+
+    def step(self, actions):
+        """Move each game's player by its action, returning (observations, rewards, dones)"""
+        actions = numpy.asarray(actions, dtype=float).reshape(self.num_envs, 2)
+        rewards = numpy.zeros(self.num_envs, dtype=numpy.float32)
+        dones = numpy.zeros(self.num_envs, dtype=bool)
+        self.completed = []
+
+        for i, runner in enumerate(self.runners):
+            runner.policy.movement = (actions[i, 0], actions[i, 1])
+            for _ in range(self.ticks_per_step):
+                runner.step()
+                if self._is_done(runner):
+                    break
+            rewards[i] = self._collect_reward(i)
+            if self._is_done(runner):
+                dones[i] = True
+                self.completed.append((i, runner.get_summary()))
+                runner.reset()
+                self._reset_tracking(i)
+
+        return self.get_observations(), rewards, dones
+
+    def _is_done(self, runner):
+        if runner.game_state.state == GameStates.GAME_OVER:
+            return True
+        return self.max_episode_ticks is not None and runner.ticks >= self.max_episode_ticks
+
+    def _collect_reward(self, i):
+        """Get the reward earned since the last call: kills, less damage taken and dying"""
+        game_state = self.runners[i].game_state
+        stats = game_state.round_stats
+        if stats is not self.last_stats[i]:  # New round, so its damage count started over
+            self.last_stats[i] = stats
+            self.last_damage[i] = 0
+        reward = ((game_state.score - self.last_score[i]) * SIM_KILL_REWARD -
+                  (stats.damage_taken - self.last_damage[i]) * SIM_HURT_PENALTY)
+        if game_state.state == GameStates.GAME_OVER:
+            reward -= SIM_DEATH_PENALTY
+        self.last_score[i] = game_state.score
+        self.last_damage[i] = stats.damage_taken
+        return reward
+
+    def _reset_tracking(self, i):
+        game_state = self.runners[i].game_state
+        self.last_stats[i] = game_state.round_stats
+        self.last_damage[i] = game_state.round_stats.damage_taken
+        self.last_score[i] = game_state.score
+
+    def get_observations(self):
+        """Get a (num_envs, *observation_shape) float32 array for the current tick"""
+        observations = numpy.zeros((self.num_envs,) + self.observation_shape, dtype=numpy.float32)
+        for i, runner in enumerate(self.runners):
+            if self.observation == "grid":
+                self._observe_grid(runner.game_state, self.blocked[i], observations[i])
+            else:
+                self._observe_entities(runner.game_state, observations[i])
+        return observations
+
+    def _enemy_centers(self, game_state):
+        manager = game_state.enemy_manager
+        n = manager.count
+        return manager.positions[:n] + manager.sizes[:n] * 0.5, manager.enemies[:n]
+
+    def _observe_entities(self, game_state, out):
+        player = game_state.player
+        px, py = player.rect.center
+        out[:PLAYER_FEATURES] = (px / SCREEN_WIDTH, py / SCREEN_HEIGHT,
+                                 player.health / player.max_health,
+                                 game_state.round_time_left() / ROUND_DURATION,
+                                 game_state.current_round)
+
+        centers, enemies = self._enemy_centers(game_state)
+        if not len(enemies):
+            return
+        offsets = centers - (px, py)
+        nearest = numpy.argsort(offsets[:, 0] ** 2 + offsets[:, 1] ** 2)[:self.observed_enemies]
+        features = out[PLAYER_FEATURES:].reshape(self.observed_enemies, ENEMY_FEATURES)
+        count = len(nearest)
+        features[:count, 0] = offsets[nearest, 0] / SCREEN_WIDTH
+        features[:count, 1] = offsets[nearest, 1] / SCREEN_HEIGHT
+        features[:count, 2] = [enemies[j].health / enemies[j].max_health for j in nearest]
+        features[:count, 3] = 1
+
+    def _observe_grid(self, game_state, blocked, out):
+        columns, rows = SIM_GRID_SIZE
+        centers, _ = self._enemy_centers(game_state)
+        if len(centers):
+            cells = self._to_cells(centers)
+            out[0] = numpy.bincount(cells, minlength=columns * rows).reshape(rows, columns)
+        player_cell = self._to_cells(numpy.array([game_state.player.rect.center], dtype=float))[0]
+        out[1].flat[player_cell] = 1
+        out[2] = blocked
+
+    def _to_cells(self, points):
+        """Get the flat grid cell index of each pixel position, clamped to the grid"""
+        columns, rows = SIM_GRID_SIZE
+        x = numpy.clip((points[:, 0] * columns / SCREEN_WIDTH).astype(int), 0, columns - 1)
+        y = numpy.clip((points[:, 1] * rows / SCREEN_HEIGHT).astype(int), 0, rows - 1)
+        return y * columns + x
+
+    def _downsample_blocked(self, flow_field):
+        """Sample the blocked-tile map at the center of each grid cell"""
+        columns, rows = SIM_GRID_SIZE
+        xs = ((numpy.arange(columns) + 0.5) * SCREEN_WIDTH / columns // flow_field.tile_size).astype(int)
+        ys = ((numpy.arange(rows) + 0.5) * SCREEN_HEIGHT / rows // flow_field.tile_size).astype(int)
+        blocked = flow_field.costs == numpy.inf
+        xs = numpy.clip(xs, 0, flow_field.columns - 1)
+        ys = numpy.clip(ys, 0, flow_field.rows - 1)
+        return blocked[numpy.ix_(ys, xs)].astype(numpy.float32)
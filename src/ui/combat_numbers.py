@@ -0,0 +1,106 @@
+import random
+from collections import deque
+import pygame
+from game.settings import *
+
+DIGITS = "0123456789"
+
+class CombatNumbers:
+    """Floating damage numbers drawn from a pre-rendered digit atlas
+
+    Every digit is rendered once per style and fade step when the atlas is built, so a
+    number on screen costs one blit per digit instead of a font.render call.
+    """
+    def __init__(self, clock):
+        self.clock = clock
+        self.numbers = deque(maxlen=COMBAT_NUMBER_LIMIT)  # (spawn tick, x, y, style, digits), oldest first
+        self.atlas, self.glyphs, self.heights = self._build_atlas()
+
+    def _build_atlas(self):
+        """Render every digit of every style and fade step into one surface
+
+        Returns the atlas, the source rects of each digit keyed by (style, fade step),
+        and the glyph height of each style.
+        """
+        rows = []
+        for style, (color, size) in COMBAT_NUMBER_STYLES.items():
+            font = pygame.font.Font(None, size)
+            digits = []
+            for digit in DIGITS:
+                text = font.render(digit, True, color)
+                shadow = font.render(digit, True, BLACK)
+                # Drop shadow keeps numbers readable over bright terrain
+                glyph = pygame.Surface((text.get_width() + 1, text.get_height() + 1), pygame.SRCALPHA)
+                glyph.blit(shadow, (1, 1))
+                glyph.blit(text, (0, 0))
+                digits.append(glyph)
+            for fade in range(COMBAT_NUMBER_FADE_STEPS):
+                rows.append((style, fade, digits))
+
+        width = max(sum(glyph.get_width() for glyph in digits) for _, _, digits in rows)
+        height = sum(digits[0].get_height() for _, _, digits in rows)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        glyphs = {}
+        heights = {}
+        y = 0
+        for style, fade, digits in rows:
+            alpha = 255 * (COMBAT_NUMBER_FADE_STEPS - fade) // COMBAT_NUMBER_FADE_STEPS
+            x = 0
+            rects = []
+            for glyph in digits:
+                faded = glyph.copy()
+                faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                atlas.blit(faded, (x, y))
+                rects.append(pygame.Rect(x, y, glyph.get_width(), glyph.get_height()))
+                x += glyph.get_width()
+            glyphs[(style, fade)] = rects
+            heights[style] = digits[0].get_height()
+            y += digits[0].get_height()
+        return atlas, glyphs, heights
+
+    def add(self, position, amount, style="hit"):
+        """Pop up a number centered above a screen position"""
+        digits = tuple(DIGITS.index(digit) for digit in str(max(1, int(round(amount)))))
+        rects = self.glyphs[(style, 0)]
+        width = sum(rects[digit].width for digit in digits)
+        x = position[0] - width // 2 + random.randint(-COMBAT_NUMBER_SPREAD, COMBAT_NUMBER_SPREAD)
+        y = position[1] - self.heights[style]
+        self.numbers.append((self.clock.tick, x, y, style, digits))
+
+    def clear(self):
+        self.numbers.clear()
+
+    def update(self):
+        """Drop numbers that have finished floating"""
+        expired = self.clock.tick - COMBAT_NUMBER_LIFETIME
+        while self.numbers and self.numbers[0][0] <= expired:
+            self.numbers.popleft()
+
+    def draw(self, screen):
+        """Draw every number in one batched blit from the atlas"""
+        if not self.numbers:
+            return
+        tick = self.clock.tick
+        atlas = self.atlas
+        blits = []
+        for spawn_tick, x, y, style, digits in self.numbers:
+            age = tick - spawn_tick
+            rects = self.glyphs[(style, min(age * COMBAT_NUMBER_FADE_STEPS // COMBAT_NUMBER_LIFETIME,
+                                            COMBAT_NUMBER_FADE_STEPS - 1))]
+            y -= age * COMBAT_NUMBER_RISE
+            for digit in digits:
+                blits.append((atlas, (x, y), rects[digit]))
+                x += rects[digit].width
+        screen.blits(blits, doreturn=False)
+
+    def get_dirty_rects(self):
+        """Get the screen regions covered by numbers"""
+        tick = self.clock.tick
+        rects = []
+        for spawn_tick, x, y, style, digits in self.numbers:
+            glyphs = self.glyphs[(style, 0)]
+            width = sum(glyphs[digit].width for digit in digits)
+            rects.append(pygame.Rect(x, y - (tick - spawn_tick) * COMBAT_NUMBER_RISE,
+                                     width, self.heights[style]))
+        return rects
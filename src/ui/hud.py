@@ -11,7 +11,11 @@ class HUD:
         self.stats_panel_height = 120
         self.stats_panel_padding = 10
         
+        # Regions drawn last frame (used by the dirty-rect renderer)
+        self.dirty_rects = []
+        
     def draw(self, screen, player, score, current_round, round_timer):
+        self.dirty_rects = []
         self._draw_stats_panel(screen, player)
         self._draw_round_info(screen, score, current_round, round_timer)
         
@@ -25,6 +29,7 @@ class HUD:
         )
         pygame.draw.rect(screen, UI_COLORS["PANEL"], panel_rect)
         pygame.draw.rect(screen, UI_COLORS["BORDER"], panel_rect, 2)
+        self.dirty_rects.append(panel_rect)
         
         # Draw health bar
         health_rect = pygame.Rect(
@@ -76,7 +81,7 @@ class HUD:
         round_rect = round_text.get_rect(
             midtop=(SCREEN_WIDTH // 2, 10)
         )
-        screen.blit(round_text, round_rect)
+        self.dirty_rects.append(screen.blit(round_text, round_rect))
         
         # Draw timer below round number
         timer_text = self.font.render(
@@ -87,7 +92,7 @@ class HUD:
         timer_rect = timer_text.get_rect(
             midtop=(SCREEN_WIDTH // 2, round_rect.bottom + 5)
         )
-        screen.blit(timer_text, timer_rect)
+        self.dirty_rects.append(screen.blit(timer_text, timer_rect))
         
         # Draw score in top right
         score_text = self.font.render(
@@ -98,4 +103,4 @@ class HUD:
         score_rect = score_text.get_rect(
             topright=(SCREEN_WIDTH - 10, 10)
         )
-        screen.blit(score_text, score_rect) 
\ No newline at end of file
+        self.dirty_rects.append(screen.blit(score_text, score_rect))
\ No newline at end of file
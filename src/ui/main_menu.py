@@ -203,11 +203,15 @@ class MainMenu:
             resolution = self.settings_manager.get_setting("graphics", "resolution")
             fullscreen = self.settings_manager.get_setting("graphics", "fullscreen")
             vsync = self.settings_manager.get_setting("graphics", "vsync")
+            fps_limit = self.settings_manager.get_setting("graphics", "fps_limit")
+            dirty_rects = self.settings_manager.get_setting("graphics", "dirty_rects")
             effects = self.settings_manager.get_setting("graphics", "effects_quality")
             values = [
                 f"{resolution[0]}x{resolution[1]}",
                 "On" if fullscreen else "Off",
                 "On" if vsync else "Off",
+                str(fps_limit) if fps_limit else "Uncapped",
+                "On" if dirty_rects else "Off",
                 effects,
                 ""  # Back button has no value
             ]
@@ -344,6 +348,16 @@ class MainMenu:
                 current = self.settings_manager.get_setting("graphics", "vsync")
                 self.settings_manager.set_setting("graphics", "vsync", not current)
                 
+            elif setting == "FPS Limit":
+                current = self.settings_manager.get_setting("graphics", "fps_limit")
+                current_idx = FPS_LIMIT_OPTIONS.index(current) if current in FPS_LIMIT_OPTIONS else -1
+                next_limit = FPS_LIMIT_OPTIONS[(current_idx + 1) % len(FPS_LIMIT_OPTIONS)]
+                self.settings_manager.set_setting("graphics", "fps_limit", next_limit)
+                
+            elif setting == "Dirty Rects":
+                current = self.settings_manager.get_setting("graphics", "dirty_rects")
+                self.settings_manager.set_setting("graphics", "dirty_rects", not current)
+                
             elif setting == "Effects Quality":
                 qualities = ["Low", "Medium", "High", "Ultra"]
                 current = self.settings_manager.get_setting("graphics", "effects_quality")